@@ -1,5 +1,12 @@
 from django.contrib import admin
-from .models import Users
+from .models import Users, AvatarIngestion
 
 # Register your models here.
-admin.site.register(Users)
\ No newline at end of file
+admin.site.register(Users)
+
+
+@admin.register(AvatarIngestion)
+class AvatarIngestionAdmin(admin.ModelAdmin):
+    list_display = ['user', 'status', 'attempts', 'next_attempt_at', 'completed_at']
+    list_filter = ['status']
+    readonly_fields = ['last_error']
@@ -0,0 +1,193 @@
+import ipaddress
+import socket
+from io import BytesIO
+from urllib.parse import urljoin, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+from utils.work_queue import WorkQueue
+from .models import AvatarIngestion, Users
+
+"""
+Social login avatars, fetched off the request path.
+
+social_login only records the provider URL; the ingest_avatars worker
+streams the download under AVATAR_MAX_BYTES, decodes it under
+AVATAR_MAX_PIXELS, and stores a square JPEG of AVATAR_SIZE pixels.
+"""
+MAX_REDIRECTS = 3
+
+queue = WorkQueue(AvatarIngestion, claimed_status='processing', settings_prefix='AVATAR', select_related=('user',))
+
+
+class AvatarRejected(Exception):
+    """The source can never produce a usable avatar; do not retry"""
+
+
+def enqueue_avatar(user, source_url):
+    """Queue (or re-queue) the provider avatar for a user without an image"""
+    if urlparse(source_url or '').scheme not in ('http', 'https'):
+        return None
+
+    job, _ = AvatarIngestion.objects.update_or_create(
+        user=user,
+        defaults={
+            'source_url': source_url,
+            'status': 'pending',
+            'attempts': 0,
+            'next_attempt_at': timezone.now(),
+            'claimed_at': None,
+            'last_error': None,
+        }
+    )
+    return job
+
+
+class PinnedAddressAdapter(HTTPAdapter):
+    """
+    Connect to an address that was already validated instead of resolving the host again.
+
+    Without this, DNS could answer the check with a public address and the
+    connection with an internal one. The URL's hostname is still used for
+    the Host header, SNI and certificate verification.
+    """
+
+    def __init__(self, address, **kwargs):
+        self.address = address
+        super().__init__(**kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if host_params['scheme'] == 'https':
+            pool_kwargs['server_hostname'] = host_params['host']
+            pool_kwargs['assert_hostname'] = host_params['host']
+        host_params['host'] = self.address
+        return host_params, pool_kwargs
+
+
+def _check_host(url):
+    """
+    Only fetch from public addresses; the URL comes from the client.
+
+    Returns the address to connect to, so the fetch uses exactly what was checked.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        raise AvatarRejected(f"Unsupported avatar URL: {url}")
+    try:
+        addresses = socket.getaddrinfo(parsed.hostname, parsed.port or 443, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise AvatarRejected(f"Cannot resolve {parsed.hostname}") from e
+    for *_, sockaddr in addresses:
+        if not ipaddress.ip_address(sockaddr[0]).is_global:
+            raise AvatarRejected(f"{parsed.hostname} is not a public address")
+    return addresses[0][4][0]
+
+
+def download(url):
+    """Stream the image, giving up as soon as it exceeds AVATAR_MAX_BYTES"""
+    timeout = (settings.AVATAR_CONNECT_TIMEOUT_SECONDS, settings.AVATAR_READ_TIMEOUT_SECONDS)
+
+    with requests.Session() as session:
+        """A proxy would resolve the host itself"""
+        session.trust_env = False
+        for _ in range(MAX_REDIRECTS + 1):
+            adapter = PinnedAddressAdapter(_check_host(url))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            response = session.get(
+                url,
+                stream=True,
+                timeout=timeout,
+                allow_redirects=False,
+                headers={'Host': urlparse(url).netloc.rpartition('@')[2]}
+            )
+            if response.is_redirect:
+                url = urljoin(url, response.headers['Location'])
+                response.close()
+                adapter.close()
+                continue
+            break
+        else:
+            raise AvatarRejected("Too many redirects")
+
+        with response:
+            if 400 <= response.status_code < 500:
+                raise AvatarRejected(f"Provider returned {response.status_code}")
+            response.raise_for_status()
+
+            content_type = response.headers.get('Content-Type', '')
+            if not content_type.startswith('image/'):
+                raise AvatarRejected(f"Not an image: {content_type or 'no content type'}")
+
+            declared = response.headers.get('Content-Length')
+            if declared and declared.isdigit() and int(declared) > settings.AVATAR_MAX_BYTES:
+                raise AvatarRejected(f"Avatar is {declared} bytes")
+
+            buffer = BytesIO()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer.write(chunk)
+                if buffer.tell() > settings.AVATAR_MAX_BYTES:
+                    raise AvatarRejected(f"Avatar exceeds {settings.AVATAR_MAX_BYTES} bytes")
+
+    buffer.seek(0)
+    return buffer
+
+
+def resize(source):
+    """Square-crop and scale to AVATAR_SIZE, re-encoded as JPEG"""
+    size = settings.AVATAR_SIZE
+    try:
+        image = Image.open(source)
+        """Dimensions are read from the header; refuse decompression bombs before decoding"""
+        if image.width * image.height > settings.AVATAR_MAX_PIXELS:
+            raise AvatarRejected(f"Avatar is {image.width}x{image.height}")
+        """JPEG can decode at a reduced scale directly"""
+        image.draft('RGB', (size, size))
+        image = ImageOps.exif_transpose(image)
+        image = ImageOps.fit(image.convert('RGB'), (size, size), Image.Resampling.LANCZOS)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise AvatarRejected(f"Unreadable image: {e}") from e
+
+    output = BytesIO()
+    image.save(output, format='JPEG', quality=85, optimize=True)
+    return output.getvalue()
+
+
+def ingest(job):
+    """Download, resize and attach one avatar"""
+    user = job.user
+    if not user.image:
+        data = resize(download(job.source_url))
+        user.image.save(f"{user.id}_avatar.jpg", ContentFile(data), save=False)
+        """Only touch the image column, so a concurrent profile update is not overwritten"""
+        if not Users.objects.filter(id=user.id, image__in=['', None]).update(image=user.image.name):
+            user.image.storage.delete(user.image.name)
+
+    AvatarIngestion.objects.filter(id=job.id).update(
+        status='done',
+        attempts=job.attempts + 1,
+        completed_at=timezone.now(),
+        claimed_at=None,
+        last_error=None,
+    )
+
+
+def process_batch(batch_size=20):
+    """
+    Ingest one batch of due avatars.
+
+    Returns a (done, failed) tuple; failed includes those rescheduled.
+    """
+    done = failed = 0
+    for job in queue.claim_batch(batch_size):
+        try:
+            ingest(job)
+            done += 1
+        except Exception as e:
+            queue.record_failure(job, e, permanent=isinstance(e, AvatarRejected))
+            failed += 1
+    return done, failed
@@ -0,0 +1,33 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from authentication.avatars import process_batch
+from authentication.models import AvatarIngestion
+
+
+class Command(BaseCommand):
+    help = "Download and resize queued social login avatars"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=20, help="Avatars claimed per batch")
+        parser.add_argument('--loop', action='store_true', help="Keep draining the queue until interrupted")
+        parser.add_argument('--interval', type=float, default=2.0, help="Seconds to sleep when the queue is empty")
+        parser.add_argument('--stats', action='store_true', help="Print avatar counts by status, then exit")
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            for row in AvatarIngestion.objects.values('status').annotate(count=Count('id')).order_by('status'):
+                self.stdout.write(f"{row['status']}: {row['count']}")
+            return
+
+        while True:
+            done, failed = process_batch(options['batch_size'])
+            if done or failed:
+                self.stdout.write(f"Ingested {done}, failed {failed}")
+
+            if not options['loop']:
+                break
+
+            """Only sleep once the due queue is drained"""
+            if done + failed < options['batch_size']:
+                time.sleep(options['interval'])
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('authentication', '0007_users_inspection_notification_frequency'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='users',
+            index=models.Index(fields=['-created_at', '-id'], name='users_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='users',
+            index=models.Index(fields=['role', '-created_at'], name='users_role_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='users',
+            index=models.Index(fields=['is_active', '-created_at'], name='users_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='users',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='users_email_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='users',
+            index=models.Index(django.db.models.functions.text.Upper('full_name'), name='users_full_name_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:38
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_users_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvatarIngestion',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('source_url', models.URLField(max_length=2048)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='avatar_ingestion', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Avatar Ingestion',
+                'verbose_name_plural': 'Avatar Ingestions',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='authenticat_status_f07d47_idx')],
+            },
+        ),
+    ]
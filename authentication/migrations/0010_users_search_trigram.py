@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:48
+
+from django.db import migrations
+
+"""
+icontains compiles to UPPER("col"::text) LIKE UPPER('%term%') on PostgreSQL;
+trigram GIN indexes on that exact expression serve it. Other databases
+(SQLite in development) have no equivalent and scan.
+"""
+TRIGRAM_INDEXES = {
+    'users_email_trgm_idx': 'email',
+    'users_full_name_trgm_idx': 'full_name',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON authentication_users '
+            f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0009_avatar_ingestion'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='users',
+            name='users_email_upper_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='users',
+            name='users_full_name_upper_idx',
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.db.models import Count, Q
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.utils import timezone
 from datetime import timedelta
@@ -23,6 +24,12 @@ class Users(AbstractUser):
         ('buyer', 'Buyer'),
         ('admin', 'Admin'),
     ]
+
+    NOTIFICATION_FREQUENCY_CHOICES = [
+        ('immediate', 'Immediate'),
+        ('hourly', 'Hourly digest'),
+        ('daily', 'Daily digest'),
+    ]
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     username = models.CharField(max_length=150, blank=True, null=True)
@@ -32,6 +39,11 @@ class Users(AbstractUser):
     phone = models.CharField(max_length=255, blank=True, null=True)
     is_agent = models.BooleanField(default=False)
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='buyer')
+    inspection_notification_frequency = models.CharField(
+        max_length=20,
+        choices=NOTIFICATION_FREQUENCY_CHOICES,
+        default='immediate'
+    )
     
     otp = models.CharField(max_length=6, blank=True, null=True)
     otp_expired = models.DateTimeField(blank=True, null=True)
@@ -44,16 +56,91 @@ class Users(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    STATISTICS_CACHE_KEY = 'user_list_statistics'
+
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='users_created_id_idx'),
+            models.Index(fields=['role', '-created_at'], name='users_role_created_idx'),
+            models.Index(fields=['is_active', '-created_at'], name='users_active_created_idx'),
+        ]
 
     def __str__(self):
         return self.email
+
+    @classmethod
+    def list_statistics(cls):
+        """Admin user counts in one aggregate query, cached for USER_STATISTICS_CACHE_SECONDS"""
+        from django.conf import settings
+        from django.core.cache import cache
+        data = cache.get(cls.STATISTICS_CACHE_KEY)
+        if data is None:
+            data = cls.objects.aggregate(
+                total_users=Count('id'),
+                total_active_users=Count('id', filter=Q(is_active=True)),
+                total_inactive_users=Count('id', filter=Q(is_active=False)),
+                **{
+                    f'total_{role}s': Count('id', filter=Q(role=role))
+                    for role, _ in cls.ROLE_CHOICES
+                }
+            )
+            cache.set(cls.STATISTICS_CACHE_KEY, data, timeout=settings.USER_STATISTICS_CACHE_SECONDS)
+        return data
     
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """
+        Load every deferred field on first access, not one query per field.
+
+        Authenticated users are built from a cached snapshot with the other
+        fields deferred (see utils.authentication.CachedJWTAuthentication).
+        """
+        if fields is not None:
+            fields = set(fields)
+            deferred_fields = self.get_deferred_fields()
+            if fields.intersection(deferred_fields):
+                fields = fields.union(deferred_fields)
+        super().refresh_from_db(using, fields, **kwargs)
+
     def save(self, *args, **kwargs):
         if self.otp:
             self.otp_expired = timezone.now() + timedelta(minutes=5)
         super().save(*args, **kwargs)
 
 
+
+
+class AvatarIngestion(models.Model):
+    """Social login avatar waiting to be downloaded and resized by the ingest_avatars worker"""
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.OneToOneField(Users, on_delete=models.CASCADE, related_name='avatar_ingestion')
+    source_url = models.URLField(max_length=2048)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Avatar Ingestion'
+        verbose_name_plural = 'Avatar Ingestions'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} <- {self.source_url} ({self.status})"
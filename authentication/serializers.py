@@ -73,20 +73,24 @@ class ChangePasswordSerializer(serializers.Serializer):
 class UserProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Users
-        fields = ['id', 'full_name', 'email', 'phone', 'image', 'is_agent', 'role', 'created_at']
+        fields = ['id', 'full_name', 'email', 'phone', 'image', 'is_agent', 'role', 'inspection_notification_frequency', 'created_at']
         read_only_fields = ['id', 'email', 'role', 'created_at']
 
 
 class UpdateProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Users
-        fields = ['full_name', 'image', 'phone', 'is_agent']
+        fields = ['full_name', 'image', 'phone', 'is_agent', 'inspection_notification_frequency']
 
     def update(self, instance, validated_data):
         """Update fields"""
         instance.full_name = validated_data.get('full_name', instance.full_name)
         instance.phone = validated_data.get('phone', instance.phone)
         instance.is_agent = validated_data.get('is_agent', instance.is_agent)
+        instance.inspection_notification_frequency = validated_data.get(
+            'inspection_notification_frequency',
+            instance.inspection_notification_frequency
+        )
 
         """Handle image update"""
         new_image = validated_data.get('image', None)
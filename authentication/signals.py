@@ -0,0 +1,20 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from utils.authentication import invalidate_user_snapshot
+from .models import Users
+
+
+@receiver(post_save, sender=Users)
+@receiver(post_delete, sender=Users)
+def invalidate_snapshot(sender, instance, **kwargs):
+    """Role and status changes, including suspensions, apply on the next request"""
+    invalidate_user_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=Users)
+@receiver(post_delete, sender=Users)
+def invalidate_statistics(sender, instance, created=True, **kwargs):
+    """New and deleted users; status changes invalidate in ChangeUserStatus"""
+    if created:
+        cache.delete(Users.STATISTICS_CACHE_KEY)
@@ -1,20 +1,26 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.core.mail import send_mail
 from django.conf import settings
 from django.core.cache import cache
+from django.db.models import Q
+from rest_framework.pagination import CursorPagination
 from .models import Users
 from .serializers import *
 from utils.tokens import get_tokens_for_user
 from utils.permissions import IsAdmin
+from utils.authentication import invalidate_user_snapshot
+from utils.throttling import scoped_throttles
+from notifications.outbox import enqueue_email
+from .avatars import enqueue_avatar
 import random
 from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes(scoped_throttles('registration'))
 def registration(request):
     """Step 1: Register user and send OTP"""
     serializer = RegistrationSerializer(data=request.data)
@@ -32,13 +38,8 @@ def registration(request):
         subject = 'Email Verification - OTP'
         message = f'Your OTP for registration is: {otp}\n\nThis OTP is valid for 5 minutes.'
         
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=False,
-        )
+        """Queued for the outbox worker so the response never waits on SMTP"""
+        enqueue_email(subject, message, [email], from_email=settings.DEFAULT_FROM_EMAIL)
         
         cache.set(f'registration_{email}', {
             'otp': otp,
@@ -61,6 +62,7 @@ def registration(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes(scoped_throttles('verify_otp'))
 def verify_registration_otp(request):
     """Step 2: Verify OTP for both registration and password reset"""
     serializer = VerifyOTPSerializer(data=request.data)
@@ -120,6 +122,7 @@ def verify_registration_otp(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes(scoped_throttles('login'))
 def login(request):
     """Login user"""
     serializer = LoginSerializer(data=request.data)
@@ -143,6 +146,7 @@ def login(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes(scoped_throttles('forgot_password'))
 def forgot_password(request):
     """Send OTP for password reset"""
     serializer = ForgotPasswordSerializer(data=request.data)
@@ -160,13 +164,8 @@ def forgot_password(request):
         subject = 'Password Reset - OTP'
         message = f'Your OTP for password reset is: {otp}\n\nThis OTP is valid for 5 minutes.'
         
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
-            fail_silently=False,
-        )
+        """Queued for the outbox worker so the response never waits on SMTP"""
+        enqueue_email(subject, message, [email], from_email=settings.DEFAULT_FROM_EMAIL)
         
         cache.set(f'password_reset_{email}', otp, timeout=300)
         
@@ -286,28 +285,60 @@ def update_profile(request):
     }, status=status.HTTP_200_OK)
 
 
+class UserListPagination(CursorPagination):
+    """
+    Cursor pages, newest first.
+
+    DRF positions the cursor on created_at alone; -id only fixes the order
+    within equal timestamps. Users that share the boundary timestamp are
+    stepped over with an offset, so a run of identical timestamps is
+    re-read on every page through it, and a user inserted with that exact
+    timestamp between fetches can be skipped or repeated. created_at has
+    microsecond precision, so such runs are rare.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
 @api_view(['GET'])
 @permission_classes([IsAdmin])
 def user_list(request):
-    """Get all users (Admin only)"""
-    users = Users.objects.all().order_by('-created_at')
-
-    total_users = users.count()
-    total_active_users = users.filter(is_active=True).count()
-    total_inactive_users = users.filter(is_active=False).count()
+    """Get users (Admin only), filtered by ?role=, ?is_active= and ?search= (email or name)"""
+    users = Users.objects.only(*UserListSerializer.Meta.fields)
 
-    serializer = UserListSerializer(users, many=True)
+    role = request.GET.get('role')
+    if role:
+        if role not in dict(Users.ROLE_CHOICES):
+            return Response({
+                'success': False,
+                'message': f"Invalid role. Choose from: {', '.join(dict(Users.ROLE_CHOICES))}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        users = users.filter(role=role)
+
+    is_active = request.GET.get('is_active')
+    if is_active in ('true', 'false'):
+        users = users.filter(is_active=is_active == 'true')
+
+    search = request.GET.get('search', '').strip()
+    if search:
+        """Case-insensitive substring; trigram-indexed on PostgreSQL (migration 0010)"""
+        users = users.filter(
+            Q(email__icontains=search) |
+            Q(full_name__icontains=search)
+        )
 
+    paginator = UserListPagination()
+    page = paginator.paginate_queryset(users, request)
+    serializer = UserListSerializer(page, many=True)
 
-    
     return Response({
         'success': True,
         'messgae': "Users retrieved successfully",
-        'statistics': {
-            'total_users': total_users,
-            'total_active_users': total_active_users,
-            'total_inactive_users': total_inactive_users
-        },
+        'statistics': Users.list_statistics(),
+        'next': paginator.get_next_link(),
+        'previous': paginator.get_previous_link(),
         'users': serializer.data
     }, status=status.HTTP_200_OK)
 
@@ -324,6 +355,9 @@ def ChangeUserStatus(request, user_id):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     serializer.save()
+    """The post_save signal does this too; be explicit so a suspension is never served from cache"""
+    invalidate_user_snapshot(user.id)
+    cache.delete(Users.STATISTICS_CACHE_KEY)
     return Response({
         'success': True,
         'message': 'User suspended successfully',
@@ -351,59 +385,34 @@ def social_login(request):
             }
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    """Get or create user"""
+    """Get or create user; auth_provider is validated but not stored"""
     user, created = Users.objects.get_or_create(
         email=email,
         defaults={
             'username': email,
             'full_name': full_name,
-            'auth_provider': auth_provider,
         }
     )
 
     """If user already exists, update fields if needed"""
-    if not created:
+    if not created and user.full_name != full_name:
         user.full_name = full_name
-        user.auth_provider = auth_provider
-        user.save()
+        user.save(update_fields=['full_name', 'updated_at'])
 
-    """Handle image URL - download and save if provided"""
-    if image_url and (created or not user.image):
-        try:
-            import requests
-            from django.core.files.base import ContentFile
-            from urllib.parse import urlparse
-            import os
-
-            response = requests.get(image_url, timeout=10)
-            if response.status_code == 200:
-                """Extract filename from URL or generate one"""
-                parsed_url = urlparse(image_url)
-                filename = os.path.basename(parsed_url.path) or f"{user.id}_profile.jpg"
-                
-                user.image.save(
-                    filename,
-                    ContentFile(response.content),
-                    save=True
-                )
-        except Exception as e:
-            print(f"Error downloading image: {e}")
-            """Continue without image - don't fail the signup"""
+    """Provider avatar is fetched by the ingest_avatars worker; respond with a placeholder meanwhile"""
+    avatar_pending = False
+    if image_url and not user.image:
+        avatar_pending = enqueue_avatar(user, image_url) is not None
 
     """Generate tokens"""
-    refresh = RefreshToken.for_user(user)
-    access_token = refresh.access_token
-
-    token = {
-        'refresh': str(refresh),
-        'access': str(access_token),
-    }
+    token = get_tokens_for_user(user)
 
     user_details = {
         'id': user.id,
         'full_name': user.full_name,
         'email': user.email,
-        'image': user.image.url if user.image else None,
+        'image': user.image.url if user.image else ((settings.AVATAR_PLACEHOLDER_URL or image_url) if avatar_pending else None),
+        'image_pending': avatar_pending,
     }
 
     return Response({
@@ -65,6 +65,7 @@ INSTALLED_APPS = [
     'property',
     'payments',
     'sitesettings',
+    'notifications',
 ]
 
 MIDDLEWARE = [
@@ -76,6 +77,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'utils.replicas.ReplicaStickinessMiddleware',
 ]
 
 ROOT_URLCONF = 'michael_milne.urls'
@@ -108,17 +110,103 @@ DATABASES = {
     }
 }
 
+"""
+Read replicas for property listing reads (utils.replicas), as
+"path[:weight],..." e.g. DATABASE_REPLICAS="replica1.sqlite3:3,replica2.sqlite3:1".
+Locally, `manage.py sync_replicas` copies the primary into each file.
+"""
+DATABASE_REPLICA_WEIGHTS = {}
+for _index, _replica in enumerate(filter(None, os.getenv('DATABASE_REPLICAS', '').split(',')), start=1):
+    _path, _, _weight = _replica.strip().partition(':')
+    DATABASES[f'replica_{_index}'] = {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / _path,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICA_WEIGHTS[f'replica_{_index}'] = int(_weight or 1)
+
+DATABASE_ROUTERS = ['utils.replicas.ReplicaRouter']
+REPLICA_READ_APPS = ['property']
+"""Reads go to the primary for this long after a user's own write; keep above replication lag"""
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', 15))
+"""A replica that failed is skipped for this long"""
+REPLICA_RETRY_SECONDS = int(os.getenv('REPLICA_RETRY_SECONDS', 30))
+
+"""
+Cache
+
+Shared by every worker: OTPs, pending registrations, user snapshots and
+entitlements must be visible to whichever worker serves the next request.
+CACHE_BACKEND is "database" (default, table created by migrations),
+"file" (workers on a single host) or "redis" (REDIS_URL, needs the redis
+package; connections are pooled per process).
+"""
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'database')
+CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'michael_milne')
+CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300))
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 100000))
+
+if CACHE_BACKEND == 'redis':
+    _cache = {
+        'BACKEND': 'utils.cache.InstrumentedRedisCache',
+        'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/0'),
+        'OPTIONS': {
+            'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', 50)),
+            'socket_connect_timeout': float(os.getenv('REDIS_CONNECT_TIMEOUT_SECONDS', 1)),
+            'socket_timeout': float(os.getenv('REDIS_SOCKET_TIMEOUT_SECONDS', 1)),
+            'health_check_interval': 30,
+        },
+    }
+elif CACHE_BACKEND == 'file':
+    _cache = {
+        'BACKEND': 'utils.cache.InstrumentedFileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+    }
+else:
+    _cache = {
+        'BACKEND': 'utils.cache.InstrumentedDatabaseCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', 'django_cache'),
+        'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+    }
+
+CACHES = {
+    'default': {
+        **_cache,
+        'KEY_PREFIX': CACHE_KEY_PREFIX,
+        'TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+    }
+}
+
 """User Permission"""
 AUTH_USER_MODEL = 'authentication.Users'
+"""Cached id/role/status snapshot behind JWT authentication; dropped whenever the user is saved"""
+USER_SNAPSHOT_CACHE_SECONDS = int(os.getenv('USER_SNAPSHOT_CACHE_SECONDS', 300))
+"""Admin user list statistics; dropped when users are created, deleted or suspended"""
+USER_STATISTICS_CACHE_SECONDS = int(os.getenv('USER_STATISTICS_CACHE_SECONDS', 300))
 
 """JWT """
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'utils.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 10
+    'PAGE_SIZE': 10,
+    # Reverse proxies in front of the app. 0 uses REMOTE_ADDR; set the exact count behind a proxy,
+    # since anything else lets clients pick their own X-Forwarded-For and dodge per-IP throttles
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 0)),
+    # Sliding-window limits for the auth endpoints (utils.throttling), per client IP and per email
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.getenv('THROTTLE_LOGIN_IP', '30/m'),
+        'login_email': os.getenv('THROTTLE_LOGIN_EMAIL', '10/15m'),
+        'registration_ip': os.getenv('THROTTLE_REGISTRATION_IP', '10/h'),
+        'registration_email': os.getenv('THROTTLE_REGISTRATION_EMAIL', '3/h'),
+        'verify_otp_ip': os.getenv('THROTTLE_VERIFY_OTP_IP', '30/m'),
+        'verify_otp_email': os.getenv('THROTTLE_VERIFY_OTP_EMAIL', '5/15m'),
+        'forgot_password_ip': os.getenv('THROTTLE_FORGOT_PASSWORD_IP', '10/h'),
+        'forgot_password_email': os.getenv('THROTTLE_FORGOT_PASSWORD_EMAIL', '3/h'),
+    },
 }
 
 SIMPLE_JWT = {
@@ -200,14 +288,80 @@ EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS") == "True"
 EMAIL_USE_SSL = os.getenv("EMAIL_USE_SSL") == "True"
 
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
+ADMIN_EMAIL = os.getenv("ADMIN_EMAIL")
+
+"""EMAIL OUTBOX"""
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 8))
+OUTBOX_BACKOFF_BASE_SECONDS = int(os.getenv("OUTBOX_BACKOFF_BASE_SECONDS", 30))
+OUTBOX_BACKOFF_MAX_SECONDS = int(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", 3600))
+OUTBOX_CLAIM_TIMEOUT_SECONDS = int(os.getenv("OUTBOX_CLAIM_TIMEOUT_SECONDS", 600))
 
 
 """STRIPE KEYS"""
 STRIPE_SECRET_KEY = os.getenv('STRIPE_SECRET_KEY')
 STRIPE_PUBLISHABLE_KEY = os.getenv('STRIPE_PUBLISHABLE_KEY')
 STRIPE_WEBHOOK_SECRET = os.getenv('STRIPE_WEBHOOK_SECRET')
+"""Point at the fake_stripe server for local load tests, e.g. http://127.0.0.1:12111"""
+STRIPE_API_BASE = os.getenv('STRIPE_API_BASE')
+
+"""Stripe Gateway"""
+STRIPE_TIMEOUT_SECONDS = float(os.getenv('STRIPE_TIMEOUT_SECONDS', 5))
+STRIPE_MAX_RETRIES = int(os.getenv('STRIPE_MAX_RETRIES', 2))
+STRIPE_RETRY_BACKOFF_BASE_SECONDS = float(os.getenv('STRIPE_RETRY_BACKOFF_BASE_SECONDS', 0.2))
+STRIPE_RETRY_BACKOFF_MAX_SECONDS = float(os.getenv('STRIPE_RETRY_BACKOFF_MAX_SECONDS', 2))
+STRIPE_BREAKER_WINDOW_SECONDS = int(os.getenv('STRIPE_BREAKER_WINDOW_SECONDS', 30))
+STRIPE_BREAKER_MIN_REQUESTS = int(os.getenv('STRIPE_BREAKER_MIN_REQUESTS', 10))
+STRIPE_BREAKER_ERROR_RATE = float(os.getenv('STRIPE_BREAKER_ERROR_RATE', 0.5))
+STRIPE_BREAKER_COOLDOWN_SECONDS = int(os.getenv('STRIPE_BREAKER_COOLDOWN_SECONDS', 30))
+
+"""Stripe Checkout"""
+CHECKOUT_SESSION_TTL_MINUTES = int(os.getenv('CHECKOUT_SESSION_TTL_MINUTES', 60))
+CHECKOUT_SESSION_REUSE_MARGIN_MINUTES = int(os.getenv('CHECKOUT_SESSION_REUSE_MARGIN_MINUTES', 5))
+CART_MAX_ITEMS = int(os.getenv('CART_MAX_ITEMS', 20))
+
+"""Payment Confirmation"""
+"""Each long-polling status request holds a sync worker for up to this long"""
+PAYMENT_STATUS_MAX_WAIT_SECONDS = float(os.getenv('PAYMENT_STATUS_MAX_WAIT_SECONDS', 2))
+PAYMENT_STATUS_POLL_INTERVAL_SECONDS = float(os.getenv('PAYMENT_STATUS_POLL_INTERVAL_SECONDS', 0.25))
+PAYMENT_CONFIRM_STRIPE_TIMEOUT_SECONDS = float(os.getenv('PAYMENT_CONFIRM_STRIPE_TIMEOUT_SECONDS', 2))
+PAYMENT_CONFIRM_FALLBACK_AFTER_SECONDS = float(os.getenv('PAYMENT_CONFIRM_FALLBACK_AFTER_SECONDS', 3))
+PAYMENT_CONFIRM_FALLBACK_INTERVAL_SECONDS = int(os.getenv('PAYMENT_CONFIRM_FALLBACK_INTERVAL_SECONDS', 5))
+
+"""Unlock Sweeper"""
+PENDING_UNLOCK_STALE_HOURS = int(os.getenv('PENDING_UNLOCK_STALE_HOURS', 24))
+UNLOCK_ARCHIVE_AFTER_DAYS = int(os.getenv('UNLOCK_ARCHIVE_AFTER_DAYS', 90))
+
+"""Stripe Webhook Inbox"""
+WEBHOOK_INBOX_MAX_ATTEMPTS = int(os.getenv('WEBHOOK_INBOX_MAX_ATTEMPTS', 10))
+WEBHOOK_INBOX_BACKOFF_BASE_SECONDS = int(os.getenv('WEBHOOK_INBOX_BACKOFF_BASE_SECONDS', 10))
+WEBHOOK_INBOX_BACKOFF_MAX_SECONDS = int(os.getenv('WEBHOOK_INBOX_BACKOFF_MAX_SECONDS', 1800))
+WEBHOOK_INBOX_CLAIM_TIMEOUT_SECONDS = int(os.getenv('WEBHOOK_INBOX_CLAIM_TIMEOUT_SECONDS', 300))
+
+"""Unlocked property IDs per user; invalidated whenever an unlock succeeds or is refunded"""
+ENTITLEMENT_CACHE_SECONDS = int(os.getenv('ENTITLEMENT_CACHE_SECONDS', 86400))
+
+"""Social Login Avatars"""
+AVATAR_PLACEHOLDER_URL = os.getenv('AVATAR_PLACEHOLDER_URL')
+AVATAR_SIZE = int(os.getenv('AVATAR_SIZE', 256))
+AVATAR_MAX_BYTES = int(os.getenv('AVATAR_MAX_BYTES', 5 * 1024 * 1024))
+AVATAR_MAX_PIXELS = int(os.getenv('AVATAR_MAX_PIXELS', 25_000_000))
+AVATAR_CONNECT_TIMEOUT_SECONDS = float(os.getenv('AVATAR_CONNECT_TIMEOUT_SECONDS', 3))
+AVATAR_READ_TIMEOUT_SECONDS = float(os.getenv('AVATAR_READ_TIMEOUT_SECONDS', 10))
+AVATAR_MAX_ATTEMPTS = int(os.getenv('AVATAR_MAX_ATTEMPTS', 5))
+AVATAR_BACKOFF_BASE_SECONDS = int(os.getenv('AVATAR_BACKOFF_BASE_SECONDS', 30))
+AVATAR_BACKOFF_MAX_SECONDS = int(os.getenv('AVATAR_BACKOFF_MAX_SECONDS', 1800))
+AVATAR_CLAIM_TIMEOUT_SECONDS = int(os.getenv('AVATAR_CLAIM_TIMEOUT_SECONDS', 300))
 
 """ Frontend Base URL"""
 FRONTEND_BASE_URL = "https://homehelpgroup.com.au"
 
+"""Bookmark Sync"""
+BOOKMARK_SYNC_TOMBSTONE_DAYS = int(os.getenv('BOOKMARK_SYNC_TOMBSTONE_DAYS', 30))
+
+"""Owner Calendar Feed"""
+ICS_FEED_CACHE_SECONDS = int(os.getenv('ICS_FEED_CACHE_SECONDS', 3600))
+
+"""Owner Dashboard"""
+OWNER_DASHBOARD_CACHE_SECONDS = int(os.getenv('OWNER_DASHBOARD_CACHE_SECONDS', 60))
+
 
@@ -12,6 +12,8 @@ urlpatterns = [
     path('api/v1/', include('property.urls')),
     path('api/v1/payments/', include('payments.urls')),
     path('api/v1/site-settings/', include('sitesettings.urls')),
+    path('api/v1/notifications/', include('notifications.urls')),
+    path('api/v1/utils/', include('utils.urls')),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path('swagger.json', schema_view.without_ui(cache_timeout=0), name='schema-json'),
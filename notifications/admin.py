@@ -0,0 +1,11 @@
+from django.contrib import admin
+from .models import OutboundEmail
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'to', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'createdAt']
+    list_filter = ['status', 'createdAt']
+    search_fields = ['subject', 'to']
+    readonly_fields = ['id', 'claimed_at', 'sent_at', 'last_error', 'createdAt', 'updatedAt']
+    ordering = ['-createdAt']
@@ -0,0 +1,65 @@
+from itertools import groupby
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from property.models import Inspection
+from .outbox import enqueue_email
+from .rendering import render_email
+
+"""Pending bookings for owners on these preferences are collected by each run"""
+DIGEST_FREQUENCIES = {
+    'hourly': ['hourly', 'immediate'],
+    'daily': ['daily'],
+}
+
+
+def pending_inspections(frequency):
+    """All un-notified bookings for owners on the given digest, grouped by owner"""
+    return Inspection.objects.filter(
+        owner_notified_at__isnull=True,
+        property__owner__inspection_notification_frequency__in=DIGEST_FREQUENCIES[frequency]
+    ).select_related(
+        'user', 'property', 'property__owner'
+    ).order_by('property__owner_id', 'inspection_datetime')
+
+
+def send_inspection_digests(frequency):
+    """
+    Queue one summary email per owner for their pending inspection bookings.
+
+    The digests are written to the outbox and the bookings marked as notified
+    in one transaction; the outbox worker sends them over a shared connection.
+    Returns (owners, bookings) counts.
+    """
+    owners = bookings = 0
+
+    with transaction.atomic():
+        inspections = list(pending_inspections(frequency).select_for_update(of=('self',)))
+
+        for _, owner_inspections in groupby(inspections, key=lambda i: i.property.owner_id):
+            owner_inspections = list(owner_inspections)
+            owner = owner_inspections[0].property.owner
+            context = {
+                'owner': owner,
+                'inspections': owner_inspections,
+                'frequency': frequency,
+            }
+            subject = f"{len(owner_inspections)} new inspection booking(s)"
+
+            text_body, html_body = render_email('inspection_digest', context)
+
+            enqueue_email(
+                subject=subject,
+                body=text_body,
+                html_body=html_body,
+                from_email=settings.EMAIL_HOST_USER,
+                to=[owner.email],
+            )
+            owners += 1
+            bookings += len(owner_inspections)
+
+        Inspection.objects.filter(
+            id__in=[inspection.id for inspection in inspections]
+        ).update(owner_notified_at=timezone.now())
+
+    return owners, bookings
@@ -0,0 +1,69 @@
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from notifications.rendering import render_email
+
+
+def sample_contexts():
+    """Representative contexts for each notification template"""
+    now = timezone.now()
+    user = SimpleNamespace(full_name='Jane <Buyer>', email='jane@example.com')
+    owner = SimpleNamespace(full_name='Owner', email='owner@example.com')
+    inspections = [
+        SimpleNamespace(
+            user=user,
+            inspection_datetime=now + timedelta(hours=i),
+            property=SimpleNamespace(
+                propertyName=f'Property {i}',
+                propertyAddress=f'{i} Example Street'
+            ),
+        )
+        for i in range(20)
+    ]
+    return {
+        'inspection_request': {
+            'user_name': user.full_name,
+            'user_email': user.email,
+            'property_title': 'Property 1',
+            'property_address': '1 Example Street',
+            'inspection_time': now,
+        },
+        'quote_request': {
+            'user_full_name': user.full_name,
+            'email': user.email,
+            'text': 'Please quote for <b>three</b> properties.',
+        },
+        'inspection_digest': {
+            'owner': owner,
+            'inspections': inspections,
+            'frequency': 'daily',
+        },
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark notification template rendering cost per message"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+
+        for name, context in sample_contexts().items():
+            start = time.perf_counter()
+            render_email(name, context)
+            first = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                render_email(name, context)
+            per_message = (time.perf_counter() - start) / iterations
+
+            self.stdout.write(
+                f"{name}: first render {first * 1000:.2f} ms, "
+                f"cached {per_message * 1_000_000:.1f} us/message "
+                f"({iterations} iterations)"
+            )
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from notifications.digests import DIGEST_FREQUENCIES, send_inspection_digests
+
+
+class Command(BaseCommand):
+    help = "Queue inspection booking digests for owners on hourly or daily notifications"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--frequency', choices=list(DIGEST_FREQUENCIES), required=True)
+
+    def handle(self, *args, **options):
+        owners, bookings = send_inspection_digests(options['frequency'])
+        self.stdout.write(f"Queued {owners} digest(s) covering {bookings} booking(s)")
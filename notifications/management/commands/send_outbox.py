@@ -0,0 +1,31 @@
+import time
+from django.core.management.base import BaseCommand
+from notifications.outbox import send_batch, outbox_stats
+
+
+class Command(BaseCommand):
+    help = "Send queued emails from the notification outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help="Emails sent per SMTP connection")
+        parser.add_argument('--loop', action='store_true', help="Keep draining the outbox until interrupted")
+        parser.add_argument('--interval', type=float, default=5.0, help="Seconds to sleep when the outbox is empty")
+        parser.add_argument('--stats', action='store_true', help="Print queue depth and latency, then exit")
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            for key, value in outbox_stats().items():
+                self.stdout.write(f"{key}: {value}")
+            return
+
+        while True:
+            sent, failed = send_batch(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(f"Sent {sent}, failed {failed}")
+
+            if not options['loop']:
+                break
+
+            """Only sleep once the due queue is drained"""
+            if sent + failed < options['batch_size']:
+                time.sleep(options['interval'])
@@ -0,0 +1,121 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import Min
+from django.utils import timezone
+from utils.work_queue import WorkQueue
+from .models import OutboundEmail
+
+queue = WorkQueue(OutboundEmail, claimed_status='sending', settings_prefix='OUTBOX')
+
+
+def enqueue_email(subject, body, to, html_body=None, from_email=None, reply_to=None):
+    """
+    Queue an email for the send_outbox worker.
+
+    Call this inside the same transaction as the business change so the
+    email is only sent if that change commits.
+    """
+    recipients = [address for address in to if address]
+    if not recipients:
+        return None
+
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=body,
+        html_body=html_body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=recipients,
+        reply_to=[address for address in (reply_to or []) if address],
+    )
+
+
+def send_batch(batch_size=50):
+    """
+    Send one batch of due emails over a single SMTP connection.
+
+    Returns a (sent, failed) tuple.
+    """
+    emails = queue.claim_batch(batch_size)
+    if not emails:
+        return 0, 0
+
+    sent = failed = 0
+    connection = get_connection(fail_silently=False)
+
+    try:
+        connection.open()
+    except Exception as e:
+        for email in emails:
+            queue.record_failure(email, e)
+        return 0, len(emails)
+
+    try:
+        for email in emails:
+            message = EmailMultiAlternatives(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email,
+                to=email.to,
+                reply_to=email.reply_to or None,
+                connection=connection,
+            )
+            if email.html_body:
+                message.attach_alternative(email.html_body, "text/html")
+
+            try:
+                message.send(fail_silently=False)
+            except Exception as e:
+                queue.record_failure(email, e)
+                failed += 1
+                continue
+
+            OutboundEmail.objects.filter(id=email.id).update(
+                status='sent',
+                attempts=email.attempts + 1,
+                sent_at=timezone.now(),
+                claimed_at=None,
+                last_error=None,
+            )
+            sent += 1
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    return sent, failed
+
+
+def outbox_stats(window=timedelta(hours=1)):
+    """Queue depth and delivery latency for monitoring"""
+    now = timezone.now()
+
+    pending = OutboundEmail.objects.filter(status__in=['pending', 'sending'])
+    oldest = pending.aggregate(oldest=Min('createdAt'))['oldest']
+
+    latencies = sorted(
+        (sent_at - created_at).total_seconds()
+        for created_at, sent_at in OutboundEmail.objects.filter(
+            status='sent',
+            sent_at__gte=now - window
+        ).values_list('createdAt', 'sent_at')
+    )
+
+    def percentile(p):
+        if not latencies:
+            return None
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 3)
+
+    return {
+        'queue_depth': pending.count(),
+        'due_now': OutboundEmail.objects.filter(status='pending', next_attempt_at__lte=now).count(),
+        'failed': OutboundEmail.objects.filter(status='failed').count(),
+        'oldest_pending_age_seconds': round((now - oldest).total_seconds(), 3) if oldest else None,
+        'sent_last_window': len(latencies),
+        'latency_seconds': {
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'max': round(latencies[-1], 3) if latencies else None,
+        },
+    }
@@ -0,0 +1,40 @@
+from django.template import Context, Engine
+
+"""
+Dedicated template engine for notification emails.
+
+The cached loader compiles each template once per process, so bulk sends
+(digests, reminders) only pay the render cost per message.
+"""
+_engine = None
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = Engine(
+            loaders=[
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+            autoescape=True,
+        )
+    return _engine
+
+
+def render_email(name, context):
+    """
+    Render notifications/email/<name>.txt and .html from one context.
+
+    The HTML part is autoescaped; the plain-text part is not.
+    Returns a (text_body, html_body) tuple.
+    """
+    engine = get_engine()
+    text_body = engine.get_template(f'notifications/email/{name}.txt').render(
+        Context(context, autoescape=False)
+    )
+    html_body = engine.get_template(f'notifications/email/{name}.html').render(
+        Context(context)
+    )
+    return text_body, html_body
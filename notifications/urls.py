@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import OutboxStatsAPIView
+
+urlpatterns = [
+    path('outbox/stats/', OutboxStatsAPIView.as_view(), name='outbox-stats'),
+]
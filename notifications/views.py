@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from property.views import CustomResponseMixin
+from utils.permissions import IsAdmin
+from .outbox import outbox_stats
+
+
+class OutboxStatsAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Outbox queue depth and delivery latency (Admin only)
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        try:
+            return self.success_response(
+                message="Outbox statistics retrieved successfully",
+                data=outbox_stats(),
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while retrieving outbox statistics",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import SystemSettings, PropertyUnlock
+from .models import SystemSettings, PropertyUnlock, ArchivedPropertyUnlock, DailyRevenue, StripeWebhookEvent
 
 @admin.register(SystemSettings)
 class SystemSettingsAdmin(admin.ModelAdmin):
@@ -16,4 +16,34 @@ class PropertyUnlockAdmin(admin.ModelAdmin):
     list_display = ['user', 'property', 'amount_paid', 'payment_status', 'unlocked_at', 'createdAt']
     list_filter = ['payment_status', 'createdAt']
     search_fields = ['user__username', 'property__propertyName']
-    readonly_fields = ['stripe_checkout_session_id', 'stripe_payment_intent_id', 'createdAt', 'updatedAt']
\ No newline at end of file
+    readonly_fields = ['stripe_checkout_session_id', 'stripe_payment_intent_id', 'createdAt', 'updatedAt']
+
+
+@admin.register(ArchivedPropertyUnlock)
+class ArchivedPropertyUnlockAdmin(admin.ModelAdmin):
+    list_display = ['user_id', 'property_id', 'amount_paid', 'payment_status', 'createdAt', 'archivedAt']
+    list_filter = ['payment_status', 'archivedAt']
+    search_fields = ['stripe_checkout_session_id', 'stripe_payment_intent_id']
+    ordering = ['-createdAt']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+@admin.register(DailyRevenue)
+class DailyRevenueAdmin(admin.ModelAdmin):
+    list_display = ['day', 'currency', 'property_type', 'unlock_count', 'revenue']
+    list_filter = ['currency', 'property_type']
+    date_hierarchy = 'day'
+    ordering = ['-day']
+    readonly_fields = ['day', 'currency', 'property_type', 'unlock_count', 'revenue', 'createdAt', 'updatedAt']
+
+@admin.register(StripeWebhookEvent)
+class StripeWebhookEventAdmin(admin.ModelAdmin):
+    list_display = ['event_id', 'event_type', 'status', 'attempts', 'stripe_created', 'processed_at']
+    list_filter = ['status', 'event_type']
+    search_fields = ['event_id']
+    readonly_fields = ['id', 'payload', 'claimed_at', 'processed_at', 'last_error', 'createdAt', 'updatedAt']
+    ordering = ['-stripe_created']
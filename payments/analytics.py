@@ -0,0 +1,128 @@
+from collections import defaultdict
+from decimal import Decimal
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from .models import DailyRevenue, PropertyUnlock
+
+
+def record_sales(sales):
+    """
+    Add succeeded unlocks to the daily rollup.
+
+    `sales` is an iterable of (day, currency, property_type, amount) tuples;
+    each rollup row is touched once per call with an F() increment.
+    """
+    totals = defaultdict(lambda: [0, Decimal('0')])
+    for day, currency, property_type, amount in sales:
+        total = totals[(day, currency, property_type)]
+        total[0] += 1
+        total[1] += amount
+
+    for (day, currency, property_type), (count, amount) in totals.items():
+        _increment(day, currency, property_type, count, amount)
+
+
+def _increment(day, currency, property_type, count, amount):
+    key = {'day': day, 'currency': currency, 'property_type': property_type}
+    changes = {
+        'unlock_count': F('unlock_count') + count,
+        'revenue': F('revenue') + amount,
+    }
+    if DailyRevenue.objects.filter(**key).update(**changes):
+        return
+
+    try:
+        with transaction.atomic():
+            DailyRevenue.objects.create(unlock_count=count, revenue=amount, **key)
+    except IntegrityError:
+        """Another worker created the row first"""
+        DailyRevenue.objects.filter(**key).update(**changes)
+
+
+def rebuild(since=None):
+    """Recompute rollups from PropertyUnlock, for every day or from `since` onwards"""
+    unlocks = PropertyUnlock.objects.filter(
+        payment_status__in=['succeeded', 'refunded'],
+        unlocked_at__isnull=False
+    )
+    rollups = DailyRevenue.objects.all()
+    if since:
+        unlocks = unlocks.filter(unlocked_at__date__gte=since)
+        rollups = rollups.filter(day__gte=since)
+
+    grouped = unlocks.annotate(
+        day=TruncDate('unlocked_at')
+    ).values(
+        'day', 'currency', property_type=F('property__propertyType')
+    ).annotate(
+        unlock_count=Count('id'),
+        revenue=Sum('amount_paid')
+    ).order_by()
+
+    with transaction.atomic():
+        rollups.delete()
+        created = DailyRevenue.objects.bulk_create([
+            DailyRevenue(
+                day=row['day'],
+                currency=row['currency'],
+                property_type=row['property_type'],
+                unlock_count=row['unlock_count'],
+                revenue=row['revenue'],
+            )
+            for row in grouped
+        ])
+    return len(created)
+
+
+def revenue_report(start, end, currency=None, top=5):
+    """Daily series, per-type leaders and totals between start and end, from rollups only"""
+    rollups = DailyRevenue.objects.filter(day__gte=start, day__lte=end)
+    if currency:
+        rollups = rollups.filter(currency=currency.upper())
+
+    series = [
+        {
+            'day': row['day'],
+            'currency': row['currency'],
+            'unlock_count': row['unlock_count'],
+            'revenue': float(row['revenue']),
+        }
+        for row in rollups.values('day', 'currency').annotate(
+            unlock_count=Sum('unlock_count'),
+            revenue=Sum('revenue')
+        ).order_by('day', 'currency')
+    ]
+
+    top_property_types = [
+        {
+            'property_type': row['property_type'],
+            'currency': row['currency'],
+            'unlock_count': row['unlock_count'],
+            'revenue': float(row['revenue']),
+        }
+        for row in rollups.values('property_type', 'currency').annotate(
+            unlock_count=Sum('unlock_count'),
+            revenue=Sum('revenue')
+        ).order_by('-revenue', 'property_type')[:top]
+    ]
+
+    totals = [
+        {
+            'currency': row['currency'],
+            'unlock_count': row['unlock_count'],
+            'revenue': float(row['revenue']),
+        }
+        for row in rollups.values('currency').annotate(
+            unlock_count=Sum('unlock_count'),
+            revenue=Sum('revenue')
+        ).order_by('currency')
+    ]
+
+    return {
+        'start': start,
+        'end': end,
+        'series': series,
+        'top_property_types': top_property_types,
+        'totals': totals,
+    }
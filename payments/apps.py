@@ -3,3 +3,13 @@ from django.apps import AppConfig
 
 class PaymentsConfig(AppConfig):
     name = 'payments'
+
+    def ready(self):
+        import stripe
+        from django.conf import settings
+        from . import signals  # noqa: F401
+
+        """Configured here so management commands talk to Stripe too, not just views"""
+        stripe.api_key = settings.STRIPE_SECRET_KEY
+        if settings.STRIPE_API_BASE:
+            stripe.api_base = settings.STRIPE_API_BASE
@@ -0,0 +1,290 @@
+import stripe
+from decimal import Decimal
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import redirect
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from utils.authentication import CachedJWTAuthentication
+from urllib.parse import urlencode
+from property.models import Property
+from . import gateway
+from .checkout import (
+    attach_session, idempotency_key, line_item, release_open_sessions, reusable_session_id, session_window
+)
+from .confirmation import asession_status
+from .gateway import CircuitOpen
+from .inbox import arecord_event
+from .models import PropertyUnlock, SystemSettings, User
+from .views import checkout_in_progress, payments_unavailable
+
+"""
+Async variants of the checkout, success and webhook endpoints for ASGI.
+
+Stripe is called over httpx without blocking the event loop and reads use
+the async ORM, so one ASGI worker can hold many checkouts in flight.
+Transactions and row locks have no async API; those short sections run in
+a worker thread via sync_to_async.
+"""
+
+
+class AsyncResponseMixin:
+    """CustomResponseMixin envelopes as plain JsonResponses (DRF views cannot be async)"""
+
+    def success_response(self, message, data=None, status_code=status.HTTP_200_OK):
+        return JsonResponse(
+            {
+                "success": True,
+                "messgae": message,
+                "data": data
+            }, status=status_code, encoder=DjangoJSONEncoder
+        )
+
+    def error_response(self, message, errors=None, status_code=status.HTTP_400_BAD_REQUEST):
+        return JsonResponse(
+            {
+                "success": False,
+                "message": message,
+                "data": None,
+                "errors": errors
+            }, status=status_code, encoder=DjangoJSONEncoder
+        )
+
+
+def _authenticate(request):
+    try:
+        result = CachedJWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def _prepare_checkout(user, property_obj, now, unit_amount):
+    """
+    Locked read of the buyer's unlock for this property.
+
+    Returns (unlock, reusable). The lock is released before Stripe is
+    called; concurrent clicks in the same window send the same idempotency
+    key, so they still end up on one session.
+    """
+    with transaction.atomic():
+        User.objects.select_for_update().get(pk=user.pk)
+        unlock = PropertyUnlock.objects.select_for_update().filter(
+            user=user,
+            property=property_obj
+        ).first()
+        reusable = bool(
+            unlock and reusable_session_id([unlock], [property_obj.id], now, unit_amount)
+        )
+    return unlock, reusable
+
+
+def _attach(user, property_obj, checkout_session, expires_at, unlock_price, now):
+    """
+    Point the buyer's unlock at the new session.
+
+    Returns 'attached', or, attaching nothing, 'unlocked' if a webhook or the
+    sync checkout marked it succeeded while Stripe was being called, or
+    'in_progress' if the session it is on now could not be closed.
+    """
+    with transaction.atomic():
+        unlocks = list(
+            PropertyUnlock.objects.select_for_update().filter(
+                user=user,
+                property=property_obj
+            )
+        )
+        held = release_open_sessions(unlocks, now, keep_session_id=checkout_session.id)
+        if any(unlock.payment_status == 'succeeded' for unlock in unlocks):
+            return 'unlocked'
+        if held:
+            return 'in_progress'
+        attach_session(user, [property_obj], unlocks, checkout_session, expires_at, unlock_price)
+    return 'attached'
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncPropertyUnlockCreateCheckoutView(AsyncResponseMixin, View):
+    """Async PropertyUnlockCreateCheckoutAPIView"""
+
+    async def post(self, request, slug):
+        user = await sync_to_async(_authenticate)(request)
+        if user is None:
+            return self.error_response(
+                message="Authentication credentials were not provided.",
+                status_code=status.HTTP_401_UNAUTHORIZED
+            )
+
+        try:
+            property_obj = await Property.objects.filter(slug=slug).afirst()
+            if property_obj is None:
+                return self.error_response(
+                    message="Property not found",
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+
+            if property_obj.owner_id == user.id:
+                return self.error_response(
+                    message="Cannot unlock own property",
+                    errors="You are the owner",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+
+            settings_obj = await sync_to_async(SystemSettings.get_settings)()
+            unlock_price = Decimal(str(settings_obj.property_unlock_price))
+            unit_amount = int((unlock_price * 100).to_integral_value())
+            now = timezone.now()
+
+            unlock, reusable = await sync_to_async(_prepare_checkout)(user, property_obj, now, unit_amount)
+
+            if unlock and unlock.payment_status == 'succeeded':
+                return self.error_response(
+                    message="Property already unlocked",
+                    errors="You already have access",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+
+            if reusable:
+                return self.success_response(
+                    message="Checkout session reused",
+                    data={
+                        'checkout_url': unlock.checkout_url,
+                        'session_id': unlock.stripe_checkout_session_id,
+                        'amount': float(unlock.amount_paid),
+                        'currency': unlock.currency,
+                        'property_name': property_obj.propertyName,
+                        'expires_at': unlock.checkout_expires_at,
+                    },
+                    status_code=status.HTTP_200_OK
+                )
+
+            base_url = f"{request.scheme}://{request.get_host()}"
+            window, expires_at = session_window(now)
+
+            checkout_session = await gateway.acreate_checkout_session(
+                payment_method_types=['card'],
+                line_items=[line_item(property_obj, unit_amount)],
+                mode='payment',
+                success_url=(
+                    f"{base_url}/api/v1/payments/async/properties/{slug}/payment-success/"
+                    f"?session_id={{CHECKOUT_SESSION_ID}}"
+                ),
+                cancel_url=f"{base_url}/api/v1/payments/properties/{slug}/payment-cancel/",
+                expires_at=int(expires_at.timestamp()),
+                metadata={
+                    'user_id': str(user.id),
+                    'property_id': str(property_obj.id),
+                    'property_slug': property_obj.slug,
+                },
+                idempotency_key=idempotency_key(
+                    user.id, [property_obj.id], unit_amount, window,
+                    replaces=[unlock.stripe_checkout_session_id] if unlock else ()
+                ),
+            )
+
+            result = await sync_to_async(_attach)(
+                user, property_obj, checkout_session, expires_at, unlock_price, timezone.now()
+            )
+            if result == 'unlocked':
+                return self.error_response(
+                    message="Property already unlocked",
+                    errors="You already have access",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            if result == 'in_progress':
+                return checkout_in_progress(self, [property_obj])
+
+            return self.success_response(
+                message="Checkout session created",
+                data={
+                    'checkout_url': checkout_session.url,
+                    'session_id': checkout_session.id,
+                    'amount': float(unlock_price),
+                    'currency': 'AUD',
+                    'property_name': property_obj.propertyName,
+                    'expires_at': expires_at,
+                },
+                status_code=status.HTTP_201_CREATED
+            )
+
+        except CircuitOpen as e:
+            return payments_unavailable(self, e.retry_after)
+        except gateway.TRANSIENT_ERRORS:
+            return payments_unavailable(self, settings.STRIPE_BREAKER_COOLDOWN_SECONDS)
+        except stripe.error.StripeError as e:
+            return self.error_response(
+                message="Stripe error",
+                errors=str(e.user_message) if hasattr(e, 'user_message') else str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            return self.error_response(
+                message="Error creating checkout session",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AsyncPropertyPaymentSuccessView(View):
+    """Async PropertyPaymentSuccessAPIView: webhook-first, no Stripe call"""
+
+    async def get(self, request, slug):
+        session_id = request.GET.get('session_id')
+
+        if not session_id:
+            return redirect(
+                f"{settings.FRONTEND_BASE_URL}/payment/error?message=session_missing"
+            )
+
+        try:
+            payment_status, slugs = await asession_status(session_id)
+
+            if payment_status is None:
+                return redirect(
+                    f"{settings.FRONTEND_BASE_URL}/payment/error?message=unlock_not_found"
+                )
+
+            if payment_status == 'succeeded':
+                return redirect(
+                    f"{settings.FRONTEND_BASE_URL}/property_details/{slug}/"
+                )
+
+            return redirect(
+                f"{settings.FRONTEND_BASE_URL}/payment/confirming"
+                f"?{urlencode({'session_id': session_id, 'property_slug': slug})}"
+            )
+
+        except Exception:
+            return redirect(
+                f"{settings.FRONTEND_BASE_URL}/payment/error?message=server_error"
+            )
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncStripeWebhookView(View):
+    """Async StripeWebhookAPIView: verify, queue in the inbox, acknowledge"""
+
+    async def post(self, request):
+        payload = request.body
+        sig_header = request.META.get('HTTP_STRIPE_SIGNATURE')
+
+        if not settings.STRIPE_WEBHOOK_SECRET or not sig_header:
+            return HttpResponse(status=400)
+
+        try:
+            event = stripe.Webhook.construct_event(
+                payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
+            )
+        except (ValueError, stripe.error.SignatureVerificationError):
+            return HttpResponse(status=400)
+
+        await arecord_event(event, payload)
+
+        return HttpResponse(status=200)
@@ -0,0 +1,175 @@
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+import stripe
+from django.conf import settings
+from . import gateway
+
+
+def session_window(now):
+    """
+    Expiry for a new Checkout Session, fixed per CHECKOUT_SESSION_TTL_MINUTES window.
+
+    Every request in the same window sends identical parameters, which Stripe
+    requires when an idempotency key is replayed. The session stays open
+    between one and two TTLs.
+    """
+    ttl = settings.CHECKOUT_SESSION_TTL_MINUTES * 60
+    window = int(now.timestamp()) // ttl
+    expires_at = datetime.fromtimestamp((window + 2) * ttl, tz=dt_timezone.utc)
+    return window, expires_at
+
+
+def idempotency_key(user_id, property_ids, unit_amount, window, replaces=()):
+    """
+    Stripe idempotency key derived from buyer, properties, price and expiry window.
+
+    `replaces` holds the sessions the unlocks point at now. Once a checkout
+    has expired one of them, the next key differs, so Stripe cannot replay
+    a session that was expired earlier in the same window.
+    """
+    raw = ':'.join([
+        str(user_id),
+        ','.join(sorted(str(pk) for pk in property_ids)),
+        str(unit_amount),
+        str(window),
+        ','.join(sorted(session_id for session_id in replaces if session_id)),
+    ])
+    return 'checkout-' + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def is_reusable(unlock, now, unit_amount):
+    """A pending unlock whose session is still open, at the current price"""
+    return (
+        unlock is not None
+        and unlock.payment_status == 'pending'
+        and unlock.checkout_url
+        and unlock.checkout_expires_at
+        and unlock.checkout_expires_at > now + timedelta(minutes=settings.CHECKOUT_SESSION_REUSE_MARGIN_MINUTES)
+        and int((unlock.amount_paid * 100).to_integral_value()) == unit_amount
+    )
+
+
+def reusable_session_id(unlocks, property_ids, now, unit_amount):
+    """
+    Session ID to hand back when `unlocks` already share one open session
+    covering exactly `property_ids`, otherwise None.
+    """
+    from .models import PropertyUnlock
+
+    if len(unlocks) != len(property_ids) or not all(
+        is_reusable(unlock, now, unit_amount) for unlock in unlocks
+    ):
+        return None
+
+    session_ids = {unlock.stripe_checkout_session_id for unlock in unlocks}
+    if len(session_ids) != 1:
+        return None
+    session_id = session_ids.pop()
+
+    covered = set(
+        PropertyUnlock.objects.filter(
+            stripe_checkout_session_id=session_id
+        ).values_list('property_id', flat=True)
+    )
+    return session_id if covered == set(property_ids) else None
+
+
+def release_open_sessions(unlocks, now, keep_session_id=None):
+    """
+    Close the Checkout Sessions that `unlocks` are about to be moved off.
+
+    A grant only covers the rows that still point at the paid session, so a
+    row moved off a session the buyer can still pay would be charged and
+    never unlocked. Each open session is expired on Stripe first. A session
+    Stripe reports as paid is granted instead, and the in-memory unlocks are
+    updated to match.
+
+    Returns the IDs of properties that must stay where they are: paid by a
+    method that has not settled yet, or on a session Stripe could not be
+    asked about.
+    """
+    from .services import mark_checkout_succeeded, mark_sessions_expired
+
+    session_ids = {
+        unlock.stripe_checkout_session_id for unlock in unlocks
+        if unlock.payment_status == 'pending'
+        and unlock.stripe_checkout_session_id
+        and unlock.stripe_checkout_session_id != keep_session_id
+        and (unlock.checkout_expires_at is None or unlock.checkout_expires_at > now)
+    }
+    held = set()
+
+    for session_id in session_ids:
+        on_session = [unlock for unlock in unlocks if unlock.stripe_checkout_session_id == session_id]
+        try:
+            try:
+                session = gateway.expire_checkout_session(session_id)
+            except stripe.error.InvalidRequestError:
+                """Only open sessions can be expired; find out what happened to it"""
+                session = gateway.retrieve_checkout_session(session_id)
+        except stripe.error.InvalidRequestError:
+            """Unknown to Stripe, so nobody can pay it"""
+            mark_sessions_expired([session_id], now)
+            continue
+        except (gateway.CircuitOpen, stripe.error.StripeError):
+            held.update(unlock.property_id for unlock in on_session)
+            continue
+
+        if session.get('payment_status') in ('paid', 'no_payment_required'):
+            mark_checkout_succeeded(session_id, session.get('payment_intent'))
+            for unlock in on_session:
+                unlock.payment_status = 'succeeded'
+        elif session.get('status') == 'expired':
+            mark_sessions_expired([session_id], now)
+        else:
+            held.update(unlock.property_id for unlock in on_session)
+
+    return held
+
+
+def line_item(property_obj, unit_amount):
+    return {
+        'price_data': {
+            'currency': 'aud',
+            'unit_amount': unit_amount,
+            'product_data': {
+                'name': f'Unlock: {property_obj.propertyName}',
+                'description': 'Full access to property details',
+            },
+        },
+        'quantity': 1,
+    }
+
+
+def attach_session(user, properties, unlocks, checkout_session, expires_at, unlock_price):
+    """
+    Point every unlock for `properties` at a new Checkout Session.
+
+    Existing rows are moved over with one UPDATE and missing rows are
+    bulk-created, so the number of queries does not grow with the cart.
+    """
+    from django.utils import timezone
+    from .models import PropertyUnlock
+
+    fields = {
+        'stripe_checkout_session_id': checkout_session.id,
+        'stripe_payment_intent_id': None,
+        'checkout_url': checkout_session.url,
+        'checkout_expires_at': expires_at,
+        'amount_paid': unlock_price,
+        'currency': 'AUD',
+        'payment_status': 'pending',
+        'unlocked_at': None,
+    }
+
+    existing = {unlock.property_id for unlock in unlocks}
+    if unlocks:
+        PropertyUnlock.objects.filter(
+            id__in=[unlock.id for unlock in unlocks]
+        ).update(updatedAt=timezone.now(), **fields)
+
+    PropertyUnlock.objects.bulk_create([
+        PropertyUnlock(user=user, property=property_obj, **fields)
+        for property_obj in properties
+        if property_obj.id not in existing
+    ])
@@ -0,0 +1,110 @@
+import math
+import time
+import stripe
+from django.conf import settings
+from django.core.cache import cache
+from . import gateway
+from .models import PropertyUnlock
+from .services import mark_checkout_succeeded
+
+"""
+Webhook-first payment confirmation.
+
+The success redirect and the status endpoint read the local unlock rows,
+which the webhook worker keeps current. Stripe is only asked directly as a
+bounded, throttled fallback when a session is still pending.
+"""
+
+
+def _overall_status(rows):
+    if not rows:
+        return None, []
+
+    statuses = {payment_status for payment_status, _ in rows}
+    if statuses == {'succeeded'}:
+        overall = 'succeeded'
+    elif 'pending' in statuses:
+        overall = 'pending'
+    else:
+        overall = sorted(statuses - {'succeeded'})[0]
+    return overall, [slug for _, slug in rows]
+
+
+def _session_rows(session_id):
+    return PropertyUnlock.objects.filter(
+        stripe_checkout_session_id=session_id
+    ).values_list('payment_status', 'property__slug')
+
+
+def session_status(session_id):
+    """
+    Overall status of the unlocks behind a Checkout Session and their slugs.
+
+    Returns (None, []) when no unlock references the session.
+    """
+    return _overall_status(list(_session_rows(session_id)))
+
+
+async def asession_status(session_id):
+    return _overall_status([row async for row in _session_rows(session_id)])
+
+
+def confirm_with_stripe(session_id):
+    """
+    Ask Stripe whether a pending session was paid and record it if so.
+
+    At most once per session every PAYMENT_CONFIRM_FALLBACK_INTERVAL_SECONDS,
+    with a short timeout, so pollers cannot turn a Stripe slowdown into a
+    request storm. Returns True when the session was found paid.
+    """
+    if not cache.add(
+        f'payment_confirm_fallback:{session_id}',
+        1,
+        timeout=settings.PAYMENT_CONFIRM_FALLBACK_INTERVAL_SECONDS
+    ):
+        return False
+
+    try:
+        session = gateway.retrieve_checkout_session(
+            session_id,
+            timeout=settings.PAYMENT_CONFIRM_STRIPE_TIMEOUT_SECONDS,
+            retries=0
+        )
+    except (gateway.CircuitOpen, stripe.error.StripeError):
+        return False
+
+    if session.get('payment_status') != 'paid':
+        return False
+
+    mark_checkout_succeeded(session_id, session.get('payment_intent'))
+    return True
+
+
+def wait_for_confirmation(session_id, wait=0):
+    """
+    Long-poll the local status for up to `wait` seconds.
+
+    If the webhook has not confirmed the session after
+    PAYMENT_CONFIRM_FALLBACK_AFTER_SECONDS (or straight away for a plain
+    poll), Stripe is asked directly through the throttled fallback.
+    """
+    if not math.isfinite(wait):
+        """NaN slips through min/max and would never satisfy the exit checks"""
+        wait = 0
+    wait = min(max(wait, 0), settings.PAYMENT_STATUS_MAX_WAIT_SECONDS)
+    fallback_after = min(wait, settings.PAYMENT_CONFIRM_FALLBACK_AFTER_SECONDS)
+    started = time.monotonic()
+
+    while True:
+        status, slugs = session_status(session_id)
+        if status != 'pending':
+            break
+
+        elapsed = time.monotonic() - started
+        if elapsed >= fallback_after and confirm_with_stripe(session_id):
+            continue
+        if elapsed >= wait:
+            break
+        time.sleep(settings.PAYMENT_STATUS_POLL_INTERVAL_SECONDS)
+
+    return status, slugs
@@ -0,0 +1,78 @@
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+"""
+Per-user set of unlocked property IDs.
+
+Stored in the cache as the concatenated 16-byte UUIDs, sorted, so a buyer
+with hundreds of unlocks costs a few kilobytes. It is decoded into a
+frozenset once per request and memoized on the user object.
+
+The set's key includes a per-user generation token that invalidate()
+replaces. A reader that loaded the old set before the unlock committed
+can only write it under the old generation, which no later reader uses.
+"""
+_MEMO_ATTR = '_unlocked_property_ids'
+
+
+def generation_key(user_id):
+    return f'unlocked_property_ids_generation:{user_id}'
+
+
+def cache_key(user_id, generation):
+    return f'unlocked_property_ids:{user_id}:{generation}'
+
+
+def _generation(user_id):
+    """Current generation token; a fresh random one if none is cached"""
+    key = generation_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def _encode(property_ids):
+    return b''.join(sorted(property_id.bytes for property_id in property_ids))
+
+
+def _decode(blob):
+    return frozenset(uuid.UUID(bytes=blob[i:i + 16]) for i in range(0, len(blob), 16))
+
+
+def unlocked_property_ids(user):
+    """Property IDs the user has paid for; filled from the database on first access"""
+    memo = getattr(user, _MEMO_ATTR, None)
+    if memo is not None:
+        return memo
+
+    key = cache_key(user.id, _generation(user.id))
+    blob = cache.get(key)
+    if blob is None:
+        from .models import PropertyUnlock
+        blob = _encode(
+            PropertyUnlock.objects.filter(
+                user_id=user.id,
+                payment_status='succeeded'
+            ).values_list('property_id', flat=True)
+        )
+        cache.set(key, blob, timeout=settings.ENTITLEMENT_CACHE_SECONDS)
+
+    memo = _decode(blob)
+    setattr(user, _MEMO_ATTR, memo)
+    return memo
+
+
+def invalidate(user_ids):
+    """
+    Start a new generation for each user once the surrounding transaction commits.
+
+    A new random token rather than incr, so concurrent invalidations can
+    never land on the same generation.
+    """
+    keys = [generation_key(user_id) for user_id in set(user_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.set_many({key: uuid.uuid4().hex for key in keys}, timeout=None))
@@ -0,0 +1,217 @@
+import hashlib
+import hmac
+import json
+import random
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+from urllib.request import Request, urlopen
+
+"""
+Local stand-in for the Stripe Checkout Session API, for load tests only.
+
+Serves the endpoints the unlock flow and sweeper use:
+    POST /v1/checkout/sessions
+    GET  /v1/checkout/sessions/<id>
+    POST /v1/checkout/sessions/<id>/expire
+plus POST /_fake/sessions/<id>/pay, which marks a session paid and delivers
+a signed checkout.session.completed webhook, as Stripe does after checkout.
+"""
+
+
+def sign_payload(payload, secret, timestamp=None):
+    """Stripe-Signature header value for a webhook body"""
+    timestamp = int(timestamp or time.time())
+    signature = hmac.new(
+        secret.encode(),
+        f"{timestamp}.{payload}".encode(),
+        hashlib.sha256
+    ).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+class FakeStripeState:
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 webhook_url=None, webhook_secret=None, base_url=''):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.base_url = base_url
+        self.sessions = {}
+        self.idempotent_responses = {}
+        self.lock = threading.Lock()
+
+    def delay(self):
+        latency = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if latency:
+            time.sleep(latency / 1000)
+
+    def should_fail(self):
+        return self.error_rate and random.random() < self.error_rate
+
+    def create_session(self, params):
+        session_id = f"cs_test_{secrets.token_hex(12)}"
+        metadata = {
+            key[len('metadata['):-1]: value
+            for key, value in params.items()
+            if key.startswith('metadata[')
+        }
+        session = {
+            'id': session_id,
+            'object': 'checkout.session',
+            'url': f"{self.base_url}/pay/{session_id}",
+            'status': 'open',
+            'payment_status': 'unpaid',
+            'payment_intent': None,
+            'mode': params.get('mode', 'payment'),
+            'success_url': params.get('success_url'),
+            'cancel_url': params.get('cancel_url'),
+            'expires_at': int(params['expires_at']) if params.get('expires_at') else None,
+            'currency': params.get('line_items[0][price_data][currency]'),
+            'amount_total': sum(
+                int(value) * int(params.get(key.replace('[price_data][unit_amount]', '[quantity]'), 1))
+                for key, value in params.items()
+                if key.endswith('[price_data][unit_amount]')
+            ),
+            'metadata': metadata,
+            'created': int(time.time()),
+        }
+        with self.lock:
+            self.sessions[session_id] = session
+        return session
+
+    def pay_session(self, session_id):
+        with self.lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return None
+            if session['payment_status'] != 'paid':
+                session['status'] = 'complete'
+                session['payment_status'] = 'paid'
+                session['payment_intent'] = f"pi_test_{secrets.token_hex(12)}"
+        if self.webhook_url:
+            threading.Thread(target=self.send_webhook, args=(session,), daemon=True).start()
+        return session
+
+    def expire_session(self, session_id):
+        with self.lock:
+            session = self.sessions.get(session_id)
+            if session is not None and session['status'] == 'open':
+                session['status'] = 'expired'
+                session['url'] = None
+        return session
+
+    def send_webhook(self, session):
+        event = {
+            'id': f"evt_test_{secrets.token_hex(12)}",
+            'object': 'event',
+            'type': 'checkout.session.completed',
+            'created': int(time.time()),
+            'data': {'object': session},
+        }
+        payload = json.dumps(event)
+        request = Request(
+            self.webhook_url,
+            data=payload.encode(),
+            headers={
+                'Content-Type': 'application/json',
+                'Stripe-Signature': sign_payload(payload, self.webhook_secret or ''),
+            },
+            method='POST'
+        )
+        try:
+            urlopen(request, timeout=10).read()
+        except Exception:
+            pass
+
+
+class FakeStripeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status, message, error_type='api_error'):
+        self._send(status, {'error': {'type': error_type, 'message': message}})
+
+    def _read_params(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode() if length else ''
+        return dict(parse_qsl(body, keep_blank_values=True))
+
+    def do_POST(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        params = self._read_params()
+
+        if path.startswith('/_fake/sessions/') and path.endswith('/pay'):
+            session = self.state.pay_session(path.split('/')[3])
+            if session is None:
+                return self._error(404, "No such checkout.session", 'invalid_request_error')
+            return self._send(200, session)
+
+        if path.startswith('/v1/checkout/sessions/') and path.endswith('/expire'):
+            self.state.delay()
+            session = self.state.expire_session(path.split('/')[4])
+            if session is None:
+                return self._error(404, "No such checkout.session", 'invalid_request_error')
+            return self._send(200, session)
+
+        if path != '/v1/checkout/sessions':
+            return self._error(404, f"Unrecognized request URL (POST: {path})", 'invalid_request_error')
+
+        self.state.delay()
+        if self.state.should_fail():
+            return self._error(500, "Injected failure")
+
+        """Replay the stored response for a repeated idempotency key, like Stripe"""
+        key = self.headers.get('Idempotency-Key')
+        if key:
+            with self.state.lock:
+                replay = self.state.idempotent_responses.get(key)
+            if replay:
+                return self._send(200, replay)
+
+        session = self.state.create_session(params)
+        if key:
+            with self.state.lock:
+                self.state.idempotent_responses[key] = session
+        self._send(200, session)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        prefix = '/v1/checkout/sessions/'
+        if not path.startswith(prefix):
+            return self._error(404, f"Unrecognized request URL (GET: {path})", 'invalid_request_error')
+
+        self.state.delay()
+        if self.state.should_fail():
+            return self._error(500, "Injected failure")
+
+        with self.state.lock:
+            session = self.state.sessions.get(path[len(prefix):])
+        if session is None:
+            return self._error(404, "No such checkout.session", 'invalid_request_error')
+        self._send(200, session)
+
+
+def make_server(host='127.0.0.1', port=12111, **options):
+    server = ThreadingHTTPServer((host, port), FakeStripeHandler)
+    server.daemon_threads = True
+    server.state = FakeStripeState(base_url=f"http://{host}:{server.server_port}", **options)
+    return server
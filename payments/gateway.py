@@ -0,0 +1,264 @@
+import asyncio
+import random
+import threading
+import time
+import weakref
+from collections import deque
+import stripe
+from django.conf import settings
+from utils import metrics
+
+"""
+Single entry point for outbound Stripe API calls.
+
+Every call gets a per-call timeout, bounded retries with jittered backoff
+for transient failures, a latency histogram per operation, and a circuit
+breaker that fails fast once Stripe's error rate crosses
+STRIPE_BREAKER_ERROR_RATE. Breaker state is per worker process.
+"""
+
+"""Connection problems, rate limits and Stripe-side 5xx are worth retrying"""
+TRANSIENT_ERRORS = (stripe.error.APIConnectionError, stripe.error.RateLimitError, stripe.error.APIError)
+
+
+class CircuitOpen(Exception):
+    """Stripe is failing; calls are rejected until the cooldown passes"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Stripe circuit breaker is open, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(self, window_seconds, min_requests, error_rate, cooldown_seconds):
+        self.window_seconds = window_seconds
+        self.min_requests = min_requests
+        self.error_rate = error_rate
+        self.cooldown_seconds = cooldown_seconds
+        self.outcomes = deque()
+        self.opened_at = None
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def _trim(self, now):
+        while self.outcomes and self.outcomes[0][0] < now - self.window_seconds:
+            self.outcomes.popleft()
+
+    def allow(self):
+        """
+        Raise CircuitOpen unless a call may go out.
+
+        Returns True for the single half-open probe: only that caller's
+        outcome decides whether the breaker closes. Ordinary calls get False.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if self.opened_at is None:
+                return False
+            remaining = self.opened_at + self.cooldown_seconds - now
+            if remaining > 0 or self.probing:
+                raise CircuitOpen(max(1, int(remaining + 0.999)))
+            self.probing = True
+            return True
+
+    def record(self, ok, probe=False):
+        now = time.monotonic()
+        with self.lock:
+            if probe:
+                self.probing = False
+                self.opened_at = None if ok else now
+                self.outcomes.clear()
+            elif self.opened_at is None:
+                self.outcomes.append((now, ok))
+                self._trim(now)
+                failures = sum(1 for _, outcome in self.outcomes if not outcome)
+                if (
+                    len(self.outcomes) >= self.min_requests
+                    and failures / len(self.outcomes) >= self.error_rate
+                ):
+                    self.opened_at = now
+            """Otherwise a call that was in flight when the breaker opened; it says nothing about recovery"""
+            metrics.set_gauge('stripe.circuit_open', int(self.opened_at is not None))
+
+    def is_open(self):
+        return self.opened_at is not None
+
+
+breaker = CircuitBreaker(
+    window_seconds=settings.STRIPE_BREAKER_WINDOW_SECONDS,
+    min_requests=settings.STRIPE_BREAKER_MIN_REQUESTS,
+    error_rate=settings.STRIPE_BREAKER_ERROR_RATE,
+    cooldown_seconds=settings.STRIPE_BREAKER_COOLDOWN_SECONDS,
+)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def client(timeout=None):
+    """StripeClient with the given timeout; the library's own retries are disabled"""
+    timeout = timeout or settings.STRIPE_TIMEOUT_SECONDS
+    with _clients_lock:
+        if timeout not in _clients:
+            options = {}
+            if settings.STRIPE_API_BASE:
+                options['base_addresses'] = {'api': settings.STRIPE_API_BASE}
+            _clients[timeout] = stripe.StripeClient(
+                settings.STRIPE_SECRET_KEY,
+                http_client=stripe.RequestsClient(timeout=timeout),
+                max_network_retries=0,
+                **options
+            )
+        return _clients[timeout]
+
+
+"""httpx async clients are bound to the event loop that created them"""
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def async_client(timeout=None):
+    """StripeClient on an httpx async transport, one per running event loop"""
+    timeout = timeout or settings.STRIPE_TIMEOUT_SECONDS
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if timeout not in clients:
+        options = {}
+        if settings.STRIPE_API_BASE:
+            options['base_addresses'] = {'api': settings.STRIPE_API_BASE}
+        clients[timeout] = stripe.StripeClient(
+            settings.STRIPE_SECRET_KEY,
+            http_client=stripe.HTTPXClient(timeout=timeout),
+            max_network_retries=0,
+            **options
+        )
+    return clients[timeout]
+
+
+def _backoff(attempt):
+    """Full jitter: uniform between zero and the exponential ceiling"""
+    ceiling = min(
+        settings.STRIPE_RETRY_BACKOFF_MAX_SECONDS,
+        settings.STRIPE_RETRY_BACKOFF_BASE_SECONDS * (2 ** attempt)
+    )
+    return random.uniform(0, ceiling)
+
+
+def _allow(operation):
+    try:
+        return breaker.allow()
+    except CircuitOpen:
+        metrics.increment('stripe.requests', operation=operation, outcome='circuit_open')
+        raise
+
+
+def _observe(operation, started, outcome):
+    metrics.observe('stripe.latency_ms', (time.perf_counter() - started) * 1000, operation=operation)
+    metrics.increment('stripe.requests', operation=operation, outcome=outcome)
+
+
+def call(operation, fn, retries=None):
+    """
+    Run `fn()` against Stripe under the breaker, retrying transient failures.
+
+    Only idempotent requests should be retried: reads, and creates that
+    carry an idempotency key.
+    """
+    retries = settings.STRIPE_MAX_RETRIES if retries is None else retries
+    probe = _allow(operation)
+
+    try:
+        for attempt in range(retries + 1):
+            started = time.perf_counter()
+            try:
+                result = fn()
+            except TRANSIENT_ERRORS:
+                _observe(operation, started, 'transient_error')
+                breaker.record(False, probe)
+                probe = False
+                if attempt >= retries or breaker.is_open():
+                    raise
+                time.sleep(_backoff(attempt))
+                continue
+            except stripe.error.StripeError:
+                """Our request was rejected; Stripe itself is healthy"""
+                _observe(operation, started, 'client_error')
+                breaker.record(True, probe)
+                probe = False
+                raise
+
+            _observe(operation, started, 'ok')
+            breaker.record(True, probe)
+            probe = False
+            return result
+    finally:
+        if probe:
+            """The probe died on something else; reopen rather than stay half-open forever"""
+            breaker.record(False, probe=True)
+
+
+async def call_async(operation, coro_fn, retries=None):
+    """`call` for coroutines: same breaker, retries and metrics, without blocking the loop"""
+    retries = settings.STRIPE_MAX_RETRIES if retries is None else retries
+    probe = _allow(operation)
+
+    try:
+        for attempt in range(retries + 1):
+            started = time.perf_counter()
+            try:
+                result = await coro_fn()
+            except TRANSIENT_ERRORS:
+                _observe(operation, started, 'transient_error')
+                breaker.record(False, probe)
+                probe = False
+                if attempt >= retries or breaker.is_open():
+                    raise
+                await asyncio.sleep(_backoff(attempt))
+                continue
+            except stripe.error.StripeError:
+                _observe(operation, started, 'client_error')
+                breaker.record(True, probe)
+                probe = False
+                raise
+
+            _observe(operation, started, 'ok')
+            breaker.record(True, probe)
+            probe = False
+            return result
+    finally:
+        if probe:
+            """Includes cancellation of the awaiting task"""
+            breaker.record(False, probe=True)
+
+
+def create_checkout_session(idempotency_key, **params):
+    return call(
+        'checkout.session.create',
+        lambda: client().v1.checkout.sessions.create(
+            params=params,
+            options={'idempotency_key': idempotency_key}
+        )
+    )
+
+
+def retrieve_checkout_session(session_id, timeout=None, retries=None):
+    return call(
+        'checkout.session.retrieve',
+        lambda: client(timeout).v1.checkout.sessions.retrieve(session_id),
+        retries=retries
+    )
+
+
+def expire_checkout_session(session_id):
+    return call(
+        'checkout.session.expire',
+        lambda: client().v1.checkout.sessions.expire(session_id)
+    )
+
+
+async def acreate_checkout_session(idempotency_key, **params):
+    return await call_async(
+        'checkout.session.create',
+        lambda: async_client().v1.checkout.sessions.create_async(
+            params=params,
+            options={'idempotency_key': idempotency_key}
+        )
+    )
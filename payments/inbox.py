@@ -0,0 +1,103 @@
+import json
+from datetime import datetime, timezone as dt_timezone
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+from utils.work_queue import WorkQueue
+from .models import StripeWebhookEvent
+from . import services
+
+"""Oldest first, so events for the same object are applied in the order Stripe created them"""
+queue = WorkQueue(
+    StripeWebhookEvent,
+    claimed_status='processing',
+    settings_prefix='WEBHOOK_INBOX',
+    ordering=('stripe_created', 'createdAt')
+)
+
+
+def _inbox_row(event, payload):
+    return StripeWebhookEvent(
+        event_id=event['id'],
+        event_type=event['type'],
+        payload=json.loads(payload),
+        stripe_created=datetime.fromtimestamp(event['created'], tz=dt_timezone.utc),
+    )
+
+
+def record_event(event, payload):
+    """
+    Store a verified Stripe event in the inbox.
+
+    A single INSERT that ignores duplicate event IDs, so Stripe retries and
+    redeliveries are acknowledged without being queued twice.
+    """
+    StripeWebhookEvent.objects.bulk_create([_inbox_row(event, payload)], ignore_conflicts=True)
+
+
+async def arecord_event(event, payload):
+    await StripeWebhookEvent.objects.abulk_create([_inbox_row(event, payload)], ignore_conflicts=True)
+
+
+def _checkout_completed(session):
+    services.mark_checkout_succeeded(session['id'], session.get('payment_intent'))
+
+
+def _payment_intent_succeeded(payment_intent):
+    services.mark_payment_intent_succeeded(payment_intent['id'])
+
+
+def _payment_intent_failed(payment_intent):
+    services.mark_payment_intent_failed(payment_intent['id'])
+
+
+HANDLERS = {
+    'checkout.session.completed': _checkout_completed,
+    'payment_intent.succeeded': _payment_intent_succeeded,
+    'payment_intent.payment_failed': _payment_intent_failed,
+}
+
+
+def process_batch(batch_size=100):
+    """
+    Apply one batch of inbox events in Stripe creation order.
+
+    Handlers are idempotent, so an event re-run after a crash is harmless.
+    Returns a (processed, failed) tuple.
+    """
+    events = queue.claim_batch(batch_size)
+    processed = failed = 0
+
+    for event in events:
+        handler = HANDLERS.get(event.event_type)
+        try:
+            with transaction.atomic():
+                if handler:
+                    handler(event.payload['data']['object'])
+                StripeWebhookEvent.objects.filter(id=event.id).update(
+                    status='processed',
+                    attempts=event.attempts + 1,
+                    processed_at=timezone.now(),
+                    claimed_at=None,
+                    last_error=None,
+                )
+        except Exception as e:
+            queue.record_failure(event, e)
+            failed += 1
+            continue
+        processed += 1
+
+    return processed, failed
+
+
+def inbox_stats():
+    """Queue depth and age of the oldest unprocessed event"""
+    now = timezone.now()
+    pending = StripeWebhookEvent.objects.filter(status__in=['pending', 'processing'])
+    oldest = pending.aggregate(oldest=Min('createdAt'))['oldest']
+
+    return {
+        'queue_depth': pending.count(),
+        'failed': StripeWebhookEvent.objects.filter(status='failed').count(),
+        'oldest_pending_age_seconds': round((now - oldest).total_seconds(), 3) if oldest else None,
+    }
@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from property.models import Property
+
+"""Fixtures and reporting shared by the loadtest_unlocks and bench_checkout commands"""
+
+User = get_user_model()
+
+
+def loadtest_property(slug=None):
+    """Property to unlock; a load-test listing is created if `slug` is omitted"""
+    if slug:
+        try:
+            return Property.objects.get(slug=slug)
+        except Property.DoesNotExist:
+            raise CommandError(f"No property with slug '{slug}'")
+
+    owner, _ = User.objects.get_or_create(
+        email='loadtest-owner@example.com',
+        defaults={'username': 'loadtest-owner', 'role': 'owner'}
+    )
+    property_obj = Property.objects.filter(owner=owner).first()
+    if property_obj is None:
+        property_obj = Property.objects.create(
+            owner=owner,
+            propertyName='Load Test Listing',
+            propertyAddress='1 Load Test Street',
+            propertyType='House',
+        )
+    return property_obj
+
+
+def loadtest_buyers(count):
+    emails = [f"loadtest-buyer-{index}@example.com" for index in range(count)]
+    existing = set(User.objects.filter(email__in=emails).values_list('email', flat=True))
+    User.objects.bulk_create([
+        User(email=email, username=email.split('@')[0], role='buyer')
+        for email in emails
+        if email not in existing
+    ])
+    return list(User.objects.filter(email__in=emails))
+
+
+def percentile(latencies, p):
+    if not latencies:
+        return None
+    return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 1)
+
+
+def latency_line(label, latencies):
+    latencies = sorted(latencies)
+    return (
+        f"{label:>9}: p50 {percentile(latencies, 0.50)}ms "
+        f"p95 {percentile(latencies, 0.95)}ms "
+        f"p99 {percentile(latencies, 0.99)}ms "
+        f"max {percentile(latencies, 1.0)}ms"
+    )
@@ -0,0 +1,21 @@
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from payments.analytics import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the DailyRevenue rollup from succeeded property unlocks"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help="Only rebuild days from this date (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError("--since must be a date in YYYY-MM-DD format")
+
+        rows = rebuild(since)
+        self.stdout.write(f"Wrote {rows} daily revenue rows")
@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+from payments.loadtest import latency_line, loadtest_buyers, loadtest_property
+from payments.models import PropertyUnlock
+
+TARGETS = {
+    'wsgi': '/api/v1/payments/properties/{slug}/unlock/',
+    'asgi': '/api/v1/payments/async/properties/{slug}/unlock/',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent checkout throughput of the sync view under WSGI with "
+        "the async view under ASGI. Start both servers with STRIPE_API_BASE pointed "
+        "at fake_stripe (give it --latency-ms so Stripe waits dominate), e.g. "
+        "'gunicorn michael_milne.wsgi -w 4 -b :8000' and "
+        "'uvicorn michael_milne.asgi:application --workers 1 --port 8001'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--wsgi-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--asgi-url', default='http://127.0.0.1:8001')
+        parser.add_argument('--requests', type=int, default=500, help="Checkouts per server")
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--only', choices=sorted(TARGETS), help="Benchmark a single server")
+
+    def handle(self, *args, **options):
+        property_obj = loadtest_property()
+        buyers = loadtest_buyers(options['requests'])
+        tokens = [str(AccessToken.for_user(buyer)) for buyer in buyers]
+
+        results = {}
+        for name in ([options['only']] if options['only'] else sorted(TARGETS, reverse=True)):
+            """Each run starts with no unlocks so every request reaches Stripe"""
+            PropertyUnlock.objects.filter(user__in=buyers, property=property_obj).delete()
+            url = options[f'{name}_url'] + TARGETS[name].format(slug=property_obj.slug)
+            results[name] = self._run(name, url, tokens, options['concurrency'])
+
+        if len(results) == 2 and results['wsgi']:
+            self.stdout.write(f"ASGI/WSGI throughput: {results['asgi'] / results['wsgi']:.2f}x")
+
+    def _run(self, name, url, tokens, concurrency):
+        local = threading.local()
+
+        def checkout(token):
+            if not hasattr(local, 'http'):
+                local.http = requests.Session()
+            started = time.perf_counter()
+            try:
+                response = local.http.post(url, headers={'Authorization': f"Bearer {token}"}, timeout=60)
+            except requests.RequestException as e:
+                return None, type(e).__name__
+            elapsed = (time.perf_counter() - started) * 1000
+            if response.status_code not in (200, 201):
+                return elapsed, f"HTTP {response.status_code}"
+            return elapsed, None
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(checkout, tokens))
+        elapsed = time.perf_counter() - started
+
+        if all(error == 'ConnectionError' for _, error in outcomes):
+            raise CommandError(f"{name}: nothing is listening at {url}")
+
+        ok = [latency for latency, error in outcomes if error is None]
+        throughput = len(ok) / elapsed
+        self.stdout.write(
+            f"{name.upper()}: {len(ok)}/{len(outcomes)} checkouts in {elapsed:.2f}s "
+            f"({throughput:.1f}/s) at concurrency {concurrency}"
+        )
+        self.stdout.write(latency_line('checkout', ok))
+
+        errors = {}
+        for _, error in outcomes:
+            if error is not None:
+                errors[error] = errors.get(error, 0) + 1
+        for error, count in sorted(errors.items(), key=lambda item: -item[1]):
+            self.stdout.write(f"  {count} x {error}")
+        return throughput
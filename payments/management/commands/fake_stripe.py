@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from payments.fakestripe import make_server
+
+
+class Command(BaseCommand):
+    help = "Run a local fake of the Stripe Checkout Session API for load tests"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=12111)
+        parser.add_argument('--latency-ms', type=float, default=0, help="Fixed latency added to each API call")
+        parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra latency up to this value")
+        parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of API calls answered with a 500")
+        parser.add_argument('--webhook-url', help="Where to deliver signed checkout.session.completed events")
+
+    def handle(self, *args, **options):
+        server = make_server(
+            host=options['host'],
+            port=options['port'],
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            error_rate=options['error_rate'],
+            webhook_url=options['webhook_url'],
+            webhook_secret=settings.STRIPE_WEBHOOK_SECRET,
+        )
+        self.stdout.write(
+            f"Fake Stripe listening on {server.state.base_url} "
+            f"(set STRIPE_API_BASE to this URL)"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,118 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+import requests
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.tokens import AccessToken
+from payments.loadtest import latency_line, loadtest_buyers, loadtest_property
+from payments.models import PropertyUnlock
+
+STEPS = ['checkout', 'pay', 'success', 'confirm', 'total']
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive simulated property unlock purchases end to end against a running "
+        "server that has STRIPE_API_BASE pointed at fake_stripe"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000', help="Django server under test")
+        parser.add_argument('--stripe-url', default='http://127.0.0.1:12111', help="fake_stripe server")
+        parser.add_argument('--purchases', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--slug', help="Property to unlock; a load-test listing is created if omitted")
+
+    def handle(self, *args, **options):
+        property_obj = loadtest_property(options['slug'])
+        buyers = loadtest_buyers(options['purchases'])
+
+        """Start from a clean slate so every buyer goes through checkout"""
+        PropertyUnlock.objects.filter(user__in=buyers, property=property_obj).delete()
+
+        tokens = [str(AccessToken.for_user(buyer)) for buyer in buyers]
+        local = threading.local()
+
+        def purchase(token):
+            if not hasattr(local, 'http'):
+                local.http = requests.Session()
+            return self._purchase(local.http, options, property_obj.slug, token)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            results = list(pool.map(purchase, tokens))
+        elapsed = time.perf_counter() - started
+
+        completed = [timings for timings, error in results if error is None]
+        errors = {}
+        for _, error in results:
+            if error is not None:
+                errors[error] = errors.get(error, 0) + 1
+
+        self.stdout.write(
+            f"{len(completed)}/{len(results)} purchases in {elapsed:.2f}s "
+            f"({len(completed) / elapsed:.1f}/s) at concurrency {options['concurrency']}"
+        )
+        for step in STEPS:
+            self.stdout.write(latency_line(step, [timings[step] for timings in completed]))
+        for error, count in sorted(errors.items(), key=lambda item: -item[1]):
+            self.stdout.write(f"  {count} x {error}")
+
+        unlocked = PropertyUnlock.objects.filter(
+            user__in=buyers,
+            property=property_obj,
+            payment_status='succeeded'
+        ).count()
+        self.stdout.write(f"Unlocks marked succeeded: {unlocked}")
+
+    def _purchase(self, http, options, slug, token):
+        timings = {}
+        started = time.perf_counter()
+        try:
+            step = time.perf_counter()
+            response = http.post(
+                f"{options['base_url']}/api/v1/payments/properties/{slug}/unlock/",
+                headers={'Authorization': f"Bearer {token}"},
+                timeout=30
+            )
+            timings['checkout'] = time.perf_counter() - step
+            if response.status_code not in (200, 201):
+                return timings, f"checkout HTTP {response.status_code}"
+            session_id = response.json()['data']['session_id']
+
+            step = time.perf_counter()
+            response = http.post(f"{options['stripe_url']}/_fake/sessions/{session_id}/pay", timeout=30)
+            timings['pay'] = time.perf_counter() - step
+            if response.status_code != 200:
+                return timings, f"pay HTTP {response.status_code}"
+
+            step = time.perf_counter()
+            response = http.get(
+                f"{options['base_url']}/api/v1/payments/properties/{slug}/payment-success/",
+                params={'session_id': session_id},
+                allow_redirects=False,
+                timeout=30
+            )
+            timings['success'] = time.perf_counter() - step
+            location = response.headers.get('Location', '')
+            if response.status_code != 302 or '/payment/error' in location:
+                message = parse_qs(urlsplit(location).query).get('message', [response.status_code])[0]
+                return timings, f"success {message}"
+
+            """Not yet confirmed by the webhook: poll like the frontend confirming page"""
+            step = time.perf_counter()
+            if '/payment/confirming' in location:
+                response = http.get(
+                    f"{options['base_url']}/api/v1/payments/sessions/{session_id}/status/",
+                    params={'wait': 10},
+                    timeout=30
+                )
+                if response.status_code != 200 or response.json()['data']['status'] != 'succeeded':
+                    return timings, f"confirm HTTP {response.status_code}"
+            timings['confirm'] = time.perf_counter() - step
+        except requests.RequestException as e:
+            return timings, type(e).__name__
+
+        timings['total'] = time.perf_counter() - started
+        return {key: value * 1000 for key, value in timings.items()}, None
@@ -0,0 +1,31 @@
+import time
+from django.core.management.base import BaseCommand
+from payments.inbox import process_batch, inbox_stats
+
+
+class Command(BaseCommand):
+    help = "Process verified Stripe webhook events from the inbox, oldest first"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help="Events claimed per batch")
+        parser.add_argument('--loop', action='store_true', help="Keep draining the inbox until interrupted")
+        parser.add_argument('--interval', type=float, default=1.0, help="Seconds to sleep when the inbox is empty")
+        parser.add_argument('--stats', action='store_true', help="Print queue depth, then exit")
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            for key, value in inbox_stats().items():
+                self.stdout.write(f"{key}: {value}")
+            return
+
+        while True:
+            processed, failed = process_batch(options['batch_size'])
+            if processed or failed:
+                self.stdout.write(f"Processed {processed}, failed {failed}")
+
+            if not options['loop']:
+                break
+
+            """Only sleep once the due queue is drained"""
+            if processed + failed < options['batch_size']:
+                time.sleep(options['interval'])
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from payments.sweeper import archive_unlocks, sweep_pending
+
+
+class Command(BaseCommand):
+    help = "Expire abandoned pending unlocks after reconciling with Stripe, then archive old failed ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200, help="Unlock rows read per batch")
+        parser.add_argument('--max-batches', type=int, default=50, help="Stop sweeping after this many batches")
+        parser.add_argument(
+            '--archive-days',
+            type=int,
+            default=settings.UNLOCK_ARCHIVE_AFTER_DAYS,
+            help="Archive failed and expired unlocks older than this"
+        )
+        parser.add_argument('--skip-archive', action='store_true', help="Only sweep pending unlocks")
+
+    def handle(self, *args, **options):
+        counts = sweep_pending(options['batch_size'], options['max_batches'])
+        self.stdout.write(
+            f"Pending sweep: {counts['succeeded']} succeeded, {counts['expired']} expired, "
+            f"{counts['skipped']} awaiting webhook, {counts['errors']} Stripe errors"
+        )
+
+        if not options['skip_archive']:
+            archived = archive_unlocks(options['archive_days'], options['batch_size'])
+            self.stdout.write(f"Archived {archived} failed or expired unlocks")
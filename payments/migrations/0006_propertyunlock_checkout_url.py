@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_remove_systemsettings_createdat_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyunlock',
+            name='checkout_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyunlock',
+            name='checkout_url',
+            field=models.URLField(blank=True, max_length=2048, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_stripewebhookevent'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='propertyunlock',
+            name='stripe_checkout_session_id',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_propertyunlock_shared_session'),
+        ('property', '0018_user_statistics'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedPropertyUnlock',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('user_id', models.UUIDField(db_index=True)),
+                ('property_id', models.UUIDField()),
+                ('stripe_checkout_session_id', models.CharField(max_length=255)),
+                ('stripe_payment_intent_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('amount_paid', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('currency', models.CharField(max_length=3)),
+                ('payment_status', models.CharField(max_length=20)),
+                ('createdAt', models.DateTimeField()),
+                ('updatedAt', models.DateTimeField()),
+                ('archivedAt', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived Property Unlock',
+                'verbose_name_plural': 'Archived Property Unlocks',
+                'ordering': ['-createdAt'],
+            },
+        ),
+        migrations.AlterField(
+            model_name='propertyunlock',
+            name='payment_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('succeeded', 'Succeeded'), ('failed', 'Failed'), ('refunded', 'Refunded'), ('expired', 'Expired')], default='pending', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='propertyunlock',
+            index=models.Index(fields=['user', 'property', 'payment_status'], name='payments_pr_user_id_2e56c6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyunlock',
+            index=models.Index(fields=['payment_status', 'createdAt'], name='payments_pr_payment_9425ca_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:20
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0009_unlock_expiry_and_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRevenue',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('updatedAt', models.DateTimeField(auto_now=True)),
+                ('day', models.DateField()),
+                ('currency', models.CharField(max_length=3)),
+                ('property_type', models.CharField(max_length=255)),
+                ('unlock_count', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+            ],
+            options={
+                'verbose_name': 'Daily Revenue',
+                'verbose_name_plural': 'Daily Revenue',
+                'ordering': ['-day'],
+                'unique_together': {('day', 'currency', 'property_type')},
+            },
+        ),
+    ]
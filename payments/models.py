@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 import uuid
 
 User = get_user_model()
@@ -51,6 +52,7 @@ class PropertyUnlock(TimeStampedModel):
         ('succeeded', 'Succeeded'),
         ('failed', 'Failed'),
         ('refunded', 'Refunded'),
+        ('expired', 'Expired'),
     ]
     
     user = models.ForeignKey(
@@ -63,8 +65,10 @@ class PropertyUnlock(TimeStampedModel):
         on_delete=models.CASCADE,
         related_name='unlocks'
     )
-    stripe_checkout_session_id = models.CharField(max_length=255, unique=True)
-    stripe_payment_intent_id = models.CharField(max_length=255, null=True, blank=True)
+    stripe_checkout_session_id = models.CharField(max_length=255, db_index=True)
+    stripe_payment_intent_id = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    checkout_url = models.URLField(max_length=2048, null=True, blank=True)
+    checkout_expires_at = models.DateTimeField(null=True, blank=True)
     
     amount_paid = models.DecimalField(max_digits=10, decimal_places=2)
     currency = models.CharField(max_length=3, default='USD')
@@ -82,6 +86,92 @@ class PropertyUnlock(TimeStampedModel):
         verbose_name_plural = 'Property Unlocks'
         unique_together = ['user', 'property']
         ordering = ['-createdAt']
+        indexes = [
+            models.Index(fields=['user', 'property', 'payment_status']),
+            models.Index(fields=['payment_status', 'createdAt']),
+        ]
     
     def __str__(self):
-        return f"{self.user.username} - {self.property.propertyName} ({self.payment_status})"
\ No newline at end of file
+        return f"{self.user.username} - {self.property.propertyName} ({self.payment_status})"
+
+
+
+class ArchivedPropertyUnlock(models.Model):
+    """Failed and expired unlocks moved out of PropertyUnlock by the sweep_unlocks command"""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    user_id = models.UUIDField(db_index=True)
+    property_id = models.UUIDField()
+    stripe_checkout_session_id = models.CharField(max_length=255)
+    stripe_payment_intent_id = models.CharField(max_length=255, null=True, blank=True)
+    amount_paid = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3)
+    payment_status = models.CharField(max_length=20)
+    createdAt = models.DateTimeField()
+    updatedAt = models.DateTimeField()
+    archivedAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Archived Property Unlock'
+        verbose_name_plural = 'Archived Property Unlocks'
+        ordering = ['-createdAt']
+
+    def __str__(self):
+        return f"{self.user_id} - {self.property_id} ({self.payment_status})"
+
+
+class DailyRevenue(TimeStampedModel):
+    """
+    Gross unlock sales per day, currency and property type.
+
+    Incremented as unlocks succeed and rebuilt by the backfill_revenue command.
+    Refunds are not deducted.
+    """
+
+    day = models.DateField()
+    currency = models.CharField(max_length=3)
+    property_type = models.CharField(max_length=255)
+    unlock_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = 'Daily Revenue'
+        verbose_name_plural = 'Daily Revenue'
+        unique_together = ['day', 'currency', 'property_type']
+        ordering = ['-day']
+
+    def __str__(self):
+        return f"{self.day} {self.currency} {self.property_type}: {self.revenue}"
+
+class StripeWebhookEvent(TimeStampedModel):
+    """Inbox of verified Stripe webhook events, processed by the process_stripe_events worker"""
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('processed', 'Processed'),
+        ('failed', 'Failed'),
+    ]
+
+    event_id = models.CharField(max_length=255, unique=True)
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField()
+    stripe_created = models.DateTimeField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Stripe Webhook Event'
+        verbose_name_plural = 'Stripe Webhook Events'
+        ordering = ['-stripe_created']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at', 'stripe_created']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} {self.event_id} ({self.status})"
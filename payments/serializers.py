@@ -2,20 +2,49 @@ from rest_framework import serializers
 from payments.models import PropertyUnlock
 
 class PropertyUnlockSerializer(serializers.ModelSerializer):
-    """Serializer for property unlock records"""
+    """
+    Serializer for property unlock records, with the property card fields.
+
+    Expects the counts annotated by MyUnlockedPropertiesAPIView and the
+    property loaded with select_related.
+    """
     
+    property_id = serializers.UUIDField(source='property.id', read_only=True)
     property_name = serializers.CharField(source='property.propertyName', read_only=True)
     property_slug = serializers.CharField(source='property.slug', read_only=True)
+    property_address = serializers.CharField(source='property.propertyAddress', read_only=True)
+    property_price = serializers.DecimalField(
+        source='property.propertyPrice', max_digits=12, decimal_places=2, read_only=True
+    )
+    property_type = serializers.CharField(source='property.propertyType', read_only=True)
+    property_bedrooms = serializers.CharField(source='property.propertyBedrooms', read_only=True)
+    property_bathrooms = serializers.CharField(source='property.propertyBathrooms', read_only=True)
+    property_parking = serializers.CharField(source='property.propertyParking', read_only=True)
+    property_feature_image = serializers.ImageField(source='property.propertyFeatureImage', read_only=True)
+    total_photos = serializers.IntegerField(read_only=True)
+    total_inspection_reports = serializers.IntegerField(read_only=True)
+    total_optional_reports = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = PropertyUnlock
         fields = [
             'id',
+            'property_id',
             'property_name',
             'property_slug',
+            'property_address',
+            'property_price',
+            'property_type',
+            'property_bedrooms',
+            'property_bathrooms',
+            'property_parking',
+            'property_feature_image',
+            'total_photos',
+            'total_inspection_reports',
+            'total_optional_reports',
             'amount_paid',
             'currency',
             'payment_status',
             'unlocked_at',
             'createdAt',
-        ]
\ No newline at end of file
+        ]
@@ -0,0 +1,85 @@
+from django.db import transaction
+from django.utils import timezone
+from .analytics import record_sales
+from .entitlements import invalidate
+from .models import PropertyUnlock
+
+"""
+Payment state transitions shared by the success redirect and the webhook worker.
+
+Each transition is a single conditional UPDATE, so replaying the same Stripe
+event or racing the success redirect never applies it twice.
+"""
+
+
+def _grant(unlocks, **changes):
+    """
+    Flip matching unlocks to succeeded, add them to the revenue rollup and
+    drop the buyers' cached entitlements.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        """Locked so a concurrent grant of the same rows cannot count them twice"""
+        granted = list(
+            unlocks.select_for_update(of=('self',)).values_list(
+                'user_id', 'currency', 'amount_paid', 'property__propertyType'
+            )
+        )
+        if not granted:
+            return 0
+
+        updated = unlocks.update(
+            payment_status='succeeded',
+            unlocked_at=now,
+            updatedAt=now,
+            **changes
+        )
+        day = timezone.localdate(now)
+        record_sales(
+            (day, currency, property_type, amount)
+            for _, currency, amount, property_type in granted
+        )
+
+    invalidate([user_id for user_id, _, _, _ in granted])
+    return updated
+
+
+def mark_checkout_succeeded(session_id, payment_intent_id=None):
+    """Flip the unlock for a paid Checkout Session to succeeded"""
+    changes = {}
+    if payment_intent_id:
+        changes['stripe_payment_intent_id'] = payment_intent_id
+
+    return _grant(
+        PropertyUnlock.objects.filter(
+            stripe_checkout_session_id=session_id,
+            payment_status__in=['pending', 'failed', 'expired']
+        ),
+        **changes
+    )
+
+
+def mark_payment_intent_succeeded(payment_intent_id):
+    return _grant(
+        PropertyUnlock.objects.filter(
+            stripe_payment_intent_id=payment_intent_id,
+            payment_status__in=['pending', 'failed', 'expired']
+        )
+    )
+
+
+def mark_payment_intent_failed(payment_intent_id):
+    """Only pending unlocks can fail; a later success must not be overwritten"""
+    return PropertyUnlock.objects.filter(
+        stripe_payment_intent_id=payment_intent_id,
+        payment_status='pending'
+    ).update(payment_status='failed', updatedAt=timezone.now())
+
+
+def mark_sessions_expired(session_ids, now=None):
+    """Pending unlocks on Checkout Sessions that can no longer be paid"""
+    now = now or timezone.now()
+    return PropertyUnlock.objects.filter(
+        stripe_checkout_session_id__in=session_ids,
+        payment_status='pending'
+    ).update(payment_status='expired', checkout_url=None, updatedAt=now)
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .entitlements import invalidate
+from .models import PropertyUnlock
+
+
+@receiver(post_save, sender=PropertyUnlock)
+def invalidate_entitlements_on_save(sender, instance, **kwargs):
+    """Only succeeded and refunded rows change what the buyer can see"""
+    if instance.payment_status in ('succeeded', 'refunded'):
+        invalidate([instance.user_id])
+
+
+@receiver(post_delete, sender=PropertyUnlock)
+def invalidate_entitlements_on_delete(sender, instance, **kwargs):
+    if instance.payment_status == 'succeeded':
+        invalidate([instance.user_id])
@@ -0,0 +1,119 @@
+from datetime import timedelta
+import stripe
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from . import gateway
+from .models import ArchivedPropertyUnlock, PropertyUnlock
+from .services import mark_checkout_succeeded, mark_sessions_expired
+
+
+def stale_pending(now):
+    """Pending unlocks whose Checkout Session can no longer be paid"""
+    return PropertyUnlock.objects.filter(payment_status='pending').filter(
+        Q(checkout_expires_at__lt=now) |
+        Q(
+            checkout_expires_at__isnull=True,
+            createdAt__lt=now - timedelta(hours=settings.PENDING_UNLOCK_STALE_HOURS)
+        )
+    )
+
+
+def sweep_pending(batch_size=200, max_batches=50):
+    """
+    Reconcile stale pending unlocks against Stripe, one session at a time.
+
+    Sessions Stripe reports as paid are granted (a missed webhook), open ones
+    are expired on Stripe first, and the rest are marked expired locally.
+    Sessions Stripe cannot be asked about right now are left for the next run.
+    """
+    now = timezone.now()
+    counts = {'succeeded': 0, 'expired': 0, 'skipped': 0, 'errors': 0}
+    after = None
+
+    for _ in range(max_batches):
+        rows = stale_pending(now).order_by('createdAt')
+        if after is not None:
+            rows = rows.filter(createdAt__gt=after)
+        rows = list(rows.values_list('stripe_checkout_session_id', 'createdAt')[:batch_size])
+        if not rows:
+            break
+        after = rows[-1][1]
+
+        for session_id in dict.fromkeys(session_id for session_id, _ in rows):
+            try:
+                session = gateway.retrieve_checkout_session(session_id)
+            except stripe.error.InvalidRequestError:
+                """Unknown to Stripe, e.g. created against another account or the fake server"""
+                counts['expired'] += mark_sessions_expired([session_id], now)
+                continue
+            except gateway.CircuitOpen:
+                counts['errors'] += 1
+                break
+            except stripe.error.StripeError:
+                counts['errors'] += 1
+                continue
+
+            if session.get('payment_status') in ('paid', 'no_payment_required'):
+                counts['succeeded'] += mark_checkout_succeeded(session_id, session.get('payment_intent'))
+            elif session.get('status') == 'open':
+                try:
+                    gateway.expire_checkout_session(session_id)
+                except (gateway.CircuitOpen, stripe.error.StripeError):
+                    counts['errors'] += 1
+                    continue
+                counts['expired'] += mark_sessions_expired([session_id], now)
+            elif session.get('status') == 'complete':
+                """Paid with a delayed method; the webhook will settle it"""
+                counts['skipped'] += 1
+            else:
+                counts['expired'] += mark_sessions_expired([session_id], now)
+
+        if len(rows) < batch_size:
+            break
+
+    return counts
+
+
+def archive_unlocks(older_than_days, batch_size=500):
+    """Move failed and expired unlocks older than `older_than_days` into ArchivedPropertyUnlock"""
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    archived = 0
+
+    while True:
+        with transaction.atomic():
+            unlocks = list(
+                PropertyUnlock.objects.select_for_update(skip_locked=True).filter(
+                    payment_status__in=['failed', 'expired'],
+                    createdAt__lt=cutoff
+                ).order_by('createdAt')[:batch_size]
+            )
+            if not unlocks:
+                break
+
+            ArchivedPropertyUnlock.objects.bulk_create(
+                [
+                    ArchivedPropertyUnlock(
+                        id=unlock.id,
+                        user_id=unlock.user_id,
+                        property_id=unlock.property_id,
+                        stripe_checkout_session_id=unlock.stripe_checkout_session_id,
+                        stripe_payment_intent_id=unlock.stripe_payment_intent_id,
+                        amount_paid=unlock.amount_paid,
+                        currency=unlock.currency,
+                        payment_status=unlock.payment_status,
+                        createdAt=unlock.createdAt,
+                        updatedAt=unlock.updatedAt,
+                    )
+                    for unlock in unlocks
+                ],
+                ignore_conflicts=True
+            )
+            PropertyUnlock.objects.filter(id__in=[unlock.id for unlock in unlocks]).delete()
+        archived += len(unlocks)
+
+        if len(unlocks) < batch_size:
+            break
+
+    return archived
@@ -1,3 +1,281 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+import stripe
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from authentication.models import Users
+from property.models import Property
+from . import gateway
+from .async_views import _attach
+from .checkout import idempotency_key, session_window
+from .fakestripe import sign_payload
+from .inbox import process_batch
+from .models import DailyRevenue, PropertyUnlock, StripeWebhookEvent, SystemSettings
+from .services import mark_checkout_succeeded
 
-# Create your tests here.
+
+class FakeGateway:
+    """Stands in for the Stripe calls in payments.gateway, replaying idempotency keys like Stripe"""
+
+    def __init__(self):
+        self.sessions = {}
+        self.by_key = {}
+        self.created = []
+        self.expired = []
+
+    def install(self, test):
+        for name in ('create_checkout_session', 'expire_checkout_session', 'retrieve_checkout_session'):
+            patcher = mock.patch.object(gateway, name, getattr(self, name.replace('_checkout_session', '')))
+            patcher.start()
+            test.addCleanup(patcher.stop)
+
+    def _session(self, session_id):
+        data = self.sessions.get(session_id)
+        if data is None:
+            raise stripe.error.InvalidRequestError(f"No such checkout.session: {session_id}", 'id')
+        return stripe.checkout.Session.construct_from(dict(data), 'sk_test')
+
+    def create(self, idempotency_key, **params):
+        if idempotency_key not in self.by_key:
+            session_id = f"cs_test_{len(self.sessions) + 1}"
+            self.sessions[session_id] = {
+                'id': session_id,
+                'url': f"https://checkout.test/{session_id}",
+                'status': 'open',
+                'payment_status': 'unpaid',
+                'payment_intent': None,
+                'line_items': len(params['line_items']),
+            }
+            self.by_key[idempotency_key] = session_id
+            self.created.append(session_id)
+        return self._session(self.by_key[idempotency_key])
+
+    def expire(self, session_id):
+        session = self._session(session_id)
+        if session['status'] != 'open':
+            raise stripe.error.InvalidRequestError("Only open Checkout Sessions can be expired", 'session')
+        self.sessions[session_id].update(status='expired', url=None)
+        self.expired.append(session_id)
+        return self._session(session_id)
+
+    def retrieve(self, session_id, timeout=None, retries=None):
+        return self._session(session_id)
+
+    def pay(self, session_id):
+        self.sessions[session_id].update(status='complete', payment_status='paid', payment_intent=f"pi_{session_id}")
+        return self.sessions[session_id]
+
+
+class PaymentsTestCase(TestCase):
+    def setUp(self):
+        SystemSettings.objects.create(property_unlock_price=Decimal('49.99'))
+        owner = Users.objects.create(email='owner@example.com', role='owner')
+        self.buyer = Users.objects.create(email='buyer@example.com')
+        self.p1, self.p2 = [
+            Property.objects.create(
+                owner=owner,
+                propertyName=f'Property {index}',
+                slug=f'property-{index}',
+                propertyAddress=f'{index} Test Street',
+                propertyType='House',
+                propertyFeatureImage='property_feature_images/test.jpg',
+            )
+            for index in (1, 2)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+        self.stripe = FakeGateway()
+        self.stripe.install(self)
+
+    def unlock(self, property_obj):
+        return self.client.post(f'/api/v1/payments/properties/{property_obj.slug}/unlock/')
+
+    def cart(self, *properties):
+        return self.client.post(
+            '/api/v1/payments/cart/checkout/',
+            {'property_slugs': [property_obj.slug for property_obj in properties]},
+            format='json'
+        )
+
+    def status_of(self, property_obj):
+        return PropertyUnlock.objects.get(user=self.buyer, property=property_obj).payment_status
+
+
+class CheckoutSessionReuseTests(PaymentsTestCase):
+    def test_repeat_checkout_in_window_reuses_session(self):
+        first = self.unlock(self.p1)
+        second = self.unlock(self.p1)
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()['data']['session_id'], first.json()['data']['session_id'])
+        self.assertEqual(len(self.stripe.created), 1)
+
+    def test_idempotency_key_changes_across_windows(self):
+        now = timezone.now()
+        window, expires_at = session_window(now)
+        next_window, next_expires_at = session_window(now + timedelta(minutes=settings.CHECKOUT_SESSION_TTL_MINUTES))
+
+        self.assertEqual(next_window, window + 1)
+        self.assertGreater(next_expires_at, expires_at)
+        self.assertEqual(
+            idempotency_key(self.buyer.id, [self.p1.id], 4999, window),
+            idempotency_key(self.buyer.id, [self.p1.id], 4999, window)
+        )
+        self.assertNotEqual(
+            idempotency_key(self.buyer.id, [self.p1.id], 4999, window),
+            idempotency_key(self.buyer.id, [self.p1.id], 4999, next_window)
+        )
+
+    def test_checkout_after_session_expired_in_window_gets_new_session(self):
+        single = self.unlock(self.p1).json()['data']['session_id']
+        self.cart(self.p1, self.p2)
+
+        again = self.unlock(self.p1)
+
+        self.assertEqual(again.status_code, 201)
+        self.assertNotEqual(again.json()['data']['session_id'], single)
+        self.assertEqual(self.stripe.sessions[again.json()['data']['session_id']]['status'], 'open')
+
+    def test_single_checkout_expires_open_cart_session(self):
+        cart = self.cart(self.p1, self.p2).json()['data']['session_id']
+
+        response = self.unlock(self.p1)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIn(cart, self.stripe.expired)
+        self.assertEqual(self.status_of(self.p1), 'pending')
+        self.assertEqual(self.status_of(self.p2), 'expired')
+
+    def test_single_checkout_grants_paid_cart_instead_of_moving(self):
+        cart = self.cart(self.p1, self.p2).json()['data']['session_id']
+        self.stripe.pay(cart)
+
+        response = self.unlock(self.p1)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.status_of(self.p1), 'succeeded')
+        self.assertEqual(self.status_of(self.p2), 'succeeded')
+        self.assertEqual(len(self.stripe.created), 1)
+
+
+class CartCheckoutTests(PaymentsTestCase):
+    def test_cart_grant_covers_every_line(self):
+        response = self.cart(self.p1, self.p2)
+        session_id = response.json()['data']['session_id']
+        session = self.stripe.pay(session_id)
+
+        granted = mark_checkout_succeeded(session_id, session['payment_intent'])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.stripe.sessions[session_id]['line_items'], 2)
+        self.assertEqual(granted, 2)
+        self.assertEqual(self.status_of(self.p1), 'succeeded')
+        self.assertEqual(self.status_of(self.p2), 'succeeded')
+        self.assertEqual(DailyRevenue.objects.get().unlock_count, 2)
+
+    def test_repeat_cart_reuses_session(self):
+        first = self.cart(self.p1, self.p2)
+        second = self.cart(self.p2, self.p1)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()['data']['session_id'], first.json()['data']['session_id'])
+        self.assertEqual(len(self.stripe.created), 1)
+
+    def test_cart_expires_open_single_session(self):
+        single = self.unlock(self.p1).json()['data']['session_id']
+
+        cart = self.cart(self.p1, self.p2).json()['data']['session_id']
+
+        self.assertIn(single, self.stripe.expired)
+        self.assertEqual(
+            set(PropertyUnlock.objects.filter(user=self.buyer).values_list('stripe_checkout_session_id', flat=True)),
+            {cart}
+        )
+
+    def test_cart_refuses_line_whose_payment_is_settling(self):
+        single = self.unlock(self.p1).json()['data']['session_id']
+        self.stripe.sessions[single].update(status='complete', payment_status='unpaid')
+
+        response = self.cart(self.p1, self.p2)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['errors'], [self.p1.slug])
+        self.assertEqual(PropertyUnlock.objects.get(user=self.buyer, property=self.p1).stripe_checkout_session_id, single)
+
+    def test_async_attach_expires_cart_session(self):
+        cart = self.cart(self.p1, self.p2).json()['data']['session_id']
+        now = timezone.now()
+        _, expires_at = session_window(now)
+        new_session = self.stripe.create('single-async', line_items=[{}])
+
+        result = _attach(self.buyer, self.p1, new_session, expires_at, Decimal('49.99'), now)
+
+        self.assertEqual(result, 'attached')
+        self.assertIn(cart, self.stripe.expired)
+        self.assertEqual(
+            PropertyUnlock.objects.get(user=self.buyer, property=self.p1).stripe_checkout_session_id,
+            new_session.id
+        )
+        self.assertEqual(self.status_of(self.p2), 'expired')
+
+
+@override_settings(STRIPE_WEBHOOK_SECRET='whsec_test')
+class WebhookConfirmationTests(PaymentsTestCase):
+    def deliver(self, event):
+        payload = json.dumps(event)
+        return self.client.post(
+            '/api/v1/payments/webhooks/stripe/',
+            data=payload,
+            content_type='application/json',
+            HTTP_STRIPE_SIGNATURE=sign_payload(payload, settings.STRIPE_WEBHOOK_SECRET)
+        )
+
+    def completed_event(self, session):
+        return {
+            'id': 'evt_test_1',
+            'object': 'event',
+            'type': 'checkout.session.completed',
+            'created': int(timezone.now().timestamp()),
+            'data': {'object': session},
+        }
+
+    def test_same_event_processed_twice_grants_once(self):
+        session_id = self.cart(self.p1, self.p2).json()['data']['session_id']
+        event = self.completed_event(self.stripe.pay(session_id))
+
+        self.assertEqual(self.deliver(event).status_code, 200)
+        self.assertEqual(self.deliver(event).status_code, 200)
+        self.assertEqual(StripeWebhookEvent.objects.count(), 1)
+        self.assertEqual(process_batch(), (1, 0))
+
+        """A worker that crashed after applying the event runs it again"""
+        StripeWebhookEvent.objects.update(status='pending')
+        self.assertEqual(process_batch(), (1, 0))
+
+        self.assertEqual(self.status_of(self.p1), 'succeeded')
+        self.assertEqual(self.status_of(self.p2), 'succeeded')
+        self.assertEqual(DailyRevenue.objects.get().unlock_count, 2)
+
+    def test_status_reports_webhook_confirmation(self):
+        session_id = self.unlock(self.p1).json()['data']['session_id']
+        self.deliver(self.completed_event(self.stripe.pay(session_id)))
+        process_batch()
+
+        response = self.client.get(f'/api/v1/payments/sessions/{session_id}/status/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['status'], 'succeeded')
+        self.assertEqual(response.json()['data']['property_slugs'], [self.p1.slug])
+
+    def test_status_rejects_non_finite_wait(self):
+        session_id = self.unlock(self.p1).json()['data']['session_id']
+
+        for wait in ('nan', 'inf', '-inf'):
+            with self.subTest(wait=wait):
+                response = self.client.get(f'/api/v1/payments/sessions/{session_id}/status/', {'wait': wait})
+                self.assertEqual(response.status_code, 400)
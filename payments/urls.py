@@ -4,13 +4,31 @@ from .views import (
     PropertyPaymentSuccessAPIView,
     PropertyPaymentCancelAPIView,
     StripeWebhookAPIView,
-    MyUnlockedPropertiesAPIView
+    MyUnlockedPropertiesAPIView,
+    CartCheckoutAPIView,
+    CartPaymentSuccessAPIView,
+    CartPaymentCancelAPIView,
+    RevenueAnalyticsAPIView,
+    PaymentSessionStatusAPIView,
+)
+from .async_views import (
+    AsyncPropertyUnlockCreateCheckoutView,
+    AsyncPropertyPaymentSuccessView,
+    AsyncStripeWebhookView,
 )
 
 urlpatterns = [
     path('properties/<slug:slug>/unlock/', PropertyUnlockCreateCheckoutAPIView.as_view(), name='property-unlock'),
     path('properties/<slug:slug>/payment-success/', PropertyPaymentSuccessAPIView.as_view(), name='payment-success'),
     path('properties/<slug:slug>/payment-cancel/', PropertyPaymentCancelAPIView.as_view(), name='payment-cancel'),
+    path('cart/checkout/', CartCheckoutAPIView.as_view(), name='cart-checkout'),
+    path('cart/payment-success/', CartPaymentSuccessAPIView.as_view(), name='cart-payment-success'),
+    path('cart/payment-cancel/', CartPaymentCancelAPIView.as_view(), name='cart-payment-cancel'),
+    path('sessions/<str:session_id>/status/', PaymentSessionStatusAPIView.as_view(), name='payment-session-status'),
     path('webhooks/stripe/', StripeWebhookAPIView.as_view(), name='stripe-webhook'),
     path('my-unlocked-properties/', MyUnlockedPropertiesAPIView.as_view(), name='my-unlocked-properties'),
+    path('admin/revenue/', RevenueAnalyticsAPIView.as_view(), name='revenue-analytics'),
+    path('async/properties/<slug:slug>/unlock/', AsyncPropertyUnlockCreateCheckoutView.as_view(), name='async-property-unlock'),
+    path('async/properties/<slug:slug>/payment-success/', AsyncPropertyPaymentSuccessView.as_view(), name='async-payment-success'),
+    path('async/webhooks/stripe/', AsyncStripeWebhookView.as_view(), name='async-stripe-webhook'),
 ]
\ No newline at end of file
@@ -5,19 +5,55 @@ from .serializers import *
 from property.views import CustomResponseMixin
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from property.models import Property
+from property.models import Property, PropertyImage, PropertyInspectionReport, PropertyOptionalReport
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
+import math
 import stripe
+from decimal import Decimal
 from django.conf import settings
 from rest_framework import status
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.http import HttpResponse
 from django.shortcuts import redirect
+from django.db import transaction
+from . import gateway
+from .gateway import CircuitOpen
+from .checkout import (
+    attach_session, idempotency_key, line_item, release_open_sessions, reusable_session_id, session_window
+)
+from .inbox import record_event
+from .confirmation import session_status, wait_for_confirmation
+from urllib.parse import urlencode
+from .analytics import revenue_report
+from utils.permissions import IsAdmin
+from datetime import date, timedelta
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
 
 
+def payments_unavailable(view, retry_after):
+    """503 telling the buyer to retry, instead of holding the worker while Stripe struggles"""
+    response = view.error_response(
+        message="Payments are temporarily unavailable, please try again shortly",
+        errors="Our payment provider is not responding",
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def checkout_in_progress(view, properties):
+    """409 for properties whose earlier checkout is being paid or could not be closed"""
+    return view.error_response(
+        message="Checkout already in progress",
+        errors=[property_obj.slug for property_obj in properties],
+        status_code=status.HTTP_409_CONFLICT
+    )
+
 class PropertyUnlockCreateCheckoutAPIView(CustomResponseMixin, APIView):
     """
     API view to create a Stripe checkout session for unlocking a property.
@@ -30,89 +66,114 @@ class PropertyUnlockCreateCheckoutAPIView(CustomResponseMixin, APIView):
         try:
             property_obj = get_object_or_404(Property, slug=slug)
             
-            if property_obj.owner == request.user:
+            if property_obj.owner_id == request.user.id:
                 return self.error_response(
                     message="Cannot unlock own property",
                     errors="You are the owner",
                     status_code=status.HTTP_400_BAD_REQUEST
                 )
             
-            if property_obj.is_unlocked_by(request.user):
-                return self.error_response(
-                    message="Property already unlocked",
-                    errors="You already have access",
-                    status_code=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Clean up any old pending attempts
-            PropertyUnlock.objects.filter(
-                user=request.user,
-                property=property_obj,
-                payment_status='pending'
-            ).delete()
-            
             settings_obj = SystemSettings.get_settings()
-            unlock_price = settings_obj.property_unlock_price  # ← should be in AUD, e.g. 49.99
-            
-            # Build success/cancel URLs (backend verifies → redirects to frontend)
-            base_url = f"{request.scheme}://{request.get_host()}"
+            """A freshly created settings row still holds the float field default"""
+            unlock_price = Decimal(str(settings_obj.property_unlock_price))  # ← should be in AUD, e.g. 49.99
+            unit_amount = int((unlock_price * 100).to_integral_value())  # e.g. 4999 for A$49.99
             
-            success_url = (
-                f"{base_url}"
-                f"/api/v1/payments/properties/{slug}/payment-success/"
-                f"?session_id={{CHECKOUT_SESSION_ID}}"
-            )
-            cancel_url = (
-                f"{base_url}"
-                f"/api/v1/payments/properties/{slug}/payment-cancel/"
-            )
-            
-            checkout_session = stripe.checkout.Session.create(
-                payment_method_types=['card'],
-                line_items=[
-                    {
-                        'price_data': {
-                            'currency': 'aud',  # ← Changed to AUD
-                            'unit_amount': int(float(unlock_price) * 100),  # e.g. 4999 for A$49.99
-                            'product_data': {
-                                'name': f'Unlock: {property_obj.propertyName}',
-                                'description': 'Full access to property details',
-                            },
-                        },
-                        'quantity': 1,
+            with transaction.atomic():
+                """
+                Lock the buyer's row so concurrent clicks are serialized and
+                only the first one can reach Stripe
+                """
+                User.objects.select_for_update().get(pk=request.user.pk)
+                
+                unlock = PropertyUnlock.objects.select_for_update().filter(
+                    user=request.user,
+                    property=property_obj
+                ).first()
+                
+                if unlock and unlock.payment_status == 'succeeded':
+                    return self.error_response(
+                        message="Property already unlocked",
+                        errors="You already have access",
+                        status_code=status.HTTP_400_BAD_REQUEST
+                    )
+                
+                now = timezone.now()
+                
+                """Reuse a still-open session instead of calling Stripe again"""
+                if unlock and reusable_session_id([unlock], [property_obj.id], now, unit_amount):
+                    return self.success_response(
+                        message="Checkout session reused",
+                        data=self._session_data(unlock, property_obj),
+                        status_code=status.HTTP_200_OK
+                    )
+                
+                """The unlock may sit on another open session, e.g. a cart; close it before moving"""
+                held = release_open_sessions([unlock], now) if unlock else set()
+                if unlock and unlock.payment_status == 'succeeded':
+                    return self.error_response(
+                        message="Property already unlocked",
+                        errors="You already have access",
+                        status_code=status.HTTP_400_BAD_REQUEST
+                    )
+                if held:
+                    return checkout_in_progress(self, [property_obj])
+                
+                # Build success/cancel URLs (backend verifies → redirects to frontend)
+                base_url = f"{request.scheme}://{request.get_host()}"
+                
+                success_url = (
+                    f"{base_url}"
+                    f"/api/v1/payments/properties/{slug}/payment-success/"
+                    f"?session_id={{CHECKOUT_SESSION_ID}}"
+                )
+                cancel_url = (
+                    f"{base_url}"
+                    f"/api/v1/payments/properties/{slug}/payment-cancel/"
+                )
+                
+                window, expires_at = session_window(now)
+                
+                checkout_session = gateway.create_checkout_session(
+                    payment_method_types=['card'],
+                    line_items=[line_item(property_obj, unit_amount)],
+                    mode='payment',
+                    success_url=success_url,
+                    cancel_url=cancel_url,
+                    expires_at=int(expires_at.timestamp()),
+                    metadata={
+                        'user_id': str(request.user.id),
+                        'property_id': str(property_obj.id),
+                        'property_slug': property_obj.slug,
                     },
-                ],
-                mode='payment',
-                success_url=success_url,
-                cancel_url=cancel_url,
-                metadata={
-                    'user_id': str(request.user.id),
-                    'property_id': str(property_obj.id),
-                    'property_slug': property_obj.slug,
-                }
-            )
-            
-            PropertyUnlock.objects.create(
-                user=request.user,
-                property=property_obj,
-                stripe_checkout_session_id=checkout_session.id,
-                amount_paid=unlock_price,
-                currency='AUD',  # ← Updated
-                payment_status='pending'
-            )
+                    idempotency_key=idempotency_key(
+                        request.user.id, [property_obj.id], unit_amount, window,
+                        replaces=[unlock.stripe_checkout_session_id] if unlock else ()
+                    ),
+                )
+                
+                """One unlock row per user and property: replace a stale attempt in place"""
+                if unlock is None:
+                    unlock = PropertyUnlock(user=request.user, property=property_obj)
+                unlock.stripe_checkout_session_id = checkout_session.id
+                unlock.stripe_payment_intent_id = None
+                unlock.checkout_url = checkout_session.url
+                unlock.checkout_expires_at = expires_at
+                unlock.amount_paid = unlock_price
+                unlock.currency = 'AUD'  # ← Updated
+                unlock.payment_status = 'pending'
+                unlock.unlocked_at = None
+                unlock.save()
             
             return self.success_response(
                 message="Checkout session created",
-                data={
-                    'checkout_url': checkout_session.url,
-                    'session_id': checkout_session.id,
-                    'amount': float(unlock_price),
-                    'currency': 'AUD',  # ← Updated in response too
-                    'property_name': property_obj.propertyName,
-                },
+                data=self._session_data(unlock, property_obj),
                 status_code=status.HTTP_201_CREATED
             )
         
+        except CircuitOpen as e:
+            return payments_unavailable(self, e.retry_after)
+        except gateway.TRANSIENT_ERRORS:
+            return payments_unavailable(self, settings.STRIPE_BREAKER_COOLDOWN_SECONDS)
         except stripe.error.StripeError as e:
             return self.error_response(
                 message="Stripe error",
@@ -128,12 +189,24 @@ class PropertyUnlockCreateCheckoutAPIView(CustomResponseMixin, APIView):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _session_data(self, unlock, property_obj):
+        return {
+            'checkout_url': unlock.checkout_url,
+            'session_id': unlock.stripe_checkout_session_id,
+            'amount': float(unlock.amount_paid),
+            'currency': unlock.currency,  # ← Updated in response too
+            'property_name': property_obj.propertyName,
+            'expires_at': unlock.checkout_expires_at,
+        }
+
 class PropertyPaymentSuccessAPIView(APIView):
     """
     Handle successful payment redirect.
     
-    CRITICAL: This endpoint verifies payment with Stripe and updates database
-    BEFORE redirecting to frontend. This ensures payment is confirmed.
+    Webhook-first: if the webhook worker has already confirmed the unlock,
+    redirect straight to the property. Otherwise hand the browser to the
+    frontend "confirming" page, which polls PaymentSessionStatusAPIView.
+    Stripe is never called on this request.
     """
     
     permission_classes = []
@@ -151,37 +224,21 @@ class PropertyPaymentSuccessAPIView(APIView):
             )
         
         try:
-            stripe_session = stripe.checkout.Session.retrieve(session_id)
-            if stripe_session.get('payment_status') != 'paid':
-                return redirect(
-                    f"{settings.FRONTEND_BASE_URL}/payment/error?message=payment_not_completed"
-                )
+            payment_status, slugs = session_status(session_id)
             
-            try:
-                unlock = PropertyUnlock.objects.get(
-                    stripe_checkout_session_id=session_id
-                )
-            except PropertyUnlock.DoesNotExist:
+            if payment_status is None:
                 return redirect(
                     f"{settings.FRONTEND_BASE_URL}/payment/error?message=unlock_not_found"
                 )
             
-            if unlock.payment_status != 'succeeded':
-                unlock.stripe_payment_intent_id = stripe_session.get('payment_intent')
-                unlock.payment_status = 'succeeded'
-                unlock.unlocked_at = timezone.now()
-                unlock.save()
+            if payment_status == 'succeeded':
+                return redirect(
+                    f"{settings.FRONTEND_BASE_URL}/property_details/{slug}/"
+                )
             
             return redirect(
-                f"{settings.FRONTEND_BASE_URL}/property_details/{slug}/"
-            )
-        
-        except stripe.error.StripeError as e:
-            """
-            Stripe API error
-            """
-            return redirect(
-                f"{settings.FRONTEND_BASE_URL}/payment/error?message=stripe_error"
+                f"{settings.FRONTEND_BASE_URL}/payment/confirming"
+                f"?{urlencode({'session_id': session_id, 'property_slug': slug})}"
             )
         
         except Exception as e:
@@ -223,14 +280,282 @@ class PropertyPaymentCancelAPIView(APIView):
             )
 
 
+class CartCheckoutAPIView(CustomResponseMixin, APIView):
+    """
+    Create one Stripe checkout session for several properties.
+
+    Each property is a line item; all unlocks share the session and are
+    flipped to succeeded together by the success redirect or webhook.
+    A line still on another open session has that session expired (or
+    granted, if Stripe says it was paid) before it joins the cart.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        try:
+            slugs = request.data.get('property_slugs')
+            if not isinstance(slugs, list) or not slugs:
+                return self.error_response(
+                    message="property_slugs is required",
+                    errors="Provide a non-empty list of property slugs",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            slugs = list(dict.fromkeys(str(slug) for slug in slugs))
+            if len(slugs) > settings.CART_MAX_ITEMS:
+                return self.error_response(
+                    message="Too many properties",
+                    errors=f"A cart can hold at most {settings.CART_MAX_ITEMS} properties",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            properties = list(Property.objects.filter(slug__in=slugs).order_by('propertyName'))
+            missing = set(slugs) - {property_obj.slug for property_obj in properties}
+            if missing:
+                return self.error_response(
+                    message="Property not found",
+                    errors=sorted(missing),
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            
+            owned = [property_obj.slug for property_obj in properties if property_obj.owner_id == request.user.id]
+            if owned:
+                return self.error_response(
+                    message="Cannot unlock own property",
+                    errors=owned,
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            property_ids = [property_obj.id for property_obj in properties]
+            settings_obj = SystemSettings.get_settings()
+            unlock_price = Decimal(str(settings_obj.property_unlock_price))
+            unit_amount = int((unlock_price * 100).to_integral_value())
+            
+            with transaction.atomic():
+                """Serialize concurrent checkouts by the same buyer"""
+                User.objects.select_for_update().get(pk=request.user.pk)
+                
+                unlocks = list(
+                    PropertyUnlock.objects.select_for_update().filter(
+                        user=request.user,
+                        property_id__in=property_ids
+                    )
+                )
+                
+                unlocked = [unlock.property_id for unlock in unlocks if unlock.payment_status == 'succeeded']
+                if unlocked:
+                    return self.error_response(
+                        message="Property already unlocked",
+                        errors=[property_obj.slug for property_obj in properties if property_obj.id in unlocked],
+                        status_code=status.HTTP_400_BAD_REQUEST
+                    )
+                
+                now = timezone.now()
+                
+                if reusable_session_id(unlocks, property_ids, now, unit_amount):
+                    return self.success_response(
+                        message="Checkout session reused",
+                        data=self._session_data(unlocks[0], properties),
+                        status_code=status.HTTP_200_OK
+                    )
+                
+                """Lines still on another open session (a single checkout or older cart) must be closed first"""
+                held = release_open_sessions(unlocks, now)
+                unlocked = [unlock.property_id for unlock in unlocks if unlock.payment_status == 'succeeded']
+                if unlocked:
+                    return self.error_response(
+                        message="Property already unlocked",
+                        errors=[property_obj.slug for property_obj in properties if property_obj.id in unlocked],
+                        status_code=status.HTTP_400_BAD_REQUEST
+                    )
+                if held:
+                    return checkout_in_progress(
+                        self, [property_obj for property_obj in properties if property_obj.id in held]
+                    )
+                
+                base_url = f"{request.scheme}://{request.get_host()}"
+                window, expires_at = session_window(now)
+                
+                checkout_session = gateway.create_checkout_session(
+                    payment_method_types=['card'],
+                    line_items=[line_item(property_obj, unit_amount) for property_obj in properties],
+                    mode='payment',
+                    success_url=(
+                        f"{base_url}/api/v1/payments/cart/payment-success/"
+                        f"?session_id={{CHECKOUT_SESSION_ID}}"
+                    ),
+                    cancel_url=f"{base_url}/api/v1/payments/cart/payment-cancel/",
+                    expires_at=int(expires_at.timestamp()),
+                    metadata={
+                        'user_id': str(request.user.id),
+                        'property_count': str(len(properties)),
+                    },
+                    idempotency_key=idempotency_key(
+                        request.user.id, property_ids, unit_amount, window,
+                        replaces=[unlock.stripe_checkout_session_id for unlock in unlocks]
+                    ),
+                )
+                
+                attach_session(request.user, properties, unlocks, checkout_session, expires_at, unlock_price)
+            
+            return self.success_response(
+                message="Checkout session created",
+                data={
+                    'checkout_url': checkout_session.url,
+                    'session_id': checkout_session.id,
+                    'amount': float(unlock_price * len(properties)),
+                    'currency': 'AUD',
+                    'properties': [property_obj.slug for property_obj in properties],
+                    'expires_at': expires_at,
+                },
+                status_code=status.HTTP_201_CREATED
+            )
+        
+        except CircuitOpen as e:
+            return payments_unavailable(self, e.retry_after)
+        except gateway.TRANSIENT_ERRORS:
+            return payments_unavailable(self, settings.STRIPE_BREAKER_COOLDOWN_SECONDS)
+        except stripe.error.StripeError as e:
+            return self.error_response(
+                message="Stripe error",
+                errors=str(e.user_message) if hasattr(e, 'user_message') else str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        except Exception as e:
+            return self.error_response(
+                message="Error creating checkout session",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _session_data(self, unlock, properties):
+        return {
+            'checkout_url': unlock.checkout_url,
+            'session_id': unlock.stripe_checkout_session_id,
+            'amount': float(unlock.amount_paid * len(properties)),
+            'currency': unlock.currency,
+            'properties': [property_obj.slug for property_obj in properties],
+            'expires_at': unlock.checkout_expires_at,
+        }
+
+
+class CartPaymentSuccessAPIView(APIView):
+    """
+    Handle the redirect after a cart checkout.
+    
+    Same webhook-first flow as PropertyPaymentSuccessAPIView; every unlock
+    in the session is flipped together by the webhook worker.
+    """
+    
+    permission_classes = []
+    authentication_classes = []
+    
+    def get(self, request):
+        session_id = request.GET.get('session_id')
+        
+        if not session_id:
+            return redirect(
+                f"{settings.FRONTEND_BASE_URL}/payment/error?message=session_missing"
+            )
+        
+        try:
+            payment_status, slugs = session_status(session_id)
+            
+            if payment_status is None:
+                return redirect(
+                    f"{settings.FRONTEND_BASE_URL}/payment/error?message=unlock_not_found"
+                )
+            
+            if payment_status == 'succeeded':
+                return redirect(f"{settings.FRONTEND_BASE_URL}/my-unlocked-properties")
+            
+            return redirect(
+                f"{settings.FRONTEND_BASE_URL}/payment/confirming"
+                f"?{urlencode({'session_id': session_id, 'cart': 1})}"
+            )
+        
+        except Exception as e:
+            return redirect(
+                f"{settings.FRONTEND_BASE_URL}/payment/error?message=server_error"
+            )
+
+
+class PaymentSessionStatusAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Confirmation status of a Checkout Session, polled by the frontend
+    "confirming" page.
+
+    ?wait=N long-polls for up to N seconds (capped by
+    PAYMENT_STATUS_MAX_WAIT_SECONDS, kept short because every waiting
+    request holds a sync worker) until the webhook confirms the payment.
+    A still-pending session gets one bounded Stripe retrieve as a fallback.
+    """
+    
+    permission_classes = []
+    authentication_classes = []
+    
+    def get(self, request, session_id):
+        try:
+            try:
+                wait = float(request.query_params.get('wait', 0))
+            except ValueError:
+                wait = 0
+            
+            if not math.isfinite(wait):
+                return self.error_response(
+                    message="Invalid wait",
+                    errors="wait must be a finite number of seconds",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            wait = max(0.0, min(wait, settings.PAYMENT_STATUS_MAX_WAIT_SECONDS))
+            
+            payment_status, slugs = wait_for_confirmation(session_id, wait)
+            
+            if payment_status is None:
+                return self.error_response(
+                    message="Checkout session not found",
+                    errors="No unlock references this session",
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            
+            return self.success_response(
+                message="Payment status retrieved successfully",
+                data={
+                    'session_id': session_id,
+                    'status': payment_status,
+                    'property_slugs': slugs,
+                },
+                status_code=status.HTTP_200_OK
+            )
+        
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class CartPaymentCancelAPIView(APIView):
+    """Handle a cancelled cart checkout"""
+    
+    permission_classes = []
+    authentication_classes = []
+    
+    def get(self, request):
+        return redirect(f"{settings.FRONTEND_BASE_URL}/payment/cancelled?cart=1")
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class StripeWebhookAPIView(APIView):
     """
     Handle Stripe webhooks.
     
-    This provides a backup confirmation mechanism.
-    The success endpoint confirms payment first, but webhooks
-    provide additional reliability for delayed confirmations.
+    Verified events are written to the StripeWebhookEvent inbox, keyed by
+    event ID, and processed in order by the process_stripe_events worker.
+    The success endpoint confirms payment first; webhooks provide
+    reliability for delayed confirmations.
     """
     
     permission_classes = []
@@ -264,106 +589,111 @@ class StripeWebhookAPIView(APIView):
             return HttpResponse(status=400)
         
         """
-        Handle events
+        Queue the event and acknowledge immediately;
+        process_stripe_events applies it in the background
         """
-        if event['type'] == 'checkout.session.completed':
-            session = event['data']['object']
-            self._handle_checkout_completed(session)
-        
-        elif event['type'] == 'payment_intent.succeeded':
-            payment_intent = event['data']['object']
-            self._handle_payment_succeeded(payment_intent)
-        
-        elif event['type'] == 'payment_intent.payment_failed':
-            payment_intent = event['data']['object']
-            self._handle_payment_failed(payment_intent)
+        record_event(event, payload)
         
         return HttpResponse(status=200)
-    
-    def _handle_checkout_completed(self, session):
-        """
-        Handle completed checkout session.
-        
-        Updates the unlock record to succeeded status.
-        This is a backup - the success endpoint should already handle this.
-        """
-        try:
-            session_id = session['id']
-            
-            unlock = PropertyUnlock.objects.get(
-                stripe_checkout_session_id=session_id
-            )
-            
-            """
-            Only update if not already succeeded
-            """
-            if unlock.payment_status != 'succeeded':
-                unlock.stripe_payment_intent_id = session.get('payment_intent')
-                unlock.payment_status = 'succeeded'
-                unlock.unlocked_at = timezone.now()
-                unlock.save()
-            
-        except PropertyUnlock.DoesNotExist:
-            pass
-        
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-    
-    def _handle_payment_succeeded(self, payment_intent):
-        """
-        Handle successful payment intent.
-        
-        Confirms payment success and updates unlock status.
-        """
-        try:
-            unlock = PropertyUnlock.objects.get(
-                stripe_payment_intent_id=payment_intent['id']
-            )
-            if unlock.payment_status != 'succeeded':
-                unlock.payment_status = 'succeeded'
-                unlock.unlocked_at = timezone.now()
-                unlock.save()
-        except PropertyUnlock.DoesNotExist:
-            pass
-    
-    def _handle_payment_failed(self, payment_intent):
-        """
-        Handle failed payment intent.
-        
-        Updates unlock record to failed status.
-        """
-        try:
-            unlock = PropertyUnlock.objects.get(
-                stripe_payment_intent_id=payment_intent['id']
-            )
-            unlock.payment_status = 'failed'
-            unlock.save()
-        except PropertyUnlock.DoesNotExist:
-            pass
 
 
 class MyUnlockedPropertiesAPIView(CustomResponseMixin, APIView):
     """
-    List all unlocked properties for current user.
+    List all unlocked properties for current user (paginated).
     
-    Returns a list of properties the user has successfully unlocked.
+    Each unlock carries the property card data (address, price, feature
+    image and photo/report counts). The page is built in a constant number
+    of queries: the property is joined and the counts are correlated
+    subqueries, whatever the page size.
     """
     
     permission_classes = [IsAuthenticated]
     
+    @staticmethod
+    def _count(model):
+        """Per-property row count as a correlated subquery"""
+        return Coalesce(
+            Subquery(
+                model.objects.filter(property=OuterRef('property_id'))
+                .order_by()
+                .values('property')
+                .annotate(value=Count('id'))
+                .values('value')[:1]
+            ),
+            Value(0)
+        )
+    
     def get(self, request):
         try:
             unlocks = PropertyUnlock.objects.filter(
                 user=request.user,
                 payment_status='succeeded'
-            ).select_related('property')
+            ).select_related('property').annotate(
+                total_photos=self._count(PropertyImage) + 1,
+                total_inspection_reports=self._count(PropertyInspectionReport),
+                total_optional_reports=self._count(PropertyOptionalReport),
+            ).order_by('-unlocked_at', '-createdAt')
             
-            serializer = PropertyUnlockSerializer(unlocks, many=True)
+            paginator = PageNumberPagination()
+            page = paginator.paginate_queryset(unlocks, request, view=self)
+            serializer = PropertyUnlockSerializer(page, many=True, context={'request': request})
             
             return self.success_response(
                 message="Unlocked properties retrieved successfully",
-                data=serializer.data
+                data={
+                    'count': paginator.page.paginator.count,
+                    'next': paginator.get_next_link(),
+                    'previous': paginator.get_previous_link(),
+                    'results': serializer.data,
+                }
+            )
+        
+        except NotFound as e:
+            return self.error_response(
+                message="Invalid page",
+                errors=str(e),
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class RevenueAnalyticsAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Daily unlock revenue and top property types (Admin only)
+
+    Query params: start, end (YYYY-MM-DD, default last 30 days), currency, top.
+    Served entirely from the DailyRevenue rollup.
+    """
+    
+    permission_classes = [IsAdmin]
+    
+    def get(self, request):
+        try:
+            today = timezone.localdate()
+            try:
+                end = date.fromisoformat(request.query_params['end']) if request.query_params.get('end') else today
+                start = (
+                    date.fromisoformat(request.query_params['start'])
+                    if request.query_params.get('start')
+                    else end - timedelta(days=29)
+                )
+                top = max(1, min(int(request.query_params.get('top', 5)), 50))
+            except ValueError:
+                return self.error_response(
+                    message="Invalid query parameters",
+                    errors="start and end must be YYYY-MM-DD and top an integer",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            
+            return self.success_response(
+                message="Revenue analytics retrieved successfully",
+                data=revenue_report(start, end, request.query_params.get('currency'), top),
+                status_code=status.HTTP_200_OK
             )
         
         except Exception as e:
@@ -371,4 +701,4 @@ class MyUnlockedPropertiesAPIView(CustomResponseMixin, APIView):
                 message="An error occurred",
                 errors=str(e),
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
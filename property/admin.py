@@ -6,7 +6,8 @@ from .models import (
     PropertyOptionalReport,
     PropertyFeature,
     Bookmark,
-    Inspection
+    Inspection,
+    InspectionAvailability
 )
 
 # --------------------------
@@ -156,4 +157,12 @@ class InspectionAdmin(admin.ModelAdmin):
         return obj.inspection_datetime > timezone.now()
     
     is_upcoming.boolean = True
-    is_upcoming.short_description = 'Upcoming'
\ No newline at end of file
+    is_upcoming.short_description = 'Upcoming'
+
+@admin.register(InspectionAvailability)
+class InspectionAvailabilityAdmin(admin.ModelAdmin):
+    list_display = ['property', 'starts_at', 'ends_at', 'slot_minutes', 'capacity']
+    list_filter = ['starts_at']
+    search_fields = ['property__propertyName']
+    readonly_fields = ['id', 'createdAt', 'updatedAt']
+    ordering = ['starts_at']
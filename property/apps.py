@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class PropertyConfig(AppConfig):
     name = 'property'
+
+    def ready(self):
+        from . import signals  # noqa: F401
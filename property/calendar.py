@@ -0,0 +1,110 @@
+import hashlib
+from datetime import timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from .models import Inspection, OwnerCalendarFeed
+
+INSPECTION_DURATION = timedelta(minutes=30)
+
+
+def feed_cache_key(owner_id):
+    return f'ics_feed_{owner_id}'
+
+
+def token_cache_key(token):
+    return f'ics_token_{token}'
+
+
+def invalidate_owner_feed(owner_id):
+    cache.delete(feed_cache_key(owner_id))
+
+
+def owner_id_for_token(token):
+    """Resolve a feed token to its owner, cached so polling needs no query"""
+    owner_id = cache.get(token_cache_key(token))
+    if owner_id is None:
+        owner_id = OwnerCalendarFeed.objects.filter(token=token).values_list('owner_id', flat=True).first()
+        if owner_id is None:
+            return None
+        cache.set(token_cache_key(token), owner_id, timeout=settings.ICS_FEED_CACHE_SECONDS)
+    return owner_id
+
+
+def get_owner_feed(owner_id):
+    """Cached {'body', 'etag', 'last_modified'} for an owner's feed, rebuilt on a miss"""
+    feed = cache.get(feed_cache_key(owner_id))
+    if feed is None:
+        body = build_ics(owner_id)
+        feed = {
+            'body': body,
+            'etag': '"%s"' % hashlib.md5(body.encode()).hexdigest(),
+            'last_modified': timezone.now(),
+        }
+        cache.set(feed_cache_key(owner_id), feed, timeout=settings.ICS_FEED_CACHE_SECONDS)
+    return feed
+
+
+def _escape(value):
+    return (
+        str(value or '')
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold(line):
+    """Fold content lines longer than 75 octets (RFC 5545 3.1)"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        chunk = encoded[:limit]
+        """Do not split a multi-byte character"""
+        while chunk and (chunk[-1] & 0xC0) == 0x80 and len(chunk) < len(encoded):
+            chunk = chunk[:-1]
+        parts.append(chunk.decode())
+        encoded = encoded[len(chunk):]
+    return '\r\n '.join(parts)
+
+
+def _format(moment):
+    return moment.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def build_ics(owner_id):
+    """Render every upcoming inspection across the owner's properties with one joined query"""
+    inspections = Inspection.objects.filter(
+        property__owner_id=owner_id,
+        inspection_datetime__gte=timezone.now()
+    ).select_related('property', 'user').order_by('inspection_datetime')
+
+    stamp = _format(timezone.now())
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Michael Milne//Inspection Bookings//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:Inspection Bookings',
+    ]
+    for inspection in inspections:
+        booked_by = inspection.user.full_name or inspection.user.email
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:{inspection.id}@michael-milne',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{_format(inspection.inspection_datetime)}',
+            f'DTEND:{_format(inspection.inspection_datetime + INSPECTION_DURATION)}',
+            f'SUMMARY:{_escape("Inspection: " + inspection.property.propertyName)}',
+            f'LOCATION:{_escape(inspection.property.propertyAddress)}',
+            f'DESCRIPTION:{_escape(f"Booked by {booked_by} ({inspection.user.email})")}',
+            'END:VEVENT',
+        ]
+    lines.append('END:VCALENDAR')
+
+    return '\r\n'.join(_fold(line) for line in lines) + '\r\n'
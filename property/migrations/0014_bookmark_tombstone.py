@@ -0,0 +1,44 @@
+# Generated by Django 6.0 on 2026-10-19 18:03
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0013_property_propertyprice_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookmarkTombstone',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('updatedAt', models.DateTimeField(auto_now=True)),
+                ('property_id', models.UUIDField()),
+            ],
+            options={
+                'verbose_name': 'Bookmark Tombstone',
+                'verbose_name_plural': 'Bookmark Tombstones',
+                'ordering': ['-createdAt'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='bookmark',
+            index=models.Index(fields=['user', 'createdAt'], name='property_bo_user_id_8d4762_idx'),
+        ),
+        migrations.AddField(
+            model_name='bookmarktombstone',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bookmark_tombstones', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='bookmarktombstone',
+            index=models.Index(fields=['user', 'createdAt'], name='property_bo_user_id_1a4d6f_idx'),
+        ),
+    ]
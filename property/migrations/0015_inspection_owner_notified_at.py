@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-19 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_notified(apps, schema_editor):
+    """Existing bookings were already emailed to the owner when they were made"""
+    Inspection = apps.get_model('property', 'Inspection')
+    Inspection.objects.filter(owner_notified_at__isnull=True).update(owner_notified_at=F('createdAt'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0014_bookmark_tombstone'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inspection',
+            name='owner_notified_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_notified, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='inspection',
+            index=models.Index(condition=models.Q(('owner_notified_at__isnull', True)), fields=['createdAt'], name='inspection_owner_pending_idx'),
+        ),
+    ]
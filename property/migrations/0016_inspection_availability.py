@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-19 18:08
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0015_inspection_owner_notified_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InspectionAvailability',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('updatedAt', models.DateTimeField(auto_now=True)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('slot_minutes', models.PositiveSmallIntegerField(default=30)),
+                ('capacity', models.PositiveSmallIntegerField(default=1)),
+            ],
+            options={
+                'verbose_name': 'Inspection Availability',
+                'verbose_name_plural': 'Inspection Availability',
+                'ordering': ['starts_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='inspection',
+            index=models.Index(fields=['property', 'inspection_datetime'], name='property_in_propert_1a73f3_idx'),
+        ),
+        migrations.AddField(
+            model_name='inspectionavailability',
+            name='property',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability_windows', to='property.property'),
+        ),
+        migrations.AddIndex(
+            model_name='inspectionavailability',
+            index=models.Index(fields=['property', 'starts_at'], name='property_in_propert_07e789_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 import uuid
+from datetime import timedelta
 from django.utils.text import slugify
 
 User = get_user_model()
@@ -39,6 +40,8 @@ class Property(TimeStampedModel):
     status = models.BooleanField(default=True)
     total_views = models.PositiveIntegerField(default=0)
 
+    ACTIVE_COUNT_CACHE_KEY = 'active_property_count'
+
     class Meta:
         verbose_name = 'Property'
         verbose_name_plural = 'Properties'
@@ -47,6 +50,16 @@ class Property(TimeStampedModel):
     def __str__(self):
         return self.propertyName
 
+    @classmethod
+    def active_count(cls):
+        """Site-wide active listing count, cached until a listing is saved or deleted"""
+        from django.core.cache import cache
+        count = cache.get(cls.ACTIVE_COUNT_CACHE_KEY)
+        if count is None:
+            count = cls.objects.filter(status=True).count()
+            cache.set(cls.ACTIVE_COUNT_CACHE_KEY, count, timeout=None)
+        return count
+
     def save(self, *args, **kwargs):
         if not self.slug:
             base_slug = slugify(self.propertyName)
@@ -59,8 +72,12 @@ class Property(TimeStampedModel):
         super().save(*args, **kwargs)
 
     def increment_views(self):
+        """
+        Atomic +1 on the primary. The instance may come from a lagging
+        replica, so its own total_views is only bumped for display.
+        """
+        Property.objects.filter(pk=self.pk).update(total_views=models.F('total_views') + 1)
         self.total_views += 1
-        self.save(update_fields=['total_views'])
 
     def is_unlocked_by(self, user):
         """Check if property is unlocked by user"""
@@ -68,16 +85,12 @@ class Property(TimeStampedModel):
             return False
         
         """Owner can always see their own properties"""
-        if self.owner == user:
+        if self.owner_id == user.id:
             return True
         
-        """Check if user has unlocked this property"""
-        from payments.models import PropertyUnlock
-        return PropertyUnlock.objects.filter(
-            user=user,
-            property=self,
-            payment_status='succeeded'
-        ).exists()
+        """Check the user's cached entitlement set"""
+        from payments.entitlements import unlocked_property_ids
+        return self.id in unlocked_property_ids(user)
 
     @property
     def total_photos(self):
@@ -160,21 +173,141 @@ class Bookmark(TimeStampedModel):
         verbose_name_plural = 'Bookmarks'
         ordering = ['-createdAt']
         unique_together = ['user', 'property']  # Prevent duplicate bookmarks
+        indexes = [
+            models.Index(fields=['user', 'createdAt']),
+        ]
     
     def __str__(self):
         return f"{self.user.email} bookmarked {self.property.propertyName}"
 
 
+class BookmarkTombstone(TimeStampedModel):
+    """Removed bookmarks, kept so clients can delta-sync their bookmark set"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='bookmark_tombstones')
+    property_id = models.UUIDField()
+
+    class Meta:
+        verbose_name = 'Bookmark Tombstone'
+        verbose_name_plural = 'Bookmark Tombstones'
+        ordering = ['-createdAt']
+        indexes = [
+            models.Index(fields=['user', 'createdAt']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} removed bookmark {self.property_id}"
+
+
 class Inspection(TimeStampedModel):
     """User inspection bookings for properties"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='inspections')
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='inspections')
     inspection_datetime = models.DateTimeField()
+    owner_notified_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         verbose_name = 'Inspection'
         verbose_name_plural = 'Inspections'
         ordering = ['-inspection_datetime']
+        indexes = [
+            models.Index(fields=['property', 'inspection_datetime']),
+            models.Index(
+                fields=['createdAt'],
+                condition=models.Q(owner_notified_at__isnull=True),
+                name='inspection_owner_pending_idx'
+            ),
+        ]
     
     def __str__(self):
-        return f"{self.user.email} - {self.property.propertyName} on {self.inspection_datetime}"
\ No newline at end of file
+        return f"{self.user.email} - {self.property.propertyName} on {self.inspection_datetime}"
+
+
+class InspectionAvailability(TimeStampedModel):
+    """Owner-published inspection window, split into slots of slot_minutes with per-slot capacity"""
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='availability_windows')
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+    slot_minutes = models.PositiveSmallIntegerField(default=30)
+    capacity = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        verbose_name = 'Inspection Availability'
+        verbose_name_plural = 'Inspection Availability'
+        ordering = ['starts_at']
+        indexes = [
+            models.Index(fields=['property', 'starts_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.property.propertyName}: {self.starts_at} - {self.ends_at}"
+
+    def slot_length(self):
+        return timedelta(minutes=self.slot_minutes)
+
+    def slot_bounds(self, when):
+        """Start and end of the slot containing `when`"""
+        length = self.slot_length()
+        slot_start = self.starts_at + ((when - self.starts_at) // length) * length
+        return slot_start, min(slot_start + length, self.ends_at)
+
+    def slots(self):
+        """All (start, end) slots in this window"""
+        length = self.slot_length()
+        slot_start = self.starts_at
+        while slot_start < self.ends_at:
+            yield slot_start, min(slot_start + length, self.ends_at)
+            slot_start += length
+
+
+class OwnerCalendarFeed(TimeStampedModel):
+    """Secret token giving calendar apps read access to an owner's inspection bookings"""
+    owner = models.OneToOneField(User, on_delete=models.CASCADE, related_name='calendar_feed')
+    token = models.CharField(max_length=64, unique=True)
+
+    class Meta:
+        verbose_name = 'Owner Calendar Feed'
+        verbose_name_plural = 'Owner Calendar Feeds'
+
+    def __str__(self):
+        return f"Calendar feed for {self.owner.email}"
+
+
+
+class UserStatistics(TimeStampedModel):
+    """Per-user counters kept up to date by bookmark and inspection signals"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='statistics')
+    total_bookmarks = models.PositiveIntegerField(default=0)
+    total_inspections = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'User Statistics'
+        verbose_name_plural = 'User Statistics'
+
+    def __str__(self):
+        return f"Statistics for {self.user.email}"
+
+    @classmethod
+    def for_user(cls, user):
+        """Get the user's row, counting from scratch the first time"""
+        stats = cls.objects.filter(user=user).first()
+        if stats is None:
+            stats, _ = cls.objects.get_or_create(
+                user=user,
+                defaults={
+                    'total_bookmarks': Bookmark.objects.filter(user=user).count(),
+                    'total_inspections': Inspection.objects.filter(user=user).count(),
+                }
+            )
+        return stats
+
+    @classmethod
+    def adjust(cls, user_id, field, delta):
+        """
+        Incrementally update a counter.
+
+        Users without a row yet are skipped; for_user counts them on first read.
+        """
+        rows = cls.objects.filter(user_id=user_id)
+        if delta < 0:
+            rows = rows.filter(**{f'{field}__gte': -delta})
+        rows.update(**{field: models.F(field) + delta})
@@ -0,0 +1,90 @@
+from collections import Counter
+from .models import Inspection, InspectionAvailability
+
+
+class SlotUnavailable(Exception):
+    """Requested inspection time is outside availability or the slot is full"""
+
+
+def reserve_slot(property_obj, when, exclude_inspection_id=None):
+    """
+    Check slot capacity for a booking and return the datetime to store.
+
+    Must be called inside transaction.atomic(): the availability window row is
+    locked so concurrent bookings for the same window are serialized.
+    Properties without published availability accept any time, as before.
+    """
+    window = InspectionAvailability.objects.select_for_update().filter(
+        property=property_obj,
+        starts_at__lte=when,
+        ends_at__gt=when
+    ).order_by('starts_at').first()
+
+    if window is None:
+        if InspectionAvailability.objects.filter(property=property_obj).exists():
+            raise SlotUnavailable("Requested time is outside the owner's availability.")
+        return when
+
+    slot_start, slot_end = window.slot_bounds(when)
+
+    booked = Inspection.objects.filter(
+        property=property_obj,
+        inspection_datetime__gte=slot_start,
+        inspection_datetime__lt=slot_end
+    )
+    if exclude_inspection_id:
+        booked = booked.exclude(id=exclude_inspection_id)
+
+    if booked.count() >= window.capacity:
+        raise SlotUnavailable("This inspection slot is fully booked.")
+
+    """Bookings are stored at the slot start so each slot is one index range"""
+    return slot_start
+
+
+def free_slots(property_obj, start, end):
+    """Slots with remaining capacity between start and end"""
+    windows = list(
+        InspectionAvailability.objects.filter(
+            property=property_obj,
+            starts_at__lt=end,
+            ends_at__gt=start
+        ).order_by('starts_at')
+    )
+    if not windows:
+        return []
+
+    """
+    Bookings are stored at their slot's start, so a slot already in progress
+    at `start` must be counted from that slot's start, not from `start`.
+    """
+    earliest_slot_start = min(
+        window.slot_bounds(max(start, window.starts_at))[0] for window in windows
+    )
+    booked_times = Inspection.objects.filter(
+        property=property_obj,
+        inspection_datetime__gte=earliest_slot_start,
+        inspection_datetime__lt=min(end, max(window.ends_at for window in windows))
+    ).values_list('inspection_datetime', flat=True)
+
+    booked = Counter()
+    for booked_time in booked_times:
+        for window in windows:
+            if window.starts_at <= booked_time < window.ends_at:
+                booked[(window.id, window.slot_bounds(booked_time)[0])] += 1
+                break
+
+    slots = []
+    for window in windows:
+        for slot_start, slot_end in window.slots():
+            if slot_end <= start or slot_start >= end:
+                continue
+            remaining = window.capacity - booked[(window.id, slot_start)]
+            if remaining > 0:
+                slots.append({
+                    'starts_at': slot_start,
+                    'ends_at': slot_end,
+                    'capacity': window.capacity,
+                    'remaining': remaining,
+                })
+    return slots
@@ -95,12 +95,17 @@ class PropertyListSerializer(serializers.ModelSerializer):
 
     def get_unlock_price(self, obj):
         """Get the unlock price from system settings"""
+        if 'unlock_price' in self.context:
+            return self.context['unlock_price']
         settings = SystemSettings.get_settings()
         return float(settings.property_unlock_price)
 
     def get_is_unlocked(self, obj):
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            unlocked_ids = self.context.get('unlocked_property_ids')
+            if unlocked_ids is not None:
+                return obj.owner_id == request.user.id or obj.id in unlocked_ids
             return obj.is_unlocked_by(request.user)
         return False
 
@@ -108,9 +113,38 @@ class PropertyListSerializer(serializers.ModelSerializer):
         """Check if property is bookmarked by current user"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            bookmarked_ids = self.context.get('bookmarked_property_ids')
+            if bookmarked_ids is not None:
+                return obj.id in bookmarked_ids
             return Bookmark.objects.filter(user=request.user, property=obj).exists()
         return False
 
+
+def property_list_context(request, properties):
+    """
+    Serializer context for PropertyListSerializer with per-row lookups precomputed.
+
+    Unlock price and bookmark state are fetched once for all `properties`
+    instead of once per row; unlock state comes from the buyer's cached
+    entitlement set.
+    """
+    from payments.entitlements import unlocked_property_ids
+
+    context = {
+        'request': request,
+        'unlock_price': float(SystemSettings.get_settings().property_unlock_price),
+    }
+    if request.user.is_authenticated:
+        property_ids = [obj.id for obj in properties]
+        context['bookmarked_property_ids'] = set(
+            Bookmark.objects.filter(
+                user=request.user,
+                property_id__in=property_ids
+            ).values_list('property_id', flat=True)
+        )
+        context['unlocked_property_ids'] = unlocked_property_ids(request.user)
+    return context
+
 class PropertyDetailSerializer(serializers.ModelSerializer):
     """Serializer for property detail view with related data"""
     
@@ -235,10 +269,42 @@ class InspectionSerializer(serializers.ModelSerializer):
         return value
 
 
+class InspectionAvailabilitySerializer(serializers.ModelSerializer):
+    """Serializer for owner-published inspection availability windows"""
+
+    class Meta:
+        model = InspectionAvailability
+        fields = ['id', 'starts_at', 'ends_at', 'slot_minutes', 'capacity', 'createdAt', 'updatedAt']
+        read_only_fields = ['id', 'createdAt', 'updatedAt']
+
+    def validate_slot_minutes(self, value):
+        """Validate slot length"""
+        if not 5 <= value <= 240:
+            raise serializers.ValidationError("Slot length must be between 5 and 240 minutes.")
+        return value
+
+    def validate_capacity(self, value):
+        """Validate slot capacity"""
+        if value < 1:
+            raise serializers.ValidationError("Capacity must be at least 1.")
+        return value
+
+    def validate(self, attrs):
+        """Validate window bounds"""
+        from django.utils import timezone
+        if attrs['ends_at'] <= attrs['starts_at']:
+            raise serializers.ValidationError({'ends_at': "End must be after start."})
+        if attrs['ends_at'] < timezone.now():
+            raise serializers.ValidationError({'ends_at': "Availability must end in the future."})
+        return attrs
+
+
 class UserStatisticsSerializer(serializers.Serializer):
     """Serializer for user statistics"""
     total_bookmarks = serializers.IntegerField()
     total_inspections = serializers.IntegerField()
     total_properties = serializers.IntegerField()
     bookmarked_properties = PropertyListSerializer(many=True)
-    upcoming_inspections = InspectionSerializer(many=True)
\ No newline at end of file
+    upcoming_inspections = InspectionSerializer(many=True)
+    has_more_bookmarks = serializers.BooleanField()
+    has_more_inspections = serializers.BooleanField()
\ No newline at end of file
@@ -0,0 +1,81 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .calendar import invalidate_owner_feed
+from django.core.cache import cache
+from .models import Bookmark, BookmarkTombstone, Inspection, Property, UserStatistics
+
+
+@receiver(post_delete, sender=Bookmark)
+def record_bookmark_tombstone(sender, instance, **kwargs):
+    """Leave a tombstone so delta-sync clients learn about the removal"""
+    BookmarkTombstone.objects.create(
+        user_id=instance.user_id,
+        property_id=instance.property_id
+    )
+
+    """Tombstones older than the sync window are never read again"""
+    cutoff = timezone.now() - timedelta(days=settings.BOOKMARK_SYNC_TOMBSTONE_DAYS)
+    BookmarkTombstone.objects.filter(
+        user_id=instance.user_id,
+        createdAt__lt=cutoff
+    ).delete()
+
+
+@receiver(post_save, sender=Inspection)
+@receiver(post_delete, sender=Inspection)
+def invalidate_calendar_for_inspection(sender, instance, **kwargs):
+    """Owner's iCalendar feed is rebuilt on the next poll after any booking change"""
+    try:
+        owner_id = instance.property.owner_id
+    except Property.DoesNotExist:
+        return
+    invalidate_owner_feed(owner_id)
+
+
+def _is_view_count_save(kwargs):
+    """Saves that only touch total_views, which no cache depends on"""
+    update_fields = kwargs.get('update_fields')
+    return bool(update_fields) and set(update_fields) <= {'total_views'}
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def invalidate_calendar_for_property(sender, instance, **kwargs):
+    """Property name and address appear in the feed"""
+    if _is_view_count_save(kwargs):
+        return
+    invalidate_owner_feed(instance.owner_id)
+
+
+@receiver(post_save, sender=Bookmark)
+def count_bookmark_created(sender, instance, created, **kwargs):
+    if created:
+        UserStatistics.adjust(instance.user_id, 'total_bookmarks', 1)
+
+
+@receiver(post_delete, sender=Bookmark)
+def count_bookmark_deleted(sender, instance, **kwargs):
+    UserStatistics.adjust(instance.user_id, 'total_bookmarks', -1)
+
+
+@receiver(post_save, sender=Inspection)
+def count_inspection_created(sender, instance, created, **kwargs):
+    if created:
+        UserStatistics.adjust(instance.user_id, 'total_inspections', 1)
+
+
+@receiver(post_delete, sender=Inspection)
+def count_inspection_deleted(sender, instance, **kwargs):
+    UserStatistics.adjust(instance.user_id, 'total_inspections', -1)
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def invalidate_active_property_count(sender, instance, **kwargs):
+    if _is_view_count_save(kwargs):
+        return
+    cache.delete(Property.ACTIVE_COUNT_CACHE_KEY)
+
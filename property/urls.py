@@ -7,8 +7,15 @@ urlpatterns = [
     path('property/<slug:slug>/', PropertyDetailAPIView.as_view(), name='property-detail'),
     path('property/qr-code/<slug:slug>/', PropertyQRCodeAPIView.as_view(), name='property-qr-code'),
     path('property/bookmarks/list/', BookmarkListCreateAPIView.as_view(), name='bookmark-list-create'),
+    path('property/bookmarks/sync/', BookmarkSyncAPIView.as_view(), name='bookmark-sync'),
     path('property/bookmarks/<uuid:pk>/', BookmarkDetailAPIView.as_view(), name='bookmark-detail'),
     path('property/inspections/list/', InspectionListCreateAPIView.as_view(), name='inspection-list-create'),
     path('property/inspections/<uuid:pk>/', InspectionDetailAPIView.as_view(), name='inspection-detail'),
+    path('property/<slug:slug>/availability/', InspectionAvailabilityListCreateAPIView.as_view(), name='inspection-availability'),
+    path('property/<slug:slug>/availability/slots/', InspectionFreeSlotsAPIView.as_view(), name='inspection-free-slots'),
+    path('property/availability/<uuid:pk>/', InspectionAvailabilityDetailAPIView.as_view(), name='inspection-availability-detail'),
+    path('property/calendar/feed/', OwnerCalendarFeedAPIView.as_view(), name='owner-calendar-feed'),
+    path('property/calendar/<str:token>.ics', OwnerCalendarICSView.as_view(), name='owner-calendar-ics'),
+    path('property/dashboard/owner/', OwnerDashboardAPIView.as_view(), name='owner-dashboard'),
     path('property/statistics/user/', UserStatisticsAPIView.as_view(), name='user-statistics'),
 ]
\ No newline at end of file
@@ -8,13 +8,27 @@ from rest_framework.views import APIView
 from .models import *
 from .serializers import *
 from utils.permissions import IsAdmin, IsAdminOrReadOnly, IsOwnerOrReadOnly
+from utils.replicas import replica_reads
 from django.db import transaction
 from drf_yasg.utils import swagger_auto_schema
 from django.shortcuts import get_object_or_404
 from rest_framework.permissions import SAFE_METHODS
 from django.utils import timezone
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from notifications.outbox import enqueue_email
+from notifications.rendering import render_email
+from .scheduling import SlotUnavailable, reserve_slot, free_slots
+from .calendar import get_owner_feed, owner_id_for_token, token_cache_key
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import http_date
+import secrets
+from decimal import Decimal
+from django.db.models import Count, DecimalField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from datetime import datetime, timedelta, timezone as dt_timezone
 
 
 """Start of views for property section"""
@@ -46,6 +60,7 @@ class PropertyListCreateAPIView(CustomResponseMixin, APIView):
     permission_classes = [IsAuthenticated]
     serializer_class = PropertyCreateUpdateSerializer
 
+    @replica_reads
     def get(self, request):
         try:
             user = request.user
@@ -197,6 +212,7 @@ class PropertyDetailAPIView(CustomResponseMixin, APIView):
         """Get property object by slug"""
         return get_object_or_404(Property, slug=slug)
     
+    @replica_reads
     def get(self, request, slug):
         """Retrieve property details and increment view count"""
         try:
@@ -209,18 +225,24 @@ class PropertyDetailAPIView(CustomResponseMixin, APIView):
             """Check permission"""
             self.check_object_permissions(request, property_obj)
             
-            """Increment view count (only for non-owners)"""
-            if request.user != property_obj.owner:
-                property_obj.increment_views()
-            
             serializer = PropertyDetailSerializer(
                 property_obj,
                 context={'request': request}
             )
+            data = serializer.data
+            
+            """
+            Increment view count (only for non-owners). Done after every
+            replica read, so a fallback re-run on the primary cannot count
+            the same view twice.
+            """
+            if request.user.id != property_obj.owner_id:
+                property_obj.increment_views()
+                data['total_views'] = property_obj.total_views
             
             return self.success_response(
                 message="Property retrieved successfully",
-                data=serializer.data,
+                data=data,
                 status_code=status.HTTP_200_OK
             )
         
@@ -408,6 +430,7 @@ class FeaturedPropertiesAPIView(CustomResponseMixin, APIView):
     
     permission_classes = [IsAuthenticatedOrReadOnly]
     
+    @replica_reads
     def get(self, request):
         """Get top 3 properties by views"""
         try:
@@ -543,6 +566,100 @@ class BookmarkDetailAPIView(CustomResponseMixin, APIView):
             )
 
 
+class BookmarkSyncAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Compact bookmark sync for the current user
+
+    Without a token the full set of bookmarked property IDs is returned.
+    With ?since=<sync_token> only the IDs added and removed since then are returned.
+    """
+    permission_classes = [IsAuthenticated]
+
+    """Tokens are issued slightly in the past so rows committed mid-request are not missed"""
+    SYNC_OVERLAP = timedelta(seconds=2)
+
+    @staticmethod
+    def encode_token(moment):
+        micros = int(moment.timestamp() * 1_000_000)
+        return format(micros, 'x')
+
+    @staticmethod
+    def decode_token(token):
+        micros = int(token, 16)
+        return datetime.fromtimestamp(micros / 1_000_000, tz=dt_timezone.utc)
+
+    def get(self, request):
+        try:
+            user = request.user
+            now = timezone.now()
+            sync_token = self.encode_token(now - self.SYNC_OVERLAP)
+
+            since = None
+            token = request.GET.get('since')
+            if token:
+                try:
+                    since = self.decode_token(token)
+                except (ValueError, OverflowError, OSError):
+                    return self.error_response(
+                        message="Invalid sync token",
+                        status_code=status.HTTP_400_BAD_REQUEST
+                    )
+
+            """Tokens older than the tombstone window require a full resync"""
+            window_start = now - timedelta(days=settings.BOOKMARK_SYNC_TOMBSTONE_DAYS)
+            if since is None or since < window_start:
+                ids = Bookmark.objects.filter(user=user).values_list('property_id', flat=True)
+                return self.success_response(
+                    message="Bookmarks synced successfully",
+                    data={
+                        'sync_token': sync_token,
+                        'full': True,
+                        'ids': [str(pk) for pk in ids],
+                    },
+                    status_code=status.HTTP_200_OK
+                )
+
+            added = set(
+                Bookmark.objects.filter(
+                    user=user,
+                    createdAt__gte=since
+                ).values_list('property_id', flat=True)
+            )
+            removed = set(
+                BookmarkTombstone.objects.filter(
+                    user=user,
+                    createdAt__gte=since
+                ).values_list('property_id', flat=True)
+            )
+
+            """A property removed and then re-bookmarked is still bookmarked"""
+            if removed:
+                removed -= set(
+                    Bookmark.objects.filter(
+                        user=user,
+                        property_id__in=removed
+                    ).values_list('property_id', flat=True)
+                )
+
+            return self.success_response(
+                message="Bookmarks synced successfully",
+                data={
+                    'sync_token': sync_token,
+                    'full': False,
+                    'added': [str(pk) for pk in added],
+                    'removed': [str(pk) for pk in removed],
+                },
+                status_code=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while syncing bookmarks",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class InspectionListCreateAPIView(CustomResponseMixin, APIView):
     """
     GET: List all inspections for authenticated user
@@ -583,16 +700,29 @@ class InspectionListCreateAPIView(CustomResponseMixin, APIView):
             )
 
         try:
-            property_obj = Property.objects.get(id=serializer.validated_data['property_id'])
-
-            inspection = Inspection.objects.create(
-                user=request.user,
-                property=property_obj,
-                inspection_datetime=serializer.validated_data['inspection_datetime']
+            property_obj = Property.objects.select_related('owner').get(
+                id=serializer.validated_data['property_id']
             )
+            notify_now = property_obj.owner.inspection_notification_frequency == 'immediate'
 
-            """Send notification to admin"""
-            self._send_admin_notification(inspection, request.user, property_obj)
+            with transaction.atomic():
+                """Capacity check locks the availability window until commit"""
+                inspection_datetime = reserve_slot(
+                    property_obj,
+                    serializer.validated_data['inspection_datetime']
+                )
+
+                inspection = Inspection.objects.create(
+                    user=request.user,
+                    property=property_obj,
+                    inspection_datetime=inspection_datetime,
+                    owner_notified_at=timezone.now() if notify_now else None
+                )
+
+                """Queue owner notification in the same transaction as the booking"""
+                """Owners on hourly/daily digests are notified by send_inspection_digests"""
+                if notify_now:
+                    self._send_admin_notification(inspection, request.user, property_obj)
 
             response_serializer = InspectionSerializer(inspection, context={'request': request})
 
@@ -607,6 +737,12 @@ class InspectionListCreateAPIView(CustomResponseMixin, APIView):
                 message="Property not found",
                 status_code=status.HTTP_404_NOT_FOUND
             )
+        except SlotUnavailable as e:
+            return self.error_response(
+                message="Inspection slot unavailable",
+                errors=str(e),
+                status_code=status.HTTP_409_CONFLICT
+            )
         except Exception as e:
             return self.error_response(
                 message="An error occurred while booking the inspection",
@@ -615,138 +751,30 @@ class InspectionListCreateAPIView(CustomResponseMixin, APIView):
             )
 
     def _send_admin_notification(self, inspection, user, property_obj):
-        """Send email notification to admin about new inspection booking"""
+        """Queue email notification to the property owner about new inspection booking"""
         owner = property_obj.owner
         subject = "New Property Inspection Request Received"
 
         user_name = f"{user.first_name} {user.last_name}".strip() or user.username
         user_email = user.email
 
-        property_title = getattr(property_obj, 'title', str(property_obj))
-        property_address = getattr(property_obj, 'address', 'N/A') 
-
-        inspection_time = inspection.inspection_datetime.strftime("%Y-%m-%d %H:%M")
-
-        text_message = f"""New Inspection Request
-
-Booked by: {user_name} ({user_email})
-Property: {property_title}
-Address: {property_address}
-Inspection Date & Time: {inspection_time}
-
-Please check the admin panel for details.
-"""
-
-        html_message = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
-  <title>New Inspection Request</title>
-</head>
-<body style="margin:0;padding:0;background-color:#0f0f0f;font-family:'Georgia',serif;">
-
-  <table width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color:#0f0f0f;padding:48px 16px;">
-    <tr><td align="center">
-      <table width="600" cellpadding="0" cellspacing="0" border="0" style="max-width:600px;width:100%;background-color:#1a1a1a;border-radius:2px;overflow:hidden;border:1px solid #2a2a2a;">
-
-        <tr><td style="background:linear-gradient(90deg,#c8a96e 0%,#e8c97e 50%,#c8a96e 100%);height:4px;font-size:0;line-height:0;"> </td></tr>
-
-        <tr>
-          <td style="padding:40px 48px 32px;border-bottom:1px solid #2a2a2a;">
-            <div style="display:inline-block;background:linear-gradient(135deg,#c8a96e,#e8c97e);width:42px;height:42px;border-radius:2px;text-align:center;line-height:42px;font-size:20px;font-weight:bold;color:#0f0f0f;font-family:'Georgia',serif;margin-bottom:20px;">I</div>
-            <p style="margin:0 0 6px;font-size:11px;letter-spacing:4px;color:#c8a96e;text-transform:uppercase;font-family:'Courier New',monospace;">New Booking</p>
-            <h1 style="margin:0;font-size:28px;font-weight:normal;color:#f5f0e8;letter-spacing:-0.5px;font-family:'Georgia',serif;line-height:1.2;">Inspection Request Received</h1>
-          </td>
-        </tr>
-
-        <tr>
-          <td style="padding:36px 48px;">
-            <p style="margin:0 0 32px;font-size:14px;color:#888;font-family:'Courier New',monospace;letter-spacing:1px;">
-              A user has requested a property inspection. Details below.
-            </p>
-
-            <table width="100%" cellpadding="0" cellspacing="0" border="0">
-
-              <tr>
-                <td style="padding:0 0 20px;">
-                  <table width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color:#222;border-left:3px solid #c8a96e;border-radius:0 2px 2px 0;">
-                    <tr><td style="padding:16px 20px;">
-                      <p style="margin:0 0 4px;font-size:10px;letter-spacing:3px;color:#c8a96e;text-transform:uppercase;font-family:'Courier New',monospace;">Booked By</p>
-                      <p style="margin:0;font-size:17px;color:#f5f0e8;font-family:'Georgia',serif;">{user_name}</p>
-                      <p style="margin:6px 0 0;font-size:14px;color:#c8a96e;"><a href="mailto:{user_email}" style="color:#c8a96e;text-decoration:none;">{user_email}</a></p>
-                    </td></tr>
-                  </table>
-                </td>
-              </tr>
-
-              <tr>
-                <td style="padding:0 0 20px;">
-                  <table width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color:#222;border-left:3px solid #c8a96e;border-radius:0 2px 2px 0;">
-                    <tr><td style="padding:16px 20px;">
-                      <p style="margin:0 0 4px;font-size:10px;letter-spacing:3px;color:#c8a96e;text-transform:uppercase;font-family:'Courier New',monospace;">Property</p>
-                      <p style="margin:0;font-size:17px;color:#f5f0e8;font-family:'Georgia',serif;">{property_title}</p>
-                      <p style="margin:6px 0 0;font-size:14px;color:#ccc;">{property_address}</p>
-                    </td></tr>
-                  </table>
-                </td>
-              </tr>
-
-              <tr>
-                <td style="padding:0 0 0;">
-                  <table width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color:#1e1e1e;border:1px solid #2e2e2e;border-radius:2px;">
-                    <tr><td style="padding:20px;">
-                      <p style="margin:0 0 10px;font-size:10px;letter-spacing:3px;color:#888;text-transform:uppercase;font-family:'Courier New',monospace;">Inspection Time</p>
-                      <p style="margin:0;font-size:18px;color:#f5f0e8;font-family:'Georgia',serif;">{inspection_time}</p>
-                    </td></tr>
-                  </table>
-                </td>
-              </tr>
-
-            </table>
-
-            <table width="100%" cellpadding="0" cellspacing="0" border="0" style="margin-top:36px;">
-              <tr>
-                <td>
-                  <a href="mailto:{user_email}" style="display:inline-block;background:linear-gradient(135deg,#c8a96e,#e8c97e);color:#0f0f0f;text-decoration:none;padding:14px 32px;border-radius:2px;font-size:11px;letter-spacing:3px;text-transform:uppercase;font-family:'Courier New',monospace;font-weight:bold;">
-                    Reply to User
-                  </a>
-                </td>
-              </tr>
-            </table>
-
-          </td>
-        </tr>
-
-        <tr>
-          <td style="padding:24px 48px;border-top:1px solid #2a2a2a;background-color:#141414;">
-            <p style="margin:0;font-size:11px;color:#444;font-family:'Courier New',monospace;letter-spacing:1px;">
-              This is an automated notification. Do not reply directly to this email.<br/>
-              © 2026 Michael Milne — Inspection Notifications
-            </p>
-          </td>
-        </tr>
-
-        <tr><td style="background:linear-gradient(90deg,#c8a96e 0%,#e8c97e 50%,#c8a96e 100%);height:2px;font-size:0;line-height:0;"> </td></tr>
-
-      </table>
-    </td></tr>
-  </table>
-
-</body>
-</html>"""
-
-        email_msg = EmailMultiAlternatives(
+        text_message, html_message = render_email('inspection_request', {
+            'user_name': user_name,
+            'user_email': user_email,
+            'property_title': property_obj.propertyName,
+            'property_address': property_obj.propertyAddress or 'N/A',
+            'inspection_time': inspection.inspection_datetime,
+        })
+
+        enqueue_email(
             subject=subject,
             body=text_message,
+            html_body=html_message,
             from_email=settings.EMAIL_HOST_USER,
             to=[owner.email],
             reply_to=[user_email],
         )
 
-        email_msg.attach_alternative(html_message, "text/html")
-        email_msg.send(fail_silently=False)
-
 class InspectionDetailAPIView(CustomResponseMixin, APIView):
     """
     GET: Retrieve inspection details
@@ -801,8 +829,13 @@ class InspectionDetailAPIView(CustomResponseMixin, APIView):
                 )
             
             if 'inspection_datetime' in serializer.validated_data:
-                inspection.inspection_datetime = serializer.validated_data['inspection_datetime']
-                inspection.save()
+                with transaction.atomic():
+                    inspection.inspection_datetime = reserve_slot(
+                        inspection.property,
+                        serializer.validated_data['inspection_datetime'],
+                        exclude_inspection_id=inspection.id
+                    )
+                    inspection.save()
             
             response_serializer = InspectionSerializer(inspection, context={'request': request})
             
@@ -812,6 +845,12 @@ class InspectionDetailAPIView(CustomResponseMixin, APIView):
                 status_code=status.HTTP_200_OK
             )
         
+        except SlotUnavailable as e:
+            return self.error_response(
+                message="Inspection slot unavailable",
+                errors=str(e),
+                status_code=status.HTTP_409_CONFLICT
+            )
         except Exception as e:
             return self.error_response(
                 message="An error occurred while updating the inspection",
@@ -845,41 +884,394 @@ class InspectionDetailAPIView(CustomResponseMixin, APIView):
             )
 
 
+class InspectionAvailabilityListCreateAPIView(CustomResponseMixin, APIView):
+    """
+    GET: List upcoming availability windows for a property
+    POST: Publish an availability window (property owner only)
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, slug):
+        try:
+            property_obj = get_object_or_404(Property, slug=slug)
+            windows = InspectionAvailability.objects.filter(
+                property=property_obj,
+                ends_at__gt=timezone.now()
+            )
+
+            serializer = InspectionAvailabilitySerializer(windows, many=True)
+
+            return self.success_response(
+                message="Availability retrieved successfully",
+                data=serializer.data,
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while retrieving availability",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def post(self, request, slug):
+        property_obj = get_object_or_404(Property, slug=slug)
+
+        if property_obj.owner_id != request.user.id:
+            return self.error_response(
+                message="Only the property owner can publish availability",
+                status_code=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = InspectionAvailabilitySerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return self.error_response(
+                message="Validation failed",
+                errors=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            window = serializer.save(property=property_obj)
+
+            return self.success_response(
+                message="Availability published successfully",
+                data=InspectionAvailabilitySerializer(window).data,
+                status_code=status.HTTP_201_CREATED
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while publishing availability",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class InspectionAvailabilityDetailAPIView(CustomResponseMixin, APIView):
+    """
+    DELETE: Remove an availability window (property owner only)
+    """
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request, pk):
+        try:
+            window = get_object_or_404(
+                InspectionAvailability,
+                id=pk,
+                property__owner=request.user
+            )
+            window.delete()
+
+            return self.success_response(
+                message="Availability removed successfully",
+                data=None,
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while removing availability",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class InspectionFreeSlotsAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Free inspection slots for a property between ?start and ?end (ISO dates or datetimes)
+    """
+    permission_classes = [IsAuthenticated]
+
+    MAX_RANGE = timedelta(days=31)
+
+    def get(self, request, slug):
+        try:
+            property_obj = get_object_or_404(Property, slug=slug)
+
+            start = self._parse(request.GET.get('start')) or timezone.now()
+            end = self._parse(request.GET.get('end')) or start + timedelta(days=7)
+            start = max(start, timezone.now())
+
+            if end <= start or end - start > self.MAX_RANGE:
+                return self.error_response(
+                    message="Invalid date range",
+                    errors="end must be after start and within 31 days",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+
+            return self.success_response(
+                message="Free slots retrieved successfully",
+                data=free_slots(property_obj, start, end),
+                status_code=status.HTTP_200_OK
+            )
+        except ValueError as e:
+            return self.error_response(
+                message="Invalid date range",
+                errors=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while retrieving free slots",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @staticmethod
+    def _parse(value):
+        if not value:
+            return None
+        parsed = datetime.fromisoformat(value)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+
+class OwnerCalendarFeedAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Get the current owner's iCalendar feed URL (created on first use)
+    POST: Rotate the feed token, revoking the old URL
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            feed, _ = OwnerCalendarFeed.objects.get_or_create(
+                owner=request.user,
+                defaults={'token': secrets.token_urlsafe(32)}
+            )
+            return self.success_response(
+                message="Calendar feed retrieved successfully",
+                data=self._feed_data(request, feed),
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while retrieving the calendar feed",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def post(self, request):
+        try:
+            feed, created = OwnerCalendarFeed.objects.get_or_create(
+                owner=request.user,
+                defaults={'token': secrets.token_urlsafe(32)}
+            )
+            if not created:
+                cache.delete(token_cache_key(feed.token))
+                feed.token = secrets.token_urlsafe(32)
+                feed.save()
+
+            return self.success_response(
+                message="Calendar feed rotated successfully",
+                data=self._feed_data(request, feed),
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while rotating the calendar feed",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _feed_data(self, request, feed):
+        return {
+            'feed_url': request.build_absolute_uri(f'/api/v1/property/calendar/{feed.token}.ics'),
+        }
+
+
+class OwnerCalendarICSView(APIView):
+    """
+    GET: Public iCalendar feed of an owner's upcoming inspection bookings.
+
+    Served from cache with ETag/Last-Modified; rebuilt only after a booking change.
+    """
+    permission_classes = []
+    authentication_classes = []
+
+    def get(self, request, token):
+        owner_id = owner_id_for_token(token)
+        if owner_id is None:
+            return HttpResponse(status=404)
+
+        feed = get_owner_feed(owner_id)
+
+        if request.META.get('HTTP_IF_NONE_MATCH') == feed['etag']:
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(feed['body'], content_type='text/calendar; charset=utf-8')
+
+        response['ETag'] = feed['etag']
+        response['Last-Modified'] = http_date(feed['last_modified'].timestamp())
+        response['Cache-Control'] = 'private, max-age=60'
+        return response
+
+
+class OwnerDashboardAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Per-property performance for the current owner's listings (paginated)
+
+    Views, bookmarks, upcoming inspections, successful unlocks and unlock revenue
+    are computed in a single query and cached for OWNER_DASHBOARD_CACHE_SECONDS.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @staticmethod
+    def _per_property(queryset, aggregate, default=0, output_field=None):
+        """Correlated per-property aggregate, so joining several relations does not multiply rows"""
+        subquery = Subquery(
+            queryset.filter(property=OuterRef('pk'))
+            .order_by()
+            .values('property')
+            .annotate(value=aggregate)
+            .values('value')[:1]
+        )
+        return Coalesce(subquery, Value(default), output_field=output_field)
+
+    def get(self, request):
+        try:
+            paginator = PageNumberPagination()
+            cache_key = (
+                f"owner_dashboard_{request.user.id}_"
+                f"{request.GET.get(paginator.page_query_param, 1)}"
+            )
+            data = cache.get(cache_key)
+
+            if data is None:
+                from payments.models import PropertyUnlock
+
+                now = timezone.now()
+                succeeded = Q(payment_status='succeeded')
+                properties = Property.objects.filter(
+                    owner=request.user
+                ).annotate(
+                    bookmark_count=self._per_property(Bookmark.objects, Count('id')),
+                    upcoming_inspection_count=self._per_property(
+                        Inspection.objects,
+                        Count('id', filter=Q(inspection_datetime__gte=now))
+                    ),
+                    unlock_count=self._per_property(
+                        PropertyUnlock.objects,
+                        Count('id', filter=succeeded)
+                    ),
+                    unlock_revenue=self._per_property(
+                        PropertyUnlock.objects,
+                        Sum('amount_paid', filter=succeeded),
+                        default=Decimal('0.00'),
+                        output_field=DecimalField(max_digits=12, decimal_places=2)
+                    ),
+                ).values(
+                    'id',
+                    'slug',
+                    'propertyName',
+                    'status',
+                    'total_views',
+                    'bookmark_count',
+                    'upcoming_inspection_count',
+                    'unlock_count',
+                    'unlock_revenue',
+                ).order_by('-createdAt')
+
+                page = paginator.paginate_queryset(properties, request, view=self)
+                for row in page:
+                    row['unlock_revenue'] = float(row['unlock_revenue'])
+
+                data = {
+                    'count': paginator.page.paginator.count,
+                    'next': paginator.get_next_link(),
+                    'previous': paginator.get_previous_link(),
+                    'results': page,
+                }
+                cache.set(cache_key, data, timeout=settings.OWNER_DASHBOARD_CACHE_SECONDS)
+
+            return self.success_response(
+                message="Owner dashboard retrieved successfully",
+                data=data,
+                status_code=status.HTTP_200_OK
+            )
+
+        except NotFound as e:
+            return self.error_response(
+                message="Invalid page",
+                errors=str(e),
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while retrieving the owner dashboard",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class UserStatisticsAPIView(CustomResponseMixin, APIView):
     """
     GET: Retrieve user statistics (bookmarks, inspections, total properties)
+
+    Counts come from the user's UserStatistics row and the cached active listing count.
+    The nested lists are paginated with ?limit= (default 5, max 20) and ?offset=.
     """
     permission_classes = [IsAuthenticated]
+
+    DEFAULT_LIMIT = 5
+    MAX_LIMIT = 20
     
     def get(self, request):
         """Get comprehensive statistics for current user"""
         try:
             user = request.user
+
+            try:
+                limit = max(1, min(int(request.GET.get('limit', self.DEFAULT_LIMIT)), self.MAX_LIMIT))
+                offset = max(int(request.GET.get('offset', 0)), 0)
+            except ValueError:
+                return self.error_response(
+                    message="limit and offset must be integers",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+
+            stats = UserStatistics.for_user(user)
             
-            # Get bookmarked properties
-            bookmarked_properties = Property.objects.filter(
-                bookmarks__user=user
-            ).select_related('owner')
+            # Get bookmarked properties (one extra row tells us if there are more)
+            bookmarked_properties = list(
+                Property.objects.filter(
+                    bookmarks__user=user
+                ).select_related('owner').prefetch_related(
+                    'inspection_reports', 'optional_reports'
+                ).order_by('-bookmarks__createdAt')[offset:offset + limit + 1]
+            )
             
             # Get upcoming inspections
-            upcoming_inspections = Inspection.objects.filter(
-                user=user,
-                inspection_datetime__gte=timezone.now()
-            ).select_related('property', 'property__owner').order_by('inspection_datetime')
-            
-            # Get total properties in the site
-            total_properties = Property.objects.filter(status=True).count()
+            upcoming_inspections = list(
+                Inspection.objects.filter(
+                    user=user,
+                    inspection_datetime__gte=timezone.now()
+                ).select_related('property', 'property__owner').prefetch_related(
+                    'property__inspection_reports', 'property__optional_reports'
+                ).order_by('inspection_datetime')[offset:offset + limit + 1]
+            )
+
+            has_more_bookmarks = len(bookmarked_properties) > limit
+            has_more_inspections = len(upcoming_inspections) > limit
+            bookmarked_properties = bookmarked_properties[:limit]
+            upcoming_inspections = upcoming_inspections[:limit]
             
             # Prepare statistics data
             statistics_data = {
-                'total_bookmarks': Bookmark.objects.filter(user=user).count(),
-                'total_inspections': Inspection.objects.filter(user=user).count(),
-                'total_properties': total_properties,
+                'total_bookmarks': stats.total_bookmarks,
+                'total_inspections': stats.total_inspections,
+                'total_properties': Property.active_count(),
                 'bookmarked_properties': bookmarked_properties,
                 'upcoming_inspections': upcoming_inspections,
+                'has_more_bookmarks': has_more_bookmarks,
+                'has_more_inspections': has_more_inspections,
             }
-            
-            serializer = UserStatisticsSerializer(statistics_data, context={'request': request})
+
+            context = property_list_context(
+                request,
+                bookmarked_properties + [inspection.property for inspection in upcoming_inspections]
+            )
+            serializer = UserStatisticsSerializer(statistics_data, context=context)
             
             return self.success_response(
                 message="User statistics retrieved successfully",
@@ -892,4 +1284,4 @@ class UserStatisticsAPIView(CustomResponseMixin, APIView):
                 message="An error occurred while retrieving user statistics",
                 errors=str(e),
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+"""
+JWT authentication backed by a cached user snapshot.
+
+The fields permissions and most views read are cached per user, so an
+authenticated request needs no Users query. Any other attribute is a
+deferred field: the first access loads all of them in one query.
+"""
+SNAPSHOT_FIELDS = ['id', 'email', 'username', 'full_name', 'role', 'is_active', 'is_staff', 'is_superuser']
+
+
+def user_snapshot_key(user_id):
+    return f'user_snapshot:{user_id}'
+
+
+def invalidate_user_snapshot(user_id):
+    """Drop the cached snapshot once the surrounding transaction commits"""
+    key = user_snapshot_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        """Same checks as JWTAuthentication.get_user, from the cached snapshot"""
+        if api_settings.CHECK_REVOKE_TOKEN:
+            """Revocation compares the password hash, which is not cached"""
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        key = user_snapshot_key(user_id)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = self.user_model.objects.filter(
+                **{api_settings.USER_ID_FIELD: user_id}
+            ).values(*SNAPSHOT_FIELDS).first()
+            if snapshot is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, snapshot, timeout=settings.USER_SNAPSHOT_CACHE_SECONDS)
+
+        """from_db expects values in model field order; the rest stay deferred"""
+        field_names = [
+            field.attname for field in self.user_model._meta.concrete_fields
+            if field.attname in snapshot
+        ]
+        user = self.user_model.from_db(
+            DEFAULT_DB_ALIAS, field_names, [snapshot[name] for name in field_names]
+        )
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
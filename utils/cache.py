@@ -0,0 +1,100 @@
+import time
+from contextvars import ContextVar
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.redis import RedisCache
+from . import metrics
+
+"""
+Cache backends that report hit/miss counts and operation latency.
+
+Each class is the stock Django backend plus timing; select one in
+settings.CACHES. Stats land in utils.metrics under cache_requests,
+cache_operation_ms and cache_errors, labelled with the backend name.
+"""
+_MISSING = object()
+
+"""Backends implement some operations on top of others (get -> get_many, incr -> get + set); only the outermost call is recorded"""
+_active = ContextVar('cache_operation_active', default=False)
+
+
+class InstrumentedCacheMixin:
+    backend_name = None
+
+    def _timed(self, operation, func, *args, **kwargs):
+        if _active.get():
+            return func(*args, **kwargs)
+
+        token = _active.set(True)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            metrics.increment('cache_errors', backend=self.backend_name, operation=operation)
+            raise
+        finally:
+            _active.reset(token)
+            metrics.observe(
+                'cache_operation_ms',
+                (time.perf_counter() - started) * 1000,
+                backend=self.backend_name,
+                operation=operation
+            )
+
+    def _record_lookups(self, hits, misses):
+        if _active.get():
+            return
+        if hits:
+            metrics.increment('cache_requests', hits, backend=self.backend_name, result='hit')
+        if misses:
+            metrics.increment('cache_requests', misses, backend=self.backend_name, result='miss')
+
+    def get(self, key, default=None, version=None):
+        value = self._timed('get', super().get, key, _MISSING, version=version)
+        if value is _MISSING:
+            self._record_lookups(0, 1)
+            return default
+        self._record_lookups(1, 0)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = self._timed('get_many', super().get_many, keys, version=version)
+        self._record_lookups(len(found), len(keys) - len(found))
+        return found
+
+    def set(self, *args, **kwargs):
+        return self._timed('set', super().set, *args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        return self._timed('add', super().add, *args, **kwargs)
+
+    def set_many(self, *args, **kwargs):
+        return self._timed('set_many', super().set_many, *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._timed('delete', super().delete, *args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        return self._timed('delete_many', super().delete_many, *args, **kwargs)
+
+    def incr(self, *args, **kwargs):
+        return self._timed('incr', super().incr, *args, **kwargs)
+
+    def touch(self, *args, **kwargs):
+        return self._timed('touch', super().touch, *args, **kwargs)
+
+
+class InstrumentedDatabaseCache(InstrumentedCacheMixin, DatabaseCache):
+    """Shared by every worker on the default database; needs no extra service"""
+    backend_name = 'database'
+
+
+class InstrumentedFileBasedCache(InstrumentedCacheMixin, FileBasedCache):
+    """Shared by workers on one host only"""
+    backend_name = 'file'
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    """Redis or a compatible server; requires the redis package"""
+    backend_name = 'redis'
@@ -0,0 +1,27 @@
+import sqlite3
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = "Copy the SQLite primary into each SQLite replica file (local replica testing)"
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if not primary['ENGINE'].endswith('sqlite3'):
+            raise CommandError("sync_replicas only copies SQLite databases; use real replication elsewhere")
+        if not settings.DATABASE_REPLICA_WEIGHTS:
+            raise CommandError("No replicas configured; set DATABASE_REPLICAS")
+
+        source = sqlite3.connect(primary['NAME'])
+        try:
+            for alias in settings.DATABASE_REPLICA_WEIGHTS:
+                target = sqlite3.connect(settings.DATABASES[alias]['NAME'])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(f"Copied primary to {alias} ({settings.DATABASES[alias]['NAME']})")
+        finally:
+            source.close()
@@ -58,5 +58,5 @@ class IsOwnerOrReadOnly(BasePermission):
         """Property owner can modify ONLY their own property"""
         return (
             request.user.role == 'owner' and
-            obj.owner == request.user
+            obj.owner_id == request.user.id
         )
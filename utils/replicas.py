@@ -0,0 +1,164 @@
+import functools
+import random
+import time
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from rest_framework.permissions import SAFE_METHODS
+from . import metrics
+
+"""
+Read replicas for listing traffic.
+
+Reads go to a replica only inside views decorated with @replica_reads, and
+only for models in REPLICA_READ_APPS; everything else, including every
+write and anything inside a transaction, uses the primary. A replica is
+chosen once per request by weight (DATABASE_REPLICA_WEIGHTS). Users who
+wrote something in the last REPLICA_STICKY_SECONDS read from the primary
+so they see their own changes. A replica that fails to connect or errors
+mid-request is skipped for REPLICA_RETRY_SECONDS and the view is re-run
+on the primary.
+"""
+_read_alias = ContextVar('replica_read_alias', default=None)
+
+"""Per-process: alias -> monotonic time the replica may be tried again"""
+_unhealthy_until = {}
+
+
+def sticky_key(user_id):
+    return f'db_sticky:{user_id}'
+
+
+def mark_recent_write(user_id):
+    cache.set(sticky_key(user_id), True, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def _mark_unhealthy(alias):
+    _unhealthy_until[alias] = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+
+
+def choose_read_database(user=None):
+    """Weighted pick among healthy replicas; the primary when none applies"""
+    weights = settings.DATABASE_REPLICA_WEIGHTS
+    if not weights:
+        return DEFAULT_DB_ALIAS
+
+    if user is not None and user.is_authenticated and cache.get(sticky_key(user.id)):
+        metrics.increment('db_replica_reads', database=DEFAULT_DB_ALIAS, reason='sticky')
+        return DEFAULT_DB_ALIAS
+
+    now = time.monotonic()
+    candidates = {
+        alias: weight for alias, weight in weights.items()
+        if weight > 0 and _unhealthy_until.get(alias, 0) <= now
+    }
+    while candidates:
+        alias = random.choices(list(candidates), weights=list(candidates.values()))[0]
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError:
+            _mark_unhealthy(alias)
+            metrics.increment('db_replica_fallbacks', database=alias, reason='connect')
+            del candidates[alias]
+            continue
+        metrics.increment('db_replica_reads', database=alias, reason='weighted')
+        return alias
+
+    metrics.increment('db_replica_reads', database=DEFAULT_DB_ALIAS, reason='no_healthy_replica')
+    return DEFAULT_DB_ALIAS
+
+
+class _ReplicaQueryWatcher:
+    """connection.execute_wrapper that remembers whether a replica query failed"""
+
+    def __init__(self):
+        self.failed = False
+
+    def __call__(self, execute, sql, params, many, context):
+        try:
+            return execute(sql, params, many, context)
+        except DatabaseError:
+            self.failed = True
+            raise
+
+
+def replica_reads(view_method):
+    """
+    Serve a read-only APIView handler from a replica.
+
+    The views catch their own exceptions, so replica errors are detected
+    with an execute wrapper and the handler is run again on the primary.
+    """
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        alias = choose_read_database(request.user)
+        if alias == DEFAULT_DB_ALIAS:
+            return view_method(self, request, *args, **kwargs)
+
+        watcher = _ReplicaQueryWatcher()
+        token = _read_alias.set(alias)
+        try:
+            with connections[alias].execute_wrapper(watcher):
+                response = view_method(self, request, *args, **kwargs)
+        except DatabaseError:
+            if not watcher.failed:
+                raise
+        finally:
+            _read_alias.reset(token)
+
+        if not watcher.failed:
+            return response
+
+        _mark_unhealthy(alias)
+        metrics.increment('db_replica_fallbacks', database=alias, reason='query')
+        return view_method(self, request, *args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS entry; inert unless a @replica_reads view is running"""
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+        if alias is None:
+            return None
+        if model._meta.app_label not in settings.REPLICA_READ_APPS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            """Reads inside a transaction must see its own writes"""
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        """Objects read from a replica are saved to the primary"""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICA_WEIGHTS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Replicas get their schema from the primary"""
+        if db in settings.DATABASE_REPLICA_WEIGHTS:
+            return False
+        return None
+
+
+class ReplicaStickinessMiddleware:
+    """Send a user's reads to the primary for a while after any successful write request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400 and settings.DATABASE_REPLICA_WEIGHTS:
+            """DRF copies the token-authenticated user onto the Django request"""
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                mark_recent_write(user.id)
+        return response
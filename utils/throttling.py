@@ -0,0 +1,130 @@
+import hashlib
+import math
+import re
+import time
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+from . import metrics
+
+"""
+Sliding-window throttles backed by the shared cache.
+
+Each identity keeps one counter per fixed window; the current rate is the
+current window's count plus the previous window's count weighted by how
+much of it still overlaps the sliding window. That is two cache keys per
+identity however hard it is hit, and checking costs one get_many.
+
+The first hit of a window is an atomic cache.add. Later hits use
+cache.incr, which is atomic on Redis but a get followed by a set on the
+database and file backends, so concurrent bursts there can undercount a
+window by up to the number of racing workers. Use CACHE_BACKEND=redis
+where exact limits matter.
+
+Rates come from REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] as
+"<requests>/<period>", where period is s, m, h or d with an optional
+multiplier, e.g. "10/15m".
+"""
+PERIOD_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+RATE_PATTERN = re.compile(r'^(\d+)/(\d*)([smhd])$')
+
+
+def parse_rate(rate):
+    match = RATE_PATTERN.match(rate.replace(' ', ''))
+    if match is None:
+        raise ValueError(f"Invalid throttle rate {rate!r}")
+    requests, multiplier, unit = match.groups()
+    return int(requests), int(multiplier or 1) * PERIOD_SECONDS[unit]
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    scope = None
+
+    def __init__(self):
+        self.num_requests, self.window = parse_rate(api_settings.DEFAULT_THROTTLE_RATES[self.scope])
+        self._wait = None
+
+    def get_ident_key(self, request):
+        """Identity to limit, or None to skip this throttle for the request"""
+        raise NotImplementedError('.get_ident_key() must be overridden')
+
+    def allow_request(self, request, view):
+        ident = self.get_ident_key(request)
+        if ident is None:
+            return True
+
+        now = time.time()
+        current = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+        current_key = f'throttle:{self.scope}:{ident}:{current}'
+        previous_key = f'throttle:{self.scope}:{ident}:{current - 1}'
+
+        try:
+            counts = cache.get_many([previous_key, current_key])
+            previous_count = counts.get(previous_key, 0)
+            current_count = counts.get(current_key, 0)
+
+            if previous_count * (1 - elapsed) + current_count >= self.num_requests:
+                self._wait = self._wait_seconds(previous_count, current_count, elapsed)
+                metrics.increment('throttle_requests', scope=self.scope, result='rejected')
+                return False
+
+            if not cache.add(current_key, 1, timeout=self.window * 2):
+                try:
+                    cache.incr(current_key)
+                except ValueError:
+                    """Expired between add and incr"""
+                    cache.set(current_key, 1, timeout=self.window * 2)
+        except Exception:
+            """Fail open: a cache outage must not lock everyone out"""
+            metrics.increment('throttle_requests', scope=self.scope, result='error')
+            return True
+
+        metrics.increment('throttle_requests', scope=self.scope, result='allowed')
+        return True
+
+    def _wait_seconds(self, previous_count, current_count, elapsed):
+        """Seconds until the weighted count drops below the limit"""
+        if current_count >= self.num_requests:
+            """After the rollover this window's count is the one being weighted down"""
+            needed = 2 - self.num_requests / current_count
+        else:
+            needed = 1 - (self.num_requests - current_count) / previous_count
+        return max(1, math.ceil((needed - elapsed) * self.window))
+
+    def wait(self):
+        return self._wait
+
+
+class IPRateThrottle(SlidingWindowThrottle):
+    """Limits each client address; REST_FRAMEWORK['NUM_PROXIES'] must match the proxies in front"""
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class EmailRateThrottle(SlidingWindowThrottle):
+    """Limits each target email in the request body, whoever sends it"""
+
+    def get_ident_key(self, request):
+        try:
+            email = request.data.get('email')
+        except Exception:
+            return None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
+
+
+def scoped_throttles(scope):
+    """
+    Per-IP and per-email throttles for @throttle_classes.
+
+    Uses the "<scope>_ip" and "<scope>_email" rates. DRF checks throttles
+    before the view runs, so rejected requests never reach password
+    hashing or email sending.
+    """
+    return [
+        type(f'{scope.title()}IPRateThrottle', (IPRateThrottle,), {'scope': f'{scope}_ip'}),
+        type(f'{scope.title()}EmailRateThrottle', (EmailRateThrottle,), {'scope': f'{scope}_email'}),
+    ]
@@ -1,3 +1,26 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.views import APIView
+from property.views import CustomResponseMixin
+from .metrics import snapshot
+from .permissions import IsAdmin
 
-# Create your views here.
+
+class MetricsAPIView(CustomResponseMixin, APIView):
+    """
+    GET: Counters, gauges and latency histograms of the serving worker (Admin only)
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        try:
+            return self.success_response(
+                message="Metrics retrieved successfully",
+                data=snapshot(),
+                status_code=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return self.error_response(
+                message="An error occurred while retrieving metrics",
+                errors=str(e),
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,78 @@
+import random
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+"""
+Claim, retry and give-up logic for database-backed job queues.
+
+Used by the email outbox, the Stripe webhook inbox and the avatar
+ingestion worker. Each queue model has status, attempts, next_attempt_at,
+claimed_at and last_error fields and moves from 'pending' to a claimed
+status, then to a final status or 'failed'. Timings come from
+<PREFIX>_CLAIM_TIMEOUT_SECONDS, <PREFIX>_BACKOFF_BASE_SECONDS,
+<PREFIX>_BACKOFF_MAX_SECONDS and <PREFIX>_MAX_ATTEMPTS, read on every call.
+"""
+
+
+class WorkQueue:
+    def __init__(self, model, claimed_status, settings_prefix, ordering=('next_attempt_at',), select_related=()):
+        self.model = model
+        self.claimed_status = claimed_status
+        self.settings_prefix = settings_prefix
+        self.ordering = ordering
+        self.select_related = select_related
+
+    def setting(self, name):
+        return getattr(settings, f'{self.settings_prefix}_{name}')
+
+    def backoff_delay(self, attempts):
+        """Exponential backoff with jitter, capped at <PREFIX>_BACKOFF_MAX_SECONDS"""
+        ceiling = min(
+            self.setting('BACKOFF_MAX_SECONDS'),
+            self.setting('BACKOFF_BASE_SECONDS') * (2 ** (attempts - 1))
+        )
+        return timedelta(seconds=random.uniform(ceiling / 2, ceiling))
+
+    def claim_batch(self, batch_size):
+        """Atomically move a batch of due jobs from pending to the claimed status"""
+        now = timezone.now()
+
+        """Release jobs claimed by a worker that died mid-batch"""
+        self.model.objects.filter(
+            status=self.claimed_status,
+            claimed_at__lt=now - timedelta(seconds=self.setting('CLAIM_TIMEOUT_SECONDS'))
+        ).update(status='pending', claimed_at=None)
+
+        with transaction.atomic():
+            ids = list(
+                self.model.objects.select_for_update(skip_locked=True).filter(
+                    status='pending',
+                    next_attempt_at__lte=now
+                ).order_by(*self.ordering).values_list('id', flat=True)[:batch_size]
+            )
+            self.model.objects.filter(id__in=ids).update(status=self.claimed_status, claimed_at=now)
+
+        jobs = self.model.objects.filter(id__in=ids).order_by(*self.ordering)
+        if self.select_related:
+            jobs = jobs.select_related(*self.select_related)
+        return list(jobs)
+
+    def record_failure(self, job, error, permanent=False):
+        """Reschedule with backoff, or give up when `permanent` or after <PREFIX>_MAX_ATTEMPTS"""
+        attempts = job.attempts + 1
+        if permanent or attempts >= self.setting('MAX_ATTEMPTS'):
+            status = 'failed'
+            next_attempt_at = job.next_attempt_at
+        else:
+            status = 'pending'
+            next_attempt_at = timezone.now() + self.backoff_delay(attempts)
+
+        self.model.objects.filter(id=job.id).update(
+            status=status,
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            claimed_at=None,
+            last_error=f"{type(error).__name__}: {error}",
+        )